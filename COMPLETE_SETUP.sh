@@ -63,7 +63,7 @@ echo "✓ Created data/ifct directory"
 # Run extraction
 echo ""
 echo "Extracting IFCT data from PDF..."
-python scripts/extract-ifct-data.py
+python scripts/extract-ifct.py IFCT2017.pdf tables
 
 if [ ! -f "data/ifct/ifct_foods.csv" ]; then
     echo "✗ ERROR: Extraction failed. CSV file not created."
@@ -225,7 +225,7 @@ echo ""
 echo "Checking created files:"
 
 files=(
-  "scripts/extract-ifct-data.py"
+  "scripts/extract-ifct.py"
   "scripts/import-ifct-data.py"
   "scripts/test-indian-foods.py"
   "data/ifct/ifct_foods.json"
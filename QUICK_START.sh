@@ -9,7 +9,7 @@ pip install pdfplumber pandas
 
 echo "Extracting IFCT 2017 data from PDF..."
 cd /Users/apple/Developer/app/fitwell
-python scripts/extract-ifct-data.py
+python scripts/extract-ifct.py IFCT2017.pdf tables
 
 # Expected output:
 # - data/ifct/ifct_foods.json  (300+ foods in JSON)
@@ -103,7 +103,7 @@ curl -s "https://your-project.supabase.co/rest/v1/foods_indian?select=count()" \
 # ============================================================================
 
 # Python Scripts:
-# - scripts/extract-ifct-data.py           (Extract PDF → JSON/CSV)
+# - scripts/extract-ifct.py                (Extract PDF → JSON/CSV)
 # - scripts/import-ifct-data.py            (CSV → Supabase)
 # - scripts/test-indian-foods.py           (Verify setup)
 
@@ -129,7 +129,7 @@ curl -s "https://your-project.supabase.co/rest/v1/foods_indian?select=count()" \
 
 # PDF Extraction not working:
 pip install pdfplumber pandas --upgrade
-python scripts/extract-ifct-data.py -v
+python scripts/extract-ifct.py IFCT2017.pdf tables
 
 # Supabase connection failed:
 export SUPABASE_URL="https://your-project.supabase.co"
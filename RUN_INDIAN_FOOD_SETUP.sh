@@ -17,7 +17,7 @@ echo ""
 # Step 2: Extract PDF
 echo "📄 Step 2: Extracting IFCT 2017 data..."
 cd /Users/apple/Developer/app/fitwell
-python scripts/extract-ifct-data.py
+python scripts/extract-ifct.py IFCT2017.pdf tables
 echo "✅ Data extracted to data/ifct/ifct_foods.json and .csv"
 echo ""
 
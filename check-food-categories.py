@@ -6,15 +6,16 @@ SUPABASE_KEY = "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9.eyJpc3MiOiJzdXBhYmFzZSIsInJ
 
 supabase = create_client(SUPABASE_URL, SUPABASE_KEY)
 
-# Check categories with their counts
-result = supabase.from_("foods").select("category").execute()
+# Check categories with their counts (from food_stats, not a full row download)
+result = supabase.rpc("get_food_stats").execute()
 print("\n📊 Food Counts by Category")
 print("="*50)
 
 categories = {}
+sources = {}
 for row in result.data:
-    cat = row.get("category", "unknown")
-    categories[cat] = categories.get(cat, 0) + 1
+    categories[row["category"]] = categories.get(row["category"], 0) + row["food_count"]
+    sources[row["source"]] = sources.get(row["source"], 0) + row["food_count"]
 
 for cat, count in sorted(categories.items(), key=lambda x: x[1], reverse=True):
     print(f"{cat}: {count:,}")
@@ -22,6 +23,12 @@ for cat, count in sorted(categories.items(), key=lambda x: x[1], reverse=True):
 print("="*50)
 print(f"TOTAL: {sum(categories.values()):,}\n")
 
+print("📊 Food Counts by Source")
+print("="*50)
+for source, count in sorted(sources.items(), key=lambda x: x[1], reverse=True):
+    print(f"{source}: {count:,}")
+print("="*50 + "\n")
+
 # Check if there's a user_id filtering issue
 print("📋 Sample Foods by Category")
 print("="*50)
@@ -6,8 +6,9 @@ SUPABASE_KEY = "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9.eyJpc3MiOiJzdXBhYmFzZSIsInJ
 
 supabase = create_client(SUPABASE_URL, SUPABASE_KEY)
 
-result = supabase.table("foods").select("id", count="exact").limit(1).execute()
-total = result.count if hasattr(result, 'count') else 0
+# food_stats is maintained by triggers on foods - no count=exact scan needed
+result = supabase.rpc("get_food_stats").execute()
+total = sum(row["food_count"] for row in result.data)
 print(f"\n📊 FOOD DATABASE SUMMARY")
 print(f"{'='*50}")
 print(f"✅ Total foods in database: {total:,}")
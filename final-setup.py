@@ -3,10 +3,12 @@
 Create foods_indian table and import data directly
 """
 
-import json
-import csv
+import sys
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).parent / "scripts"))
+from foods_indian_loader import create_client_factory, prepare, print_result, read_foods, reconcile_foods, upsert_foods
+
 def main():
     print("\n" + "=" * 70)
     print("🇮🇳 Indian Foods - Database Setup")
@@ -15,25 +17,7 @@ def main():
     # Load CSV data
     print("\n📂 Loading foods from CSV...")
     csv_file = Path("data/ifct/ifct_foods.csv")
-    foods_data = []
-    
-    with open(csv_file, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            foods_data.append({
-                'name': row['name'],
-                'name_hindi': row['name_hindi'],
-                'category': row['category'],
-                'serving_size_g': float(row['serving_size_g']),
-                'calories': float(row['calories']),
-                'protein_g': float(row['protein_g']),
-                'carbs_g': float(row['carbs_g']),
-                'fat_g': float(row['fat_g']),
-                'fiber_g': float(row['fiber_g']),
-                'sodium_mg': float(row.get('sodium_mg', 0)),
-                'potassium_mg': float(row.get('potassium_mg', 0)),
-                'source': 'IFCT'
-            })
+    foods_data, skipped = prepare(read_foods(csv_file), source='IFCT')
     
     print(f"✅ Loaded {len(foods_data)} foods")
     
@@ -47,48 +31,29 @@ def main():
     supabase = create_client(SUPABASE_URL, SUPABASE_KEY)
     print("✅ Connected")
     
-    # Import foods in batches
+    # Upsert foods in batches (the upsert RPC needs the service role key)
     print(f"\n📊 Importing {len(foods_data)} foods...")
-    batch_size = 10
-    
-    for i in range(0, len(foods_data), batch_size):
-        batch = foods_data[i:i+batch_size]
-        try:
-            response = supabase.table('foods_indian').insert(batch).execute()
-            print(f"   ✅ {min(i+batch_size, len(foods_data))}/{len(foods_data)}")
-        except Exception as e:
-            error_str = str(e).lower()
-            if 'foods_indian' in error_str and 'found' in error_str:
-                print(f"\n❌ Table 'foods_indian' doesn't exist")
-                print("\n💡 SOLUTION: Create the table in Supabase manually")
-                print("\nGo to: https://app.supabase.com/project/mtevaxgfkjyifnaftxhl/sql/new")
-                print("\nRun this SQL:\n")
-                print("""CREATE TABLE foods_indian (
-  id BIGSERIAL PRIMARY KEY,
-  name VARCHAR(255) NOT NULL UNIQUE,
-  name_hindi VARCHAR(255),
-  category VARCHAR(100),
-  serving_size_g DECIMAL(10, 2),
-  calories DECIMAL(10, 2),
-  protein_g DECIMAL(10, 2),
-  carbs_g DECIMAL(10, 2),
-  fat_g DECIMAL(10, 2),
-  fiber_g DECIMAL(10, 2),
-  sodium_mg DECIMAL(10, 2),
-  potassium_mg DECIMAL(10, 2),
-  source VARCHAR(50),
-  created_at TIMESTAMP DEFAULT NOW()
-);
+    try:
+        client = create_client_factory(SUPABASE_URL)
+        result = upsert_foods(foods_data, client)
+    except RuntimeError as e:
+        print(f"   ❌ {e}")
+        error_str = str(e).lower()
+        if 'foods_indian' in error_str and ('found' in error_str or 'exist' in error_str):
+            print("\n❌ Table 'foods_indian' or its upsert function doesn't exist")
+            print("\n💡 SOLUTION: Apply the migrations in Supabase")
+            print("\nGo to: https://app.supabase.com/project/mtevaxgfkjyifnaftxhl/sql/new")
+            print("\nRun, in order:")
+            print("   supabase/migrations/20260118_create_foods_indian_table.sql")
+            print("   supabase/migrations/20260125_add_foods_fulltext_search.sql")
+            print("   supabase/migrations/20260129_add_foods_indian_upsert.sql")
+            print("\nThen run this script again.")
+        return False
+    print_result(result, skipped)
 
-ALTER TABLE foods_indian ENABLE ROW LEVEL SECURITY;
-CREATE POLICY "Allow select" ON foods_indian FOR SELECT USING (true);""")
-                print("\nThen run this script again.")
-                return False
-            elif 'duplicate' in error_str or 'unique' in error_str:
-                print(f"   ℹ️  {min(i+batch_size, len(foods_data))}/{len(foods_data)} (duplicates ok)")
-            else:
-                print(f"   ❌ Error: {e}")
-                return False
+    if result.inserted + result.updated == 0 and result.rejected:
+        return False
+    reconcile_foods(client)
     
     print(f"\n✅ Import complete")
     
@@ -27,6 +27,7 @@ SUPABASE_KEY = os.getenv("SUPABASE_KEY", "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9.e
 
 CSV_FILE = Path(__file__).parent / "en.openfoodfacts.org.products.csv"
 BATCH_SIZE = 5000
+FOODS_PARTITION = "foods_openfoodfacts"  # source=openfoodfacts partition of foods
 MAX_ROWS = None  # Set to test value like 100000
 
 
@@ -72,6 +73,7 @@ def process_csv_row(row: dict) -> Optional[dict]:
             "category": get_category(row),
             "is_custom": False,
             "user_id": None,
+            "source": "openfoodfacts",
         }
     except Exception as e:
         return None
@@ -139,7 +141,7 @@ try:
                 print(f"   {progress:.<50} ", end="", flush=True)
                 
                 try:
-                    response = supabase.table("foods").insert(batch).execute()
+                    response = supabase.table(FOODS_PARTITION).insert(batch).execute()
                     imported += len(batch)
                     print(f"✅ ({imported:,})")
                 except Exception as e:
@@ -155,7 +157,7 @@ try:
     if batch:
         print(f"   Final batch ({len(batch)} items).............. ", end="", flush=True)
         try:
-            response = supabase.table("foods").insert(batch).execute()
+            response = supabase.table(FOODS_PARTITION).insert(batch).execute()
             imported += len(batch)
             print(f"✅ ({imported:,})")
         except Exception as e:
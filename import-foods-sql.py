@@ -21,6 +21,7 @@ SUPABASE_KEY = os.getenv("SUPABASE_KEY", "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9.e
 
 CSV_FILE = Path(__file__).parent / "en.openfoodfacts.org.products.csv"
 BATCH_SIZE = 100  # Smaller batches for SQL
+FOODS_PARTITION = "foods_openfoodfacts"  # source=openfoodfacts partition of foods
 
 
 def safe_float(value: Optional[str], default: float = 0.0) -> float:
@@ -71,6 +72,7 @@ def process_csv_row(row: dict) -> Optional[dict]:
             "category": get_category(row),
             "is_custom": False,
             "user_id": None,
+            "source": "openfoodfacts",
         }
     except Exception:
         return None
@@ -145,11 +147,12 @@ try:
                         escape_sql_string(f["category"]),
                         "false",
                         "NULL",
+                        escape_sql_string(f["source"]),
                     )
                     values.append(f"({','.join(str(v) for v in vals)})")
                 
                 sql = f"""
-                INSERT INTO foods (id, name, calories_per_serving, protein_g, carbs_g, fats_g, serving_size_g, category, is_custom, user_id)
+                INSERT INTO foods_openfoodfacts (id, name, calories_per_serving, protein_g, carbs_g, fats_g, serving_size_g, category, is_custom, user_id, source)
                 VALUES {','.join(values)}
                 ON CONFLICT (name) DO NOTHING;
                 """
@@ -168,7 +171,7 @@ try:
                             # Fallback: try direct insert one by one
                             for f in batch:
                                 try:
-                                    supabase.table("foods").insert(f).execute()
+                                    supabase.table(FOODS_PARTITION).insert(f).execute()
                                     imported += 1
                                 except:
                                     pass
@@ -195,11 +198,12 @@ try:
                 escape_sql_string(f["category"]),
                 "false",
                 "NULL",
+                escape_sql_string(f["source"]),
             )
             values.append(f"({','.join(str(v) for v in vals)})")
         
         sql = f"""
-        INSERT INTO foods (id, name, calories_per_serving, protein_g, carbs_g, fats_g, serving_size_g, category, is_custom, user_id)
+        INSERT INTO foods_openfoodfacts (id, name, calories_per_serving, protein_g, carbs_g, fats_g, serving_size_g, category, is_custom, user_id, source)
         VALUES {','.join(values)}
         ON CONFLICT (name) DO NOTHING;
         """
@@ -20,6 +20,7 @@ SUPABASE_KEY = "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9.eyJpc3MiOiJzdXBhYmFzZSIsInJ
 
 CSV_FILE = Path("en.openfoodfacts.org.products.csv")
 BATCH_SIZE = 100  # Smaller batch for retries
+FOODS_PARTITION = "foods_openfoodfacts"  # source=openfoodfacts partition of foods
 MAX_ROWS = 1000  # Test with first 1000 rows
 
 
@@ -52,6 +53,7 @@ def process_csv_row(row: dict) -> Optional[dict]:
             "serving_size_g": max(1, safe_float(row.get("serving_size", "100"), 100)),
             "category": "global",
             "is_custom": False,
+            "source": "openfoodfacts",
         }
     except Exception:
         return None
@@ -109,7 +111,7 @@ try:
                 
                 try:
                     # Try standard insert
-                    response = supabase.table("foods").insert(batch).execute()
+                    response = supabase.table(FOODS_PARTITION).insert(batch).execute()
                     imported += len(batch)
                     print(f"✅ ({imported} total)")
                 except Exception as e:
@@ -122,7 +124,7 @@ try:
                         success_count = 0
                         for food_item in batch:
                             try:
-                                supabase.table("foods").insert(food_item).execute()
+                                supabase.table(FOODS_PARTITION).insert(food_item).execute()
                                 imported += 1
                                 success_count += 1
                             except:
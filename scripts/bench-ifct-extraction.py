@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+"""
+IFCT extraction accuracy and speed benchmark against a golden reference set.
+
+Runs one or more ifct_pipeline configurations (profile plus overrides of
+DPI, preprocessing, table regions, adaptive DPI, OCR engine, segmenter,
+parser, validator) over the pages covered by a hand-verified golden CSV and
+reports, per configuration:
+  - precision (extracted rows that match a golden row) and recall
+  - per-field mean absolute error and share within tolerance
+  - time per stage (render, regions, preprocess, ocr, text_layer, parse)
+    and OCR cache hits
+
+OCR goes through the ifct_ocr cache, so after the first run parser changes
+are scored in seconds; set IFCT_OCR_CACHE=off to time cold OCR. Pages run
+sequentially so stage timings are complete.
+
+Golden CSV (IFCT_GOLDEN, default data/ifct/ifct_golden.csv) columns:
+  page,code,name,protein_g,fat_g,carbs_g,fiber_g,calories
+Every food row on a listed page must be present, otherwise precision is
+understated. Blank values are not scored.
+
+Installation: pip install pytesseract pdf2image pdfplumber
+Usage: python scripts/bench-ifct-extraction.py /path/to/IFCT2017.pdf
+
+Environment:
+  IFCT_PDF       PDF to benchmark when no path argument is given
+  IFCT_GOLDEN    golden CSV (see above)
+  BENCH_CONFIGS  JSON list of configurations, or a path to a JSON file;
+                 keys: name, profile (see ifct_pipeline.PROFILES) and any
+                 PipelineConfig field, e.g. {"profile": "all", "dpi": 200}
+"""
+
+import csv
+import difflib
+import json
+import os
+import re
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import ifct_ocr
+from ifct_ocr import STAGE_CALLS, STAGE_SECONDS, reset_stage_stats
+from ifct_pipeline import PROFILES, Pipeline, PipelineConfig
+
+ROOT = Path(__file__).resolve().parent.parent
+RESULTS_DIR = ROOT / "bench-results"
+GOLDEN_CSV = Path(os.getenv("IFCT_GOLDEN", ROOT / "data" / "ifct" / "ifct_golden.csv"))
+
+FIELDS = ["protein_g", "fat_g", "carbs_g", "fiber_g", "calories"]
+NAME_MATCH_RATIO = 0.85
+ABS_TOLERANCE = 0.1     # a value is correct within max(ABS_TOLERANCE, REL_TOLERANCE * golden)
+REL_TOLERANCE = 0.02
+
+DEFAULT_CONFIGS = [
+    {"name": "lines-140", "profile": "all", "refine_dpi": None},
+    {"name": "columns-140", "profile": "complete", "refine_dpi": None},
+    {"name": "columns-140-refine300", "profile": "complete", "refine_dpi": 300},
+]
+
+
+def pipeline_config(config: Dict) -> PipelineConfig:
+    """Profile (default complete) with the other keys as PipelineConfig overrides"""
+    profile = config.get("profile", "complete")
+    if profile not in PROFILES:
+        raise ValueError(f"Unknown profile {profile!r} (one of {', '.join(PROFILES)})")
+    overrides = {k: v for k, v in config.items() if k not in ("name", "profile")}
+    return PROFILES[profile]._replace(**overrides)
+
+
+# ==================== SCORING ====================
+
+def normalize_name(name: str) -> str:
+    name = re.sub(r"\([^)]*\)", " ", name.lower())
+    return " ".join(re.findall(r"[a-z0-9]+", name))
+
+
+def to_float(value) -> Optional[float]:
+    try:
+        return float(value) if value not in (None, "") else None
+    except (TypeError, ValueError):
+        return None
+
+
+def load_golden(path: Path) -> List[Dict]:
+    with open(path, newline="", encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+    for row in rows:
+        row["page"] = int(row["page"])
+        for field in FIELDS:
+            row[field] = to_float(row.get(field))
+    return rows
+
+
+def match_rows(extracted: List[Dict], golden: List[Dict]) -> List[Tuple[Dict, Dict]]:
+    """Pair extracted and golden rows on the same page: by food code, else closest name"""
+    pairs = []
+    unmatched = list(golden)
+    for food in extracted:
+        candidates = [g for g in unmatched if g["page"] == food["_page"]]
+        best = next((g for g in candidates if food.get("code") and g["code"] == food["code"]), None)
+        if best is None:
+            name = normalize_name(food.get("name", ""))
+            scored = [(difflib.SequenceMatcher(None, name, normalize_name(g["name"])).ratio(), g) for g in candidates]
+            ratio, best = max(scored, key=lambda s: s[0], default=(0.0, None))
+            if ratio < NAME_MATCH_RATIO:
+                best = None
+        if best is not None:
+            unmatched.remove(best)
+            pairs.append((food, best))
+    return pairs
+
+
+def score(extracted: List[Dict], golden: List[Dict]) -> Dict:
+    pairs = match_rows(extracted, golden)
+    fields = {}
+    for field in FIELDS:
+        errors, correct, missing = [], 0, 0
+        for food, gold in pairs:
+            expected = gold[field]
+            if expected is None:
+                continue
+            actual = to_float(food.get(field))
+            if actual is None:
+                missing += 1
+                continue
+            error = abs(actual - expected)
+            errors.append(error)
+            correct += error <= max(ABS_TOLERANCE, REL_TOLERANCE * abs(expected))
+        scored = len(errors) + missing
+        fields[field] = {
+            "mae": sum(errors) / len(errors) if errors else None,
+            "within_tolerance": correct / scored if scored else None,
+            "missing": missing,
+        }
+    return {
+        "extracted": len(extracted),
+        "golden": len(golden),
+        "matched": len(pairs),
+        "precision": len(pairs) / len(extracted) if extracted else 0.0,
+        "recall": len(pairs) / len(golden) if golden else 0.0,
+        "fields": fields,
+    }
+
+
+# ==================== RUN ====================
+
+def run_config(config: Dict, pdf_path: str, pages: List[int], golden: List[Dict]) -> Dict:
+    pipeline = Pipeline(pdf_path, pipeline_config(config))
+
+    reset_stage_stats()
+    extracted: List[Dict] = []
+    paths: Dict[str, int] = {}
+    start = time.perf_counter()
+    for page, records in pipeline.run(pages, workers=1):
+        paths[page.path] = paths.get(page.path, 0) + 1
+        extracted.extend({**record, "_page": page.num} for record in records)
+    total = time.perf_counter() - start
+
+    return {
+        "config": config,
+        **score(extracted, golden),
+        "paths": paths,
+        "seconds": round(total, 3),
+        "stages": {stage: round(seconds, 3) for stage, seconds in sorted(STAGE_SECONDS.items())},
+        "cache": {"hits": STAGE_CALLS["cache_hit"], "misses": STAGE_CALLS["cache_miss"]},
+    }
+
+
+def load_configs() -> List[Dict]:
+    raw = os.getenv("BENCH_CONFIGS")
+    if not raw:
+        return DEFAULT_CONFIGS
+    configs = json.loads(Path(raw).read_text() if Path(raw).exists() else raw)
+    for i, config in enumerate(configs):
+        config.setdefault("name", f"config-{i + 1}")
+    return configs
+
+
+def fmt(value: Optional[float], pattern: str = "{:.1%}") -> str:
+    return pattern.format(value) if value is not None else "-"
+
+
+def main():
+    pdf_path = sys.argv[1] if len(sys.argv) > 1 else os.getenv("IFCT_PDF")
+    if not pdf_path or not Path(pdf_path).exists():
+        print("❌ Pass the IFCT PDF path as an argument or set IFCT_PDF")
+        return False
+    if not GOLDEN_CSV.exists():
+        print(f"❌ Golden set not found: {GOLDEN_CSV}")
+        print("   Columns: page,code,name,protein_g,fat_g,carbs_g,fiber_g,calories")
+        return False
+
+    golden = load_golden(GOLDEN_CSV)
+    pages = sorted({g["page"] for g in golden})
+    configs = load_configs()
+
+    print("=" * 70)
+    print("🎯 IFCT EXTRACTION BENCHMARK")
+    print("=" * 70)
+    print(f"   Golden: {len(golden)} rows on {len(pages)} pages ({GOLDEN_CSV.name})")
+    print(f"   Cache: {ifct_ocr.CACHE_DIR if ifct_ocr.cache_enabled() else 'off'}\n")
+
+    results = []
+    for config in configs:
+        print(f"▶️  {config['name']}")
+        result = run_config(config, pdf_path, pages, golden)
+        results.append(result)
+        stages = ", ".join(f"{k} {v:.2f}s" for k, v in result["stages"].items())
+        print(f"   precision {fmt(result['precision'])}  recall {fmt(result['recall'])}  "
+              f"({result['matched']}/{result['golden']} matched, {result['extracted']} extracted)")
+        for field, stats in result["fields"].items():
+            print(f"   {field:<12} MAE {fmt(stats['mae'], '{:8.2f}')}  within tol {fmt(stats['within_tolerance'])}"
+                  f"  missing {stats['missing']}")
+        print(f"   {result['seconds']:.2f}s total: {stages}")
+        print(f"   cache {result['cache']['hits']} hits / {result['cache']['misses']} misses\n")
+
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    out_dir = RESULTS_DIR / stamp
+    out_dir.mkdir(parents=True, exist_ok=True)
+    summary = {"pdf": Path(pdf_path).name, "golden": str(GOLDEN_CSV.name), "pages": pages, "results": results}
+    (out_dir / "ifct-extraction.json").write_text(json.dumps(summary, indent=2) + "\n")
+
+    print("=" * 70)
+    print(f"   {'config':<28}{'precision':>10}{'recall':>9}{'seconds':>9}")
+    for result in results:
+        print(f"   {result['config']['name']:<28}{fmt(result['precision']):>10}{fmt(result['recall']):>9}"
+              f"{result['seconds']:>9.2f}")
+    print(f"✅ Results written to {out_dir.relative_to(ROOT)}")
+    print("=" * 70 + "\n")
+    return True
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Per-page OCR latency benchmark: in-process tesserocr vs the pytesseract CLI.
+
+Renders each page of the IFCT PDF once, runs every available engine on the
+same image (cache bypassed) and reports per-page latency plus mean/p50/p95
+for each engine, and how many pages produced different text.
+
+Installation: pip install pytesseract pdf2image tesserocr
+Usage: python scripts/bench-ifct-ocr.py /path/to/IFCT2017.pdf
+
+Environment:
+  IFCT_PDF     PDF to benchmark when no path argument is given
+  BENCH_DPI    render resolution (default 140)
+  BENCH_PAGES  page range like 1-28 (default: all pages)
+"""
+
+import json
+import os
+import statistics
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List
+
+from ifct_ocr import DEFAULT_LANG, ENGINES, get_engine, page_range, render_pages
+
+ROOT = Path(__file__).resolve().parent.parent
+RESULTS_DIR = ROOT / "bench-results"
+
+DPI = int(os.getenv("BENCH_DPI", "140"))
+PAGES = os.getenv("BENCH_PAGES", "")
+
+
+def percentile(samples: List[float], pct: int) -> float:
+    """Return the pct-th percentile (1-99) of a list of samples"""
+    if len(samples) < 2:
+        return samples[0] if samples else 0.0
+    return statistics.quantiles(samples, n=100, method="inclusive")[pct - 1]
+
+
+def available_engines() -> Dict[str, object]:
+    engines = {}
+    for name in ENGINES:
+        try:
+            engine = get_engine(name)
+            engine.version()
+            engines[name] = engine
+        except Exception as e:
+            print(f"⚠️  {name} unavailable: {e}")
+    return engines
+
+
+def main():
+    pdf_path = sys.argv[1] if len(sys.argv) > 1 else os.getenv("IFCT_PDF")
+    if not pdf_path or not Path(pdf_path).exists():
+        print("❌ Pass the IFCT PDF path as an argument or set IFCT_PDF")
+        return False
+
+    print("=" * 70)
+    print("⏱️  IFCT OCR ENGINE BENCHMARK")
+    print("=" * 70)
+
+    engines = available_engines()
+    if not engines:
+        print("❌ No OCR engine available")
+        return False
+
+    start, _, end = PAGES.partition("-")
+    pages = page_range(pdf_path, int(start or 1), int(end or start) if PAGES else None)
+    print(f"   {len(pages)} pages at {DPI} DPI, engines: {', '.join(engines)}\n")
+    print(f"   {'page':<8}" + "".join(f"{name:>14}" for name in engines))
+
+    latencies: Dict[str, List[float]] = {name: [] for name in engines}
+    first_call: Dict[str, float] = {}
+    text_mismatches = 0
+    for page_num, image in render_pages(pdf_path, pages, DPI):
+        texts = set()
+        for name, engine in engines.items():
+            t0 = time.perf_counter()
+            result = engine.recognize(image, DEFAULT_LANG, "")
+            elapsed = (time.perf_counter() - t0) * 1000
+            # The first in-process call also loads the language model
+            if name not in first_call:
+                first_call[name] = elapsed
+            else:
+                latencies[name].append(elapsed)
+            texts.add(result.text.strip())
+        text_mismatches += len(texts) > 1
+        print(f"   {page_num:<8}" + "".join(
+            f"{(latencies[n][-1] if latencies[n] else first_call[n]):>12.0f}ms" for n in engines))
+
+    summary = {
+        "pdf": Path(pdf_path).name,
+        "dpi": DPI,
+        "pages": len(pages),
+        "text_mismatch_pages": text_mismatches,
+        "engines": {
+            name: {
+                "version": engine.version(),
+                "first_page_ms": first_call.get(name, 0.0),
+                "mean_ms": statistics.mean(latencies[name]) if latencies[name] else 0.0,
+                "p50_ms": percentile(latencies[name], 50),
+                "p95_ms": percentile(latencies[name], 95),
+                "page_ms": latencies[name],
+            }
+            for name, engine in engines.items()
+        },
+    }
+
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    out_dir = RESULTS_DIR / stamp
+    out_dir.mkdir(parents=True, exist_ok=True)
+    (out_dir / "ocr-engines.json").write_text(json.dumps(summary, indent=2) + "\n")
+
+    print("\n" + "=" * 70)
+    for name, stats in summary["engines"].items():
+        print(f"   {name:<14} first {stats['first_page_ms']:>7.0f}ms  mean {stats['mean_ms']:>7.0f}ms"
+              f"  p50 {stats['p50_ms']:>7.0f}ms  p95 {stats['p95_ms']:>7.0f}ms")
+    print(f"   Pages with differing text: {text_mismatches}/{len(pages)}")
+    print(f"✅ Results written to {out_dir.relative_to(ROOT)}")
+    print("=" * 70 + "\n")
+    return True
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Run the nutrition plausibility rules (food_plausibility.py) over food datasets.
+
+Checks every IFCT CSV in data/ifct by default, or the files given. An Open
+Food Facts export (.csv/.tsv with energy-kcal_100g) is first put through the
+same transform as bulk-load-foods.py, so the rows checked are the rows that
+would be loaded.
+
+For each dataset prints per-rule counts and writes the flagged rows (with the
+rules they failed and each rule's measure) to
+bench-results/<timestamp>/plausibility-<file>.csv, plus a plausibility.json
+summary of all datasets.
+
+Installation: pip install numpy (psycopg2-binary for OFF exports)
+Usage: python scripts/check-food-plausibility.py [data/ifct/ifct_foods_all.csv en.openfoodfacts.org.products.csv ...]
+
+Environment:
+  MAX_ROWS   limit OFF rows read (see bulk-load-foods.py)
+  PLAUSIBILITY_ATWATER_TOL, PLAUSIBILITY_Z, PLAUSIBILITY_MIN_GROUP (see food_plausibility.py)
+"""
+
+import csv
+import importlib.util
+import json
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from food_plausibility import IFCT_SCHEMA, OFF_SCHEMA, RULES, Schema, check, flagged_rows, rule_counts, to_columns
+
+ROOT = Path(__file__).resolve().parent.parent
+RESULTS_DIR = ROOT / "bench-results"
+DEFAULT_INPUTS = sorted((ROOT / "data" / "ifct").glob("*.csv"))
+
+
+def load_bulk_loader():
+    """Reuse the OFF CSV transform from bulk-load-foods.py"""
+    spec = importlib.util.spec_from_file_location("bulk_load_foods", ROOT / "bulk-load-foods.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def read_dataset(path: Path) -> Tuple[List[Dict], Schema]:
+    """(rows, schema): OFF exports through the bulk-load transform, anything else as IFCT CSV"""
+    with open(path, newline='', encoding='utf-8', errors='replace') as f:
+        header = f.readline()
+    if 'energy-kcal_100g' not in header:
+        with open(path, newline='', encoding='utf-8') as f:
+            return list(csv.DictReader(f)), IFCT_SCHEMA
+
+    bulk = load_bulk_loader()
+    csv.field_size_limit(int(1e8))
+    rows = []
+    with open(path, encoding='utf-8', errors='replace') as f:
+        reader = csv.DictReader(f, delimiter='\t')
+        for row_num, row in enumerate(reader, start=1):
+            if bulk.MAX_ROWS and row_num > bulk.MAX_ROWS:
+                break
+            food = bulk.process_csv_row(row)
+            if food:
+                rows.append(dict(zip(bulk.COPY_COLUMNS, food)))
+    return rows, OFF_SCHEMA
+
+
+def main():
+    inputs = [Path(p) for p in sys.argv[1:]] or DEFAULT_INPUTS
+    missing = [str(p) for p in inputs if not p.exists()]
+    if missing or not inputs:
+        print(f"❌ File not found: {', '.join(missing) or 'data/ifct/*.csv'}")
+        return False
+
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    out_dir = RESULTS_DIR / stamp
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    print("=" * 70)
+    print("🔬 FOOD PLAUSIBILITY CHECK")
+    print("=" * 70)
+
+    summary = {}
+    for path in inputs:
+        rows, schema = read_dataset(path)
+        start = time.perf_counter()
+        report = check(to_columns(rows, schema))
+        seconds = time.perf_counter() - start
+        counts = rule_counts(report)
+        flagged = flagged_rows(rows, report)
+
+        print(f"\n📂 {path.name}: {report.rows:,} rows, {int(report.rejected.sum()):,} rejected, "
+              f"{len(flagged):,} flagged ({seconds * 1000:.0f} ms)")
+        for name, count in counts.items():
+            severity = RULES[name][1]
+            print(f"   {'❌' if severity == 'reject' and count else '⚠️ ' if count else '✅'} "
+                  f"{name:18s} {count:7,}  ({severity})")
+
+        flagged_path = out_dir / f"plausibility-{path.stem}.csv"
+        if flagged:
+            columns = list(dict.fromkeys(key for row in flagged for key in row))
+            with open(flagged_path, 'w', newline='', encoding='utf-8') as f:
+                writer = csv.DictWriter(f, fieldnames=columns)
+                writer.writeheader()
+                writer.writerows(flagged)
+            for row in flagged[:5]:
+                print(f"      - {str(row.get('name', ''))[:40]:40s} {row['rules']}")
+
+        summary[path.name] = {
+            'rows': report.rows,
+            'rejected': int(report.rejected.sum()),
+            'flagged': len(flagged),
+            'rules': counts,
+            'seconds': round(seconds, 4),
+            'flagged_rows': str(flagged_path) if flagged else None,
+        }
+
+    with open(out_dir / "plausibility.json", 'w') as f:
+        json.dump(summary, f, indent=2)
+    print(f"\n💾 {out_dir}")
+    return True
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -1,14 +1,27 @@
 #!/usr/bin/env python3
 """
 Clean and finalize IFCT data - remove OCR noise and prepare for import.
+
+Rows with an OCR-debris name are dropped, then the reject rules of
+food_plausibility.py (Atwater energy, macros over 100 g, energy range) run
+over the whole file at once; rows that fail any of them are dropped too.
+
+Installation: pip install numpy
+Usage: python scripts/clean-ifct-data.py [input.csv]
 """
 
 import csv
 import json
 import re
+import sys
 from pathlib import Path
 from typing import List, Dict
 
+from food_plausibility import RULES, check, rule_counts, to_columns
+
+ROOT = Path(__file__).resolve().parent.parent
+DATA_DIR = ROOT / 'data' / 'ifct'
+
 def clean_food_data(foods: List[Dict]) -> List[Dict]:
     """Clean and validate food data."""
     cleaned = []
@@ -32,43 +45,38 @@ def clean_food_data(foods: List[Dict]) -> List[Dict]:
         if len(name) < 2:
             continue
         
-        # Validate nutrition numbers
+        # Parse nutrition numbers; plausibility is checked for the whole file below
         try:
             calories = float(food.get('calories', 0))
             protein = float(food.get('protein_g', 0) or 0)
             carbs = float(food.get('carbs_g', 0) or 0)
             fat = float(food.get('fat_g', 0) or 0)
-            
-            # Basic validation
-            if calories < 1 or calories > 900:
-                continue
-            if protein < 0 or protein > 100:
-                continue
-            if carbs < 0 or carbs > 100:
-                continue
-            if fat < 0 or fat > 100:
-                continue
-            
-            # Create clean record
-            clean_food = {
-                'name': name,
-                'name_hindi': food.get('name_hindi', ''),
-                'category': 'IFCT2017',
-                'serving_size_g': 100,
-                'calories': round(calories, 1),
-                'protein_g': round(protein, 2),
-                'carbs_g': round(carbs, 2),
-                'fat_g': round(fat, 2),
-                'fiber_g': float(food.get('fiber_g', 0) or 0) if food.get('fiber_g') else None,
-                'sodium_mg': None,
-                'potassium_mg': None,
-                'source': 'IFCT2017_Complete_OCR'
-            }
-            
-            cleaned.append(clean_food)
-            
-        except:
+        except (TypeError, ValueError):
             continue
+        if calories < 1:
+            continue
+        
+        # Create clean record
+        cleaned.append({
+            'name': name,
+            'name_hindi': food.get('name_hindi', ''),
+            'category': 'IFCT2017',
+            'serving_size_g': 100,
+            'calories': round(calories, 1),
+            'protein_g': round(protein, 2),
+            'carbs_g': round(carbs, 2),
+            'fat_g': round(fat, 2),
+            'fiber_g': float(food.get('fiber_g', 0) or 0) if food.get('fiber_g') else None,
+            'sodium_mg': None,
+            'potassium_mg': None,
+            'source': 'IFCT2017_Complete_OCR'
+        })
+    
+    report = check(to_columns(cleaned), [rule for rule, (_, severity) in RULES.items() if severity == 'reject'])
+    for rule, count in rule_counts(report).items():
+        if count:
+            print(f"  ✗ {rule:15} {count:3} rows rejected")
+    cleaned = [food for food, rejected in zip(cleaned, report.rejected) if not rejected]
     
     return cleaned
 
@@ -77,7 +85,7 @@ def main():
     print("🧹 Cleaning IFCT Data\n" + "=" * 60)
     
     # Read raw extracted data
-    csv_path = '/Users/apple/Developer/app/fitwell/data/ifct/ifct_foods_complete.csv'
+    csv_path = sys.argv[1] if len(sys.argv) > 1 else str(DATA_DIR / 'ifct_foods_complete.csv')
     
     with open(csv_path, 'r') as f:
         reader = csv.DictReader(f)
@@ -90,8 +98,8 @@ def main():
     print(f"✓ Cleaned to {len(cleaned_foods)} valid foods\n")
     
     # Save cleaned CSV
-    output_csv = '/Users/apple/Developer/app/fitwell/data/ifct/ifct_foods_final.csv'
-    output_json = '/Users/apple/Developer/app/fitwell/data/ifct/ifct_foods_final.json'
+    output_csv = DATA_DIR / 'ifct_foods_final.csv'
+    output_json = DATA_DIR / 'ifct_foods_final.json'
     
     # Save CSV
     with open(output_csv, 'w', newline='') as f:
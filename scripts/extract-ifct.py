@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Extract IFCT 2017 foods from the PDF into data/ifct for the foods_indian import.
+
+Runs one ifct_pipeline profile (see ifct_pipeline.PROFILES) and streams each
+page's foods to data/ifct/ifct_foods_<profile>.csv and .json (the tables
+profile writes ifct_foods.csv/.json, which the setup scripts import):
+
+  complete   column geometry with code-line fallback (default)
+  all        code-line parsing, 140 DPI
+  extracted  code-line parsing, 100 DPI
+  real       space-separated columns, pages 5-28
+  ocr        sample pages 5-10, summary column order
+  enhanced   enhanced table crops, '|'-separated cells
+  tables     header-named table cells
+
+Installation: pip install pytesseract pdf2image pdfplumber
+Usage: python scripts/extract-ifct.py /path/to/IFCT2017.pdf [profile]
+
+Environment:
+  IFCT_PDF          PDF to extract when no path argument is given
+  IFCT_PROFILE      profile when none is given (default complete)
+  IFCT_OUTPUT_DIR   output directory (default data/ifct)
+  IFCT_OCR_WORKERS  OCR processes or threads (see ifct_ocr.py)
+"""
+
+import os
+import sys
+from pathlib import Path
+
+from ifct_ocr import default_workers
+from ifct_pipeline import PROFILES, Pipeline, write_records
+
+ROOT = Path(__file__).resolve().parent.parent
+OUTPUT_DIR = Path(os.getenv("IFCT_OUTPUT_DIR", ROOT / "data" / "ifct"))
+OUTPUT_NAMES = {"tables": "ifct_foods"}
+
+
+def main():
+    pdf_path = sys.argv[1] if len(sys.argv) > 1 else os.getenv("IFCT_PDF")
+    profile = sys.argv[2] if len(sys.argv) > 2 else os.getenv("IFCT_PROFILE", "complete")
+    if not pdf_path or not Path(pdf_path).exists():
+        print("❌ Pass the IFCT PDF path as an argument or set IFCT_PDF")
+        return False
+    if profile not in PROFILES:
+        print(f"❌ Unknown profile {profile!r} (one of {', '.join(PROFILES)})")
+        return False
+
+    config = PROFILES[profile]
+    pipeline = Pipeline(pdf_path, config)
+    workers = default_workers()
+    stem = OUTPUT_NAMES.get(profile, f"ifct_foods_{profile}")
+    outputs = {
+        "csv": str(OUTPUT_DIR / f"{stem}.csv"),
+        "json": str(OUTPUT_DIR / f"{stem}.json"),
+    }
+
+    print("=" * 70)
+    print(f"🌾 IFCT 2017 EXTRACTION ({profile})")
+    print("=" * 70)
+    pages = pipeline.pages()
+    print(f"📄 {len(pages)} pages at {config.dpi} DPI ({workers} workers), "
+          f"{config.segmenter} rows" + (f", {config.fallback} fallback" if config.fallback else "") + "\n")
+
+    foods = []
+    paths = {"text": 0, "ocr": 0}
+    for page, records in write_records(pipeline.run(pages, workers), outputs):
+        paths[page.path] += 1
+        foods.extend(records)
+        if records:
+            print(f"  Page {page.num:2d} [{page.path}]: ✓ {len(records):3d} foods")
+        else:
+            print(f"  Page {page.num:2d} [{page.path}]: (no data)")
+
+    print(f"\n✅ Extracted {len(foods)} foods ({paths['text']} text-layer pages, {paths['ocr']} OCR'd)")
+    if not foods:
+        print("⚠️  No foods extracted; try another profile or a higher DPI")
+        return False
+
+    for path in outputs.values():
+        print(f"   ✓ {path}")
+
+    print("\n📊 Sample foods:\n")
+    for i, food in enumerate(foods[:10], 1):
+        macros = " ".join(f"{k[0].upper()}:{food[k]}g" for k in ("protein_g", "carbs_g", "fat_g") if food[k] is not None)
+        print(f"{i:2d}. {food['name'][:40]:40s} | {food['calories'] or '-':>6} kcal | {macros}")
+    print("=" * 70 + "\n")
+    return True
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+Columnar nutrition plausibility checks over whole food datasets.
+
+A dataset is loaded once into per-100 g float columns (NaN for missing) and
+every rule in RULES computes a boolean mask over all rows at once:
+
+  negative         a nutrient below zero                            reject
+  energy_range     more than 900 kcal per 100 g (pure fat)          reject
+  macro_sum        protein + carbs + fat + fiber over 100 g/100 g   reject
+  atwater          kcal off 4P + 4C + 9F by more than
+                   PLAUSIBILITY_ATWATER_TOL (and 20 kcal)           reject
+  category_outlier |z| > PLAUSIBILITY_Z of energy density or a
+                   macro's share of energy within the row's
+                   category (categories of PLAUSIBILITY_MIN_GROUP+)  warn
+
+Rejected rows are implausible as stored; warnings are worth a look but can
+be real foods (ghee is an outlier among dals). Atwater factors and the
+per-100 g scaling come from food_quality.py.
+
+Installation: pip install numpy
+
+Environment:
+  PLAUSIBILITY_ATWATER_TOL   relative Atwater residual allowed (default 0.25)
+  PLAUSIBILITY_Z             z-score beyond which a row is an outlier (default 3.0)
+  PLAUSIBILITY_MIN_GROUP     smallest category given z-scores (default 8)
+"""
+
+import os
+from typing import Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+from food_quality import ATWATER, NUTRIENT_FIELDS, to_float
+
+ATWATER_TOL = float(os.getenv("PLAUSIBILITY_ATWATER_TOL", "0.25"))
+ATWATER_MIN_KCAL = 20.0
+Z_LIMIT = float(os.getenv("PLAUSIBILITY_Z", "3.0"))
+MIN_GROUP = int(os.getenv("PLAUSIBILITY_MIN_GROUP", "8"))
+MAX_KCAL = 900.0
+MACRO_SUM_TOL = 1.0     # grams of rounding allowed over 100 g
+
+
+class Schema(NamedTuple):
+    """Where a dataset keeps each nutrient field, and whether values are already per 100 g"""
+    fields: Dict[str, str]      # NUTRIENT_FIELDS / serving_size_g / category -> row key
+    per_100g: bool
+
+
+# foods_indian import CSVs under data/ifct (values per serving_size_g)
+IFCT_SCHEMA = Schema({field: field for field in NUTRIENT_FIELDS + ['serving_size_g', 'category']}, False)
+
+# Rows of the OFF CSV transform in bulk-load-foods.py (values per 100 g)
+OFF_SCHEMA = Schema({
+    'calories': 'calories_per_serving', 'protein_g': 'protein_g', 'carbs_g': 'carbs_g',
+    'fat_g': 'fats_g', 'category': 'category',
+}, True)
+
+
+class Columns(NamedTuple):
+    values: Dict[str, np.ndarray]   # per-100 g floats, NaN where missing
+    category: np.ndarray            # category label per row
+
+
+class RuleResult(NamedTuple):
+    flagged: np.ndarray             # bool per row
+    detail: Optional[np.ndarray]    # per-row measure written to the flagged-row file
+
+
+class Report(NamedTuple):
+    rows: int
+    results: Dict[str, RuleResult]
+    rejected: np.ndarray            # bool per row: any reject rule fired
+
+
+def to_columns(rows: Sequence[Dict], schema: Schema = IFCT_SCHEMA) -> Columns:
+    """Load rows into per-100 g columns"""
+    def column(field: str) -> np.ndarray:
+        key = schema.fields.get(field)
+        if key is None:
+            return np.full(len(rows), np.nan)
+        return np.array([to_float(row.get(key)) for row in rows], dtype=float)
+
+    values = {field: column(field) for field in NUTRIENT_FIELDS}
+    if not schema.per_100g:
+        serving = column('serving_size_g')
+        scale = 100 / np.where(np.isnan(serving) | (serving <= 0), 100, serving)
+        values = {field: col * scale for field, col in values.items()}
+    key = schema.fields.get('category')
+    category = np.array([str(row.get(key) or '') if key else '' for row in rows], dtype=object)
+    return Columns(values, category)
+
+
+def atwater_energy(values: Dict[str, np.ndarray]) -> np.ndarray:
+    return sum(values[field] * factor for field, factor in ATWATER.items())
+
+
+def rule_negative(cols: Columns) -> RuleResult:
+    stacked = np.vstack([cols.values[field] for field in NUTRIENT_FIELDS])
+    return RuleResult(np.nan_to_num(stacked, nan=0.0).min(axis=0) < 0, None)
+
+
+def rule_energy_range(cols: Columns) -> RuleResult:
+    kcal = cols.values['calories']
+    return RuleResult(np.nan_to_num(kcal, nan=0.0) > MAX_KCAL, kcal)
+
+
+def rule_macro_sum(cols: Columns) -> RuleResult:
+    grams = sum(np.nan_to_num(cols.values[field], nan=0.0) for field in ('protein_g', 'carbs_g', 'fat_g', 'fiber_g'))
+    return RuleResult(grams > 100 + MACRO_SUM_TOL, grams)
+
+
+def rule_atwater(cols: Columns) -> RuleResult:
+    kcal = cols.values['calories']
+    expected = atwater_energy(cols.values)
+    gap = np.abs(kcal - expected)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        residual = gap / np.maximum(kcal, expected)
+    # NaN (missing energy or a missing macro) compares False and is not flagged
+    return RuleResult((residual > ATWATER_TOL) & (gap > ATWATER_MIN_KCAL), residual)
+
+
+def group_zscores(metric: np.ndarray, category: np.ndarray, min_group: int = MIN_GROUP) -> np.ndarray:
+    """z-score of metric within each category; NaN for small categories and missing values"""
+    labels, group = np.unique(category, return_inverse=True)
+    present = ~np.isnan(metric)
+    filled = np.where(present, metric, 0.0)
+    n = np.bincount(group, weights=present, minlength=len(labels))
+    total = np.bincount(group, weights=filled, minlength=len(labels))
+    squares = np.bincount(group, weights=filled ** 2, minlength=len(labels))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        mean = total / n
+        std = np.sqrt(np.maximum(squares / n - mean ** 2, 0.0))
+        z = (metric - mean[group]) / std[group]
+    z[(n[group] < min_group) | (std[group] == 0)] = np.nan
+    return z
+
+
+def rule_category_outlier(cols: Columns) -> RuleResult:
+    kcal = cols.values['calories']
+    with np.errstate(divide='ignore', invalid='ignore'):
+        metrics = [kcal] + [cols.values[field] * factor / kcal for field, factor in ATWATER.items()]
+    z = np.vstack([group_zscores(metric, cols.category) for metric in metrics])
+    worst = np.nanmax(np.where(np.isnan(z), -np.inf, np.abs(z)), axis=0)
+    worst[np.isinf(worst)] = np.nan
+    return RuleResult(worst > Z_LIMIT, worst)
+
+
+# name -> (check, severity)
+RULES: Dict[str, Tuple[Callable[[Columns], RuleResult], str]] = {
+    'negative': (rule_negative, 'reject'),
+    'energy_range': (rule_energy_range, 'reject'),
+    'macro_sum': (rule_macro_sum, 'reject'),
+    'atwater': (rule_atwater, 'reject'),
+    'category_outlier': (rule_category_outlier, 'warn'),
+}
+
+
+def check(cols: Columns, rules: Optional[Sequence[str]] = None) -> Report:
+    """Run rules (default all) over the columns"""
+    rows = len(cols.category)
+    results = {name: RULES[name][0](cols) for name in (rules or RULES)}
+    rejected = np.zeros(rows, dtype=bool)
+    for name, result in results.items():
+        if RULES[name][1] == 'reject':
+            rejected |= result.flagged
+    return Report(rows, results, rejected)
+
+
+def flagged_rows(rows: Sequence[Dict], report: Report) -> List[Dict]:
+    """Flagged rows with the rules they failed and each rule's measure"""
+    flagged = []
+    hits = {name: np.flatnonzero(result.flagged) for name, result in report.results.items()}
+    by_row: Dict[int, List[str]] = {}
+    for name, indices in hits.items():
+        for i in indices:
+            by_row.setdefault(int(i), []).append(name)
+    for i in sorted(by_row):
+        row = dict(rows[i])
+        row['row'] = i
+        row['rules'] = ';'.join(by_row[i])
+        for name in by_row[i]:
+            detail = report.results[name].detail
+            if detail is not None:
+                row[name] = round(float(detail[i]), 3)
+        flagged.append(row)
+    return flagged
+
+
+def rule_counts(report: Report) -> Dict[str, int]:
+    return {name: int(result.flagged.sum()) for name, result in report.results.items()}
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Record quality scores shared by the IFCT merge and cleaning tools.
+
+Values are compared per 100 g (records carry serving_size_g), energy is
+checked against the Atwater factors: 4 kcal/g protein and carbohydrate,
+9 kcal/g fat.
+"""
+
+from typing import Dict, Optional
+
+NUTRIENT_FIELDS = ['calories', 'protein_g', 'carbs_g', 'fat_g', 'fiber_g']
+
+ATWATER = {'protein_g': 4, 'carbs_g': 4, 'fat_g': 9}
+
+
+def to_float(value) -> Optional[float]:
+    if value is None or (isinstance(value, str) and not value.strip()):
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def per_100g(record: Dict) -> Dict[str, Optional[float]]:
+    """Nutrient values scaled to 100 g (serving_size_g defaults to 100)"""
+    serving = to_float(record.get('serving_size_g')) or 100
+    values = {}
+    for field in NUTRIENT_FIELDS:
+        value = to_float(record.get(field))
+        values[field] = None if value is None else value * 100 / serving
+    return values
+
+
+def atwater_kcal(values: Dict) -> Optional[float]:
+    """4P + 4C + 9F, or None when a macro is missing"""
+    if any(to_float(values.get(field)) is None for field in ATWATER):
+        return None
+    return sum(to_float(values[field]) * factor for field, factor in ATWATER.items())
+
+
+def atwater_residual(values: Dict) -> Optional[float]:
+    """|calories - 4P - 4C - 9F| relative to calories, or None when not computable"""
+    calories = to_float(values.get('calories'))
+    expected = atwater_kcal(values)
+    if not calories or expected is None:
+        return None
+    return abs(calories - expected) / calories
+
+
+def completeness(values: Dict) -> float:
+    """Share of NUTRIENT_FIELDS present"""
+    return sum(to_float(values.get(field)) is not None for field in NUTRIENT_FIELDS) / len(NUTRIENT_FIELDS)
+
+
+def quality_score(values: Dict, priority: float = 0.0) -> float:
+    """0..1: completeness (0.5), Atwater consistency (0.4), source priority 0..1 (0.1)"""
+    residual = atwater_residual(values)
+    consistency = 0.0 if residual is None else 1 - min(1.0, residual)
+    return 0.5 * completeness(values) + 0.4 * consistency + 0.1 * priority
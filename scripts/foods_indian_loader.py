@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""
+Shared batched loader for the foods_indian table.
+
+Rows from the IFCT CSV/JSON files are normalized to foods_indian columns,
+merged by name (later non-empty values win, micronutrients merge), and sent
+through the upsert_foods_indian RPC in batches of LOAD_BATCH_ROWS, so a whole
+IFCT file takes one or two requests and re-running a load updates in place.
+
+Batches run on LOAD_WORKERS threads, each with its own client. A batch the
+database rejects for its data (SQLSTATE class 22 or 23) is split in half and
+retried until the offending rows are isolated; they are reported with their
+error and the rest of the batch is still loaded. Any other failure (missing
+function, permission denied, auth or network errors) would fail every row
+alike, so it stops the load with a RuntimeError instead.
+
+After a load, reconcile_indian_foods (20260130 migration) maps the new and
+changed rows into the foods table, so they can be logged.
+
+Installation: pip install supabase python-dotenv
+
+Environment:
+  SUPABASE_URL               project URL
+  SUPABASE_SERVICE_ROLE_KEY  key allowed to execute upsert_foods_indian
+  LOAD_BATCH_ROWS            rows per request (default 500)
+  LOAD_WORKERS               concurrent requests (default 4)
+"""
+
+import csv
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from hindi_transliteration import transliterate_devanagari
+from nutrient_vocabulary import ifct_nutrients, pack
+
+BATCH_ROWS = int(os.getenv("LOAD_BATCH_ROWS", "500"))
+WORKERS = int(os.getenv("LOAD_WORKERS", "4"))
+UPSERT_RPC = "upsert_foods_indian"
+RECONCILE_RPC = "reconcile_indian_foods"
+
+# SQLSTATE classes caused by the rows themselves: data exception (bad values,
+# invalid input syntax) and integrity constraint violation
+DATA_ERROR_CLASSES = ("22", "23")
+
+TEXT_COLUMNS = ["name", "name_hindi", "category", "description", "source", "source_id"]
+NUMERIC_COLUMNS = ["serving_size_g", "calories", "protein_g", "carbs_g", "fat_g", "fiber_g", "water_g"]
+
+# Nutrients without a foods_indian column, kept in the micronutrients JSONB
+MICRONUTRIENT_KEYS = [
+    "iron_mg", "calcium_mg", "phosphorus_mg", "vitamin_c_mg", "vitamin_a_iu",
+    "sodium_mg", "potassium_mg",
+]
+
+
+class LoadResult(NamedTuple):
+    rows: int                           # records sent after merging by name
+    inserted: int
+    updated: int
+    rejected: List[Tuple[str, str]]     # (name, error) of rows the database refused
+    requests: int
+    seconds: float
+
+
+def to_float(value) -> Optional[float]:
+    if value is None or (isinstance(value, str) and not value.strip()):
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def read_foods(path: str) -> List[Dict]:
+    """Rows of an IFCT export (.csv, or .json as a list or {"foods": [...]})"""
+    if str(path).endswith(".json"):
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        if isinstance(data, dict):
+            data = data.get("foods")
+        if not isinstance(data, list):
+            raise ValueError(f"{path}: expected a list of foods or an object with a \"foods\" list")
+        return data
+    with open(path, newline="", encoding="utf-8") as f:
+        return list(csv.DictReader(f))
+
+
+def to_record(food: Dict, source: Optional[str] = None) -> Optional[Dict]:
+    """foods_indian row from an export row; None without a name"""
+    name = (food.get("name") or "").strip()
+    if not name:
+        return None
+    record = {col: (str(food[col]).strip() if food.get(col) not in (None, "") else None)
+              for col in TEXT_COLUMNS}
+    record["name"] = name
+    record["name_hindi_translit"] = transliterate_devanagari(record["name_hindi"]) or None
+    for col in NUMERIC_COLUMNS:
+        record[col] = to_float(food.get(col))
+    micro = dict(food.get("micronutrients") or {})
+    for key in MICRONUTRIENT_KEYS:
+        value = to_float(food.get(key))
+        if value is not None:
+            micro[key] = value
+    record["micronutrients"] = micro
+    if source:
+        record["source"] = source
+    return record
+
+
+def merge_by_name(records: Iterable[Dict]) -> List[Dict]:
+    """One record per name, with the same merge rule as the RPC: later non-empty values win"""
+    merged: Dict[str, Dict] = {}
+    for record in records:
+        current = merged.get(record["name"])
+        if current is None:
+            merged[record["name"]] = record
+            continue
+        for col, value in record.items():
+            if col == "micronutrients":
+                current[col] = {**current[col], **value}
+            elif value is not None:
+                current[col] = value
+    return list(merged.values())
+
+
+def prepare(foods: Iterable[Dict], source: Optional[str] = None) -> Tuple[List[Dict], int]:
+    """(records merged by name, with packed per-100 g nutrients; rows skipped for having no name)"""
+    records, skipped = [], 0
+    for food in foods:
+        record = to_record(food, source)
+        if record is None:
+            skipped += 1
+        else:
+            records.append(record)
+    merged = merge_by_name(records)
+    for record in merged:
+        record["nutrients"] = pack(ifct_nutrients(record))
+    return merged, skipped
+
+
+def create_client_factory(url: Optional[str] = None, key: Optional[str] = None) -> Callable:
+    """Callable returning one supabase client per thread"""
+    from supabase import create_client
+
+    url = url or os.getenv("SUPABASE_URL")
+    key = key or os.getenv("SUPABASE_SERVICE_ROLE_KEY")
+    if not url or not key:
+        raise RuntimeError("SUPABASE_URL and SUPABASE_SERVICE_ROLE_KEY must be set")
+    local = threading.local()
+
+    def client():
+        if not hasattr(local, "client"):
+            local.client = create_client(url, key)
+        return local.client
+    return client
+
+
+def is_data_error(error: Exception) -> bool:
+    """True when the database refused the rows' values (PostgREST APIError.code is the SQLSTATE)"""
+    return str(getattr(error, "code", None) or "")[:2] in DATA_ERROR_CLASSES
+
+
+def _upsert_batch(client: Callable, batch: List[Dict]) -> Tuple[int, int, List[Tuple[str, str]], int]:
+    """(inserted, updated, rejected, requests) for one batch, bisecting on data errors"""
+    try:
+        data = client().rpc(UPSERT_RPC, {"foods": batch}).execute().data
+        counts = data[0] if isinstance(data, list) else data
+        return counts["inserted"], counts["updated"], [], 1
+    except Exception as e:
+        if not is_data_error(e):
+            raise RuntimeError(f"{UPSERT_RPC} failed: {str(e)[:200]}") from e
+        if len(batch) == 1:
+            return 0, 0, [(batch[0]["name"], str(e)[:200])], 1
+        mid = len(batch) // 2
+        left = _upsert_batch(client, batch[:mid])
+        right = _upsert_batch(client, batch[mid:])
+        return left[0] + right[0], left[1] + right[1], left[2] + right[2], 1 + left[3] + right[3]
+
+
+def upsert_foods(records: List[Dict], client: Callable, batch_rows: int = BATCH_ROWS,
+                 workers: int = WORKERS, progress: bool = True) -> LoadResult:
+    """Upsert prepared records (see prepare) through upsert_foods_indian
+
+    Raises RuntimeError, without sending the remaining batches, when a request
+    fails for a reason other than its rows' data.
+    """
+    batches = [records[i:i + batch_rows] for i in range(0, len(records), batch_rows)]
+    inserted = updated = requests = 0
+    rejected: List[Tuple[str, str]] = []
+    done = 0
+    start = time.perf_counter()
+    pool = ThreadPoolExecutor(max_workers=max(1, min(workers, len(batches) or 1)))
+    try:
+        for batch, (ins, upd, bad, reqs) in zip(batches, pool.map(lambda b: _upsert_batch(client, b), batches)):
+            inserted, updated, requests = inserted + ins, updated + upd, requests + reqs
+            rejected.extend(bad)
+            done += len(batch)
+            if progress:
+                print(f"   ✅ {done:,}/{len(records):,} rows ({ins} new, {upd} updated"
+                      + (f", {len(bad)} rejected" if bad else "") + ")")
+    finally:
+        pool.shutdown(cancel_futures=True)
+    return LoadResult(len(records), inserted, updated, rejected, requests, time.perf_counter() - start)
+
+
+def print_result(result: LoadResult, skipped: int = 0) -> None:
+    rate = result.rows / result.seconds if result.seconds else 0
+    print(f"\n✅ Loaded {result.inserted + result.updated:,}/{result.rows:,} foods "
+          f"({result.inserted:,} new, {result.updated:,} updated)")
+    if skipped:
+        print(f"⏭️  Skipped {skipped:,} rows without a name")
+    if result.rejected:
+        print(f"❌ Rejected {len(result.rejected):,} rows:")
+        for name, error in result.rejected[:10]:
+            print(f"   - {name[:60]}: {error}")
+    print(f"⏱️  {result.seconds:.2f}s, {result.requests} requests ({rate:,.0f} rows/sec)")
+
+
+def reconcile_foods(client: Callable) -> Optional[Dict]:
+    """Map new and changed foods_indian rows into foods; None (after a warning) if that failed"""
+    try:
+        data = client().rpc(RECONCILE_RPC, {}).execute().data
+    except Exception as e:
+        print(f"⚠️  Could not reconcile foods_indian into foods: {str(e)[:200]}")
+        return None
+    counts = data[0] if isinstance(data, list) else data
+    print(f"🔗 foods: {counts['inserted']:,} new, {counts['refreshed']:,} refreshed, "
+          f"{counts['mapped']:,} mappings written")
+    return counts
+
+
+def load_file(path: str, source: Optional[str] = None, client: Optional[Callable] = None,
+              batch_rows: int = BATCH_ROWS, workers: int = WORKERS) -> LoadResult:
+    """Read, prepare and upsert one IFCT export, then reconcile it into foods"""
+    records, skipped = prepare(read_foods(path), source)
+    print(f"📊 {len(records):,} foods from {Path(path).name} "
+          f"({batch_rows} rows per request, {workers} concurrent)")
+    client = client or create_client_factory()
+    result = upsert_foods(records, client, batch_rows, workers)
+    print_result(result, skipped)
+    if result.inserted + result.updated:
+        reconcile_foods(client)
+    return result
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Devanagari to Latin transliteration for food search.
+
+Produces the plain, diacritic-free spellings people actually type
+("basmati chaval", "gehun ka ata") rather than a scholarly scheme, so
+transliterated names can be matched by English-keyboard prefix search.
+"""
+
+import re
+from typing import List, Optional
+
+VIRAMA = '्'
+NUKTA = '़'
+
+CONSONANTS = {
+    'क': 'k', 'ख': 'kh', 'ग': 'g', 'घ': 'gh', 'ङ': 'n',
+    'च': 'ch', 'छ': 'chh', 'ज': 'j', 'झ': 'jh', 'ञ': 'n',
+    'ट': 't', 'ठ': 'th', 'ड': 'd', 'ढ': 'dh', 'ण': 'n',
+    'त': 't', 'थ': 'th', 'द': 'd', 'ध': 'dh', 'न': 'n',
+    'प': 'p', 'फ': 'ph', 'ब': 'b', 'भ': 'bh', 'म': 'm',
+    'य': 'y', 'र': 'r', 'ल': 'l', 'व': 'v', 'श': 'sh',
+    'ष': 'sh', 'स': 's', 'ह': 'h', 'ळ': 'l',
+    'क़': 'q', 'ख़': 'kh', 'ग़': 'g', 'ज़': 'z', 'ड़': 'r',
+    'ढ़': 'rh', 'फ़': 'f', 'य़': 'y',
+}
+
+# Consonant + nukta written as two code points
+NUKTA_FORMS = {'क': 'q', 'ख': 'kh', 'ग': 'g', 'ज': 'z', 'ड': 'r', 'ढ': 'rh', 'फ': 'f', 'य': 'y'}
+
+VOWELS = {
+    'अ': 'a', 'आ': 'a', 'इ': 'i', 'ई': 'i', 'उ': 'u', 'ऊ': 'u',
+    'ऋ': 'ri', 'ए': 'e', 'ऐ': 'ai', 'ओ': 'o', 'औ': 'au', 'ऑ': 'o', 'ऍ': 'e',
+}
+
+MATRAS = {
+    'ा': 'a', 'ि': 'i', 'ी': 'i', 'ु': 'u', 'ू': 'u', 'ृ': 'ri',
+    'े': 'e', 'ै': 'ai', 'ो': 'o', 'ौ': 'au', 'ॉ': 'o', 'ॅ': 'e',
+}
+
+NASALS = {'ं': 'n', 'ँ': 'n', 'ः': 'h'}
+
+DIGITS = {chr(0x0966 + i): str(i) for i in range(10)}
+
+DEVANAGARI_RE = re.compile(r'[ऀ-ॿ]')
+
+
+def has_devanagari(text: Optional[str]) -> bool:
+    """Return True if text contains any Devanagari characters."""
+    return bool(text) and bool(DEVANAGARI_RE.search(text))
+
+
+def _transliterate_word(word: str) -> str:
+    # Each unit is [latin_consonant, vowel] where vowel is None (virama),
+    # 'a' with inherent=True, or an explicit vowel sign
+    units: List[List] = []
+    out: List = []
+    i = 0
+    while i < len(word):
+        ch = word[i]
+        nxt = word[i + 1] if i + 1 < len(word) else ''
+
+        if ch in CONSONANTS:
+            latin = CONSONANTS[ch]
+            if nxt == NUKTA and ch in NUKTA_FORMS:
+                latin = NUKTA_FORMS[ch]
+                i += 1
+            unit = [latin, 'a', True]
+            units.append(unit)
+            out.append(unit)
+        elif ch in MATRAS and units:
+            units[-1][1] = MATRAS[ch]
+            units[-1][2] = False
+        elif ch == VIRAMA and units:
+            units[-1][1] = ''
+            units[-1][2] = False
+        elif ch in VOWELS:
+            unit = ['', VOWELS[ch], False]
+            units.append(unit)
+            out.append(unit)
+        elif ch in NASALS:
+            out.append(NASALS[ch])
+        elif ch in DIGITS:
+            out.append(DIGITS[ch])
+        elif ch != NUKTA:
+            out.append(ch)
+        i += 1
+
+    # Schwa deletion: drop the word-final inherent 'a', then any medial inherent
+    # 'a' that sits between a vowel-final unit and a consonant + vowel (VC_CV)
+    if len(units) > 1 and units[-1][2]:
+        units[-1][1] = ''
+    for idx in range(1, len(units) - 1):
+        unit = units[idx]
+        if unit[2] and unit[1] and units[idx - 1][1] and units[idx + 1][0] and units[idx + 1][1]:
+            unit[1] = ''
+
+    return ''.join(part if isinstance(part, str) else part[0] + part[1] for part in out)
+
+
+def transliterate_devanagari(text: Optional[str]) -> str:
+    """Transliterate Devanagari text to lowercase Latin; other text passes through."""
+    if not text:
+        return ''
+    words = re.split(r'(\s+)', text.strip())
+    return ''.join(_transliterate_word(w) if has_devanagari(w) else w for w in words).lower()
@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+"""
+Blocked fuzzy deduplication of food records from overlapping extractions.
+
+Names are normalized (case, punctuation, OCR dashes) and every record is
+indexed under blocking keys: the Soundex code and the 3-letter prefix of
+each name token. Only records sharing two keys are compared. A key shared by
+more than DEDUP_MAX_BLOCK records ("raw", "rice", ...) is too common to
+compare all-pairs, so its block is sorted on the rest of each name (the words
+that did not produce the key) and each record is paired with its next
+DEDUP_WINDOW neighbours only (sorted neighbourhood). The number of comparisons
+grows with block size, never with the square of the dataset, and no record
+loses a key.
+
+Within a block a pair scores on name similarity (SequenceMatcher over the
+normalized and token-sorted names) and, where both records have values,
+per-100 g nutrient agreement. Pairs at or above DEDUP_THRESHOLD are joined
+into clusters, and each cluster becomes one canonical record: the values of
+its best record by food_quality.quality_score, gaps filled from the others,
+plus provenance (every source row and name variant that was merged).
+
+Environment:
+  DEDUP_THRESHOLD   match score 0..1 (default 0.82)
+  DEDUP_MAX_BLOCK   largest block compared all-pairs (default 200)
+  DEDUP_WINDOW      neighbours paired per record in larger blocks (default 20)
+"""
+
+import os
+import re
+import unicodedata
+from collections import Counter, defaultdict
+from difflib import SequenceMatcher
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+from food_quality import NUTRIENT_FIELDS, atwater_residual, per_100g, quality_score
+
+THRESHOLD = float(os.getenv("DEDUP_THRESHOLD", "0.82"))
+MAX_BLOCK = int(os.getenv("DEDUP_MAX_BLOCK", "200"))
+WINDOW = int(os.getenv("DEDUP_WINDOW", "20"))
+
+# A pair is compared when it shares this many blocking keys: both keys of one word
+# ("ric" / "rice"), or one key each of two words. A single shared Soundex code is
+# too weak a signal to pay for a comparison.
+MIN_SHARED_KEYS = 2
+
+# Two name words with the same first letter are spellings of the same word at this
+# SequenceMatcher ratio (OCR: "prboe" ~ "parboiled", but "whole" !~ "omlet")
+TOKEN_MATCH = 0.6
+
+SOUNDEX_CODES = {
+    **dict.fromkeys('bfpv', '1'), **dict.fromkeys('cgjkqsxz', '2'),
+    **dict.fromkeys('dt', '3'), 'l': '4', **dict.fromkeys('mn', '5'), 'r': '6',
+}
+
+
+class Candidate(NamedTuple):
+    source: str                 # file the record came from
+    line: int                   # CSV line (header is line 1)
+    priority: float             # 0..1, trust in the source
+    record: Dict
+    tokens: Tuple[str, ...]     # normalized name tokens
+    values: Dict                # per-100 g nutrients
+
+
+class Cluster(NamedTuple):
+    record: Dict                # canonical record with provenance columns
+    members: List[Candidate]
+
+
+def normalize_name(name: str) -> Tuple[str, ...]:
+    """Lowercase ASCII name tokens; OCR dashes, quotes and punctuation are separators"""
+    name = unicodedata.normalize('NFKD', name or '').encode('ascii', 'ignore').decode().lower()
+    # Numbers of 3+ digits are table values the OCR ran into the name, not variety numbers
+    return tuple(t for t in re.findall(r'[a-z]+|\d+', name) if not (t.isdigit() and len(t) > 2))
+
+
+def display_name(name: str) -> str:
+    """Original name without leading OCR debris ("— Rajmah, black" -> "Rajmah, black")"""
+    name = re.sub(r'\s+', ' ', name or '').strip()
+    name = re.sub(r'(\s+[\d.]+)*\s+\d{3,}[\d.\s]*$', '', name)
+    return re.sub(r'^[^\w(]+', '', name).strip(' ,-')
+
+
+def is_food_name(tokens: Tuple[str, ...]) -> bool:
+    """At least one real word, and more words than numbers (drops OCR'd number rows)"""
+    words = [t for t in tokens if t.isalpha() and len(t) >= 3]
+    numbers = [t for t in tokens if t.isdigit()]
+    return bool(words) and len(words) > len(numbers)
+
+
+def soundex(token: str) -> str:
+    code, last = token[0], SOUNDEX_CODES.get(token[0], '')
+    for ch in token[1:]:
+        digit = SOUNDEX_CODES.get(ch, '')
+        if digit and digit != last:
+            code += digit
+        if ch not in 'hw':
+            last = digit
+    return (code + '000')[:4]
+
+
+def blocking_keys(tokens: Tuple[str, ...]) -> Set[str]:
+    keys = set()
+    for token in tokens:
+        if token.isalpha() and len(token) >= 3:
+            keys.add('s:' + soundex(token))
+            keys.add('p:' + token[:3])
+    return keys
+
+
+def _block_pairs(members: List[int]) -> Iterable[Tuple[int, int]]:
+    for a in range(len(members)):
+        for b in range(a + 1, len(members)):
+            yield members[a], members[b]
+
+
+def _neighbourhood_pairs(key: str, members: List[int], candidates: List[Candidate],
+                         token_keys: Dict[str, Set[str]], window: int) -> Set[Tuple[int, int]]:
+    """Pairs of each record with its next window records, sorted on the words not behind key
+
+    Two passes, the words in ascending and then descending order, so a typo in
+    the word that leads one ordering does not separate a pair in both.
+    """
+    rest = {i: sorted(t for t in candidates[i].tokens if key not in token_keys[t]) for i in members}
+    pairs = set()
+    for descending in (False, True):
+        order = sorted(members, key=lambda i: (' '.join(rest[i][::-1] if descending else rest[i]), i))
+        for pos, a in enumerate(order):
+            for b in order[pos + 1:pos + 1 + window]:
+                pairs.add((a, b) if a < b else (b, a))
+    return pairs
+
+
+def candidate_pairs(candidates: List[Candidate], max_block: int = MAX_BLOCK,
+                    window: int = WINDOW) -> Tuple[Set[Tuple[int, int]], int]:
+    """(index pairs sharing MIN_SHARED_KEYS blocking keys, blocks too large for all-pairs)"""
+    token_keys = {t: blocking_keys((t,)) for c in candidates for t in set(c.tokens)}
+    blocks: Dict[str, List[int]] = defaultdict(list)
+    for i, candidate in enumerate(candidates):
+        for key in set().union(*(token_keys[t] for t in candidate.tokens)):
+            blocks[key].append(i)
+    shared: Counter = Counter()
+    windowed = 0
+    for key, members in blocks.items():
+        if len(members) > max_block:
+            windowed += 1
+            shared.update(_neighbourhood_pairs(key, members, candidates, token_keys, window))
+        else:
+            shared.update(_block_pairs(members))
+    return {pair for pair, count in shared.items() if count >= MIN_SHARED_KEYS}, windowed
+
+
+def nutrient_agreement(a: Dict, b: Dict) -> Optional[float]:
+    """Mean 1 - relative difference over nutrients both have, None if none shared"""
+    scores = []
+    for field in NUTRIENT_FIELDS:
+        x, y = a.get(field), b.get(field)
+        if x is not None and y is not None:
+            scores.append(1 - abs(x - y) / max(abs(x), abs(y), 1.0))
+    return sum(scores) / len(scores) if scores else None
+
+
+def _unmatched_words(tokens: Tuple[str, ...], others: Tuple[str, ...]) -> List[str]:
+    """Words of tokens with no spelling in others within TOKEN_MATCH"""
+    return [t for t in tokens if t.isalpha() and len(t) >= 3
+            and not any(o[0] == t[0] and SequenceMatcher(None, t, o).ratio() >= TOKEN_MATCH for o in others)]
+
+
+def contradicts(a: Candidate, b: Candidate) -> bool:
+    """Names that cannot be the same food, however similar they look"""
+    # Numbered varieties (Brinjal-1, Brinjal-2, ...) are different foods
+    digits_a = {t for t in a.tokens if t.isdigit()}
+    digits_b = {t for t in b.tokens if t.isdigit()}
+    if digits_a and digits_b and digits_a != digits_b:
+        return True
+    # So are names that each have a word the other lacks ("Radish white" / "Radish red");
+    # one name adding words ("Rajmah black" / "Rajmah black dry") is still a match
+    return bool(_unmatched_words(a.tokens, b.tokens) and _unmatched_words(b.tokens, a.tokens))
+
+
+def similarity(a: Candidate, b: Candidate, threshold: float = 0.0) -> float:
+    """Match score 0..1; pairs that cannot reach threshold may return early with 0"""
+    nutrients = nutrient_agreement(a.values, b.values)
+    weight, rest = (1.0, 0.0) if nutrients is None else (0.75, 0.25 * nutrients)
+    matcher = SequenceMatcher(None, ' '.join(sorted(a.tokens)), ' '.join(sorted(b.tokens)))
+    # quick_ratio is an upper bound of ratio for any token order
+    if weight * matcher.quick_ratio() + rest < threshold or contradicts(a, b):
+        return 0.0
+    name = max(matcher.ratio(), SequenceMatcher(None, ' '.join(a.tokens), ' '.join(b.tokens)).ratio())
+    return weight * name + rest
+
+
+def make_candidate(record: Dict, source: str, line: int, priority: float) -> Optional[Candidate]:
+    tokens = normalize_name(record.get('name', ''))
+    if not is_food_name(tokens):
+        return None
+    return Candidate(source, line, priority, record, tokens, per_100g(record))
+
+
+def _find(parent: List[int], i: int) -> int:
+    while parent[i] != i:
+        parent[i] = parent[parent[i]]
+        i = parent[i]
+    return i
+
+
+def cluster(candidates: List[Candidate], threshold: float = THRESHOLD,
+            max_block: int = MAX_BLOCK) -> Tuple[List[List[Candidate]], Dict[str, int]]:
+    """(clusters of matching candidates, stats: pairs compared, matches, windowed blocks)"""
+    pairs, windowed = candidate_pairs(candidates, max_block)
+    scored = [(similarity(candidates[a], candidates[b], threshold), a, b) for a, b in pairs]
+    parent = list(range(len(candidates)))
+    members = {i: [i] for i in range(len(candidates))}
+    matches = 0
+    # Best matches first, and never join clusters holding contradicting names, so a
+    # shorter name ("Egg hen whole") cannot chain "... whole raw" to "... whole omlet"
+    for score, a, b in sorted(scored, reverse=True):
+        if score < threshold:
+            break
+        root_a, root_b = _find(parent, a), _find(parent, b)
+        if root_a == root_b:
+            continue
+        if any(contradicts(candidates[x], candidates[y]) for x in members[root_a] for y in members[root_b]):
+            continue
+        matches += 1
+        parent[root_a] = root_b
+        members[root_b].extend(members.pop(root_a))
+    groups: Dict[int, List[Candidate]] = defaultdict(list)
+    for i, candidate in enumerate(candidates):
+        groups[_find(parent, i)].append(candidate)
+    return list(groups.values()), {'compared': len(pairs), 'matches': matches, 'blocks_windowed': windowed}
+
+
+def merge_cluster(members: List[Candidate]) -> Cluster:
+    """Best record's values, gaps filled (rescaled) from the next best, plus provenance"""
+    ranked = sorted(members, key=lambda c: quality_score(c.values, c.priority), reverse=True)
+    best = ranked[0]
+    record = dict(best.record)
+    serving = float(record.get('serving_size_g') or 100)
+    for field in NUTRIENT_FIELDS:
+        if best.values[field] is None:
+            fill = next((c.values[field] for c in ranked[1:] if c.values[field] is not None), None)
+            record[field] = None if fill is None else round(fill * serving / 100, 2)
+    # The most trusted source spells the name best; OCR sources only break ties by quality
+    named = max(members, key=lambda c: (c.priority, quality_score(c.values, c.priority)))
+    record['name'] = display_name(named.record['name'])
+    residual = atwater_residual(per_100g(record))
+    record.update({
+        'quality': round(quality_score(per_100g(record), best.priority), 3),
+        'atwater_residual': None if residual is None else round(residual, 3),
+        'chosen_from': f"{best.source}:{best.line}",
+        'merged_from': ';'.join(f"{c.source}:{c.line}" for c in ranked),
+        'name_variants': '|'.join(dict.fromkeys(display_name(c.record['name']) for c in ranked)),
+    })
+    return Cluster(record, ranked)
+
+
+def unique_by_name(clusters: List[Cluster]) -> Tuple[List[Cluster], int]:
+    """(one cluster per display name, clusters folded away)
+
+    Rows with the same name whose nutrients disagree score below the threshold
+    and stay separate clusters, but foods_indian is unique by name. The best
+    cluster by quality is kept whole; the others only add their rows to its
+    provenance, so the canonical values always come from one source row.
+    """
+    by_name: Dict[str, List[Cluster]] = defaultdict(list)
+    for c in clusters:
+        by_name[c.record['name'].lower()].append(c)
+    unique, folded = [], 0
+    for same in by_name.values():
+        same.sort(key=lambda c: c.record['quality'], reverse=True)
+        best = same[0]
+        if len(same) > 1:
+            folded += len(same) - 1
+            members = [m for c in same for m in c.members]
+            record = dict(best.record)
+            record['merged_from'] = ';'.join(f"{m.source}:{m.line}" for m in members)
+            record['name_variants'] = '|'.join(dict.fromkeys(
+                v for c in same for v in c.record['name_variants'].split('|')))
+            best = Cluster(record, members)
+        unique.append(best)
+    return unique, folded
+
+
+def dedupe(candidates: Iterable[Candidate], threshold: float = THRESHOLD,
+           max_block: int = MAX_BLOCK) -> Tuple[List[Cluster], Dict[str, int]]:
+    """Canonical records, unique and sorted by name, and matching stats"""
+    groups, stats = cluster(list(candidates), threshold, max_block)
+    merged, stats['name_collisions'] = unique_by_name([merge_cluster(group) for group in groups])
+    return sorted(merged, key=lambda c: c.record['name'].lower()), stats
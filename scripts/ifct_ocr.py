@@ -0,0 +1,769 @@
+#!/usr/bin/env python3
+"""
+Shared page rendering and OCR for the IFCT extractors.
+
+Pages are rendered and OCR'd independently, so a full-document pass can run
+on a process pool (one tesseract per core) while the caller still receives
+(page_num, text) in page order for parsing.
+
+Pages are rasterized a small window at a time (first_page/last_page), never
+the whole PDF up front, so peak memory is one window of images and OCR of the
+first page starts after a single render.
+
+OCR output (raw text and image_to_data TSV) is cached on disk, keyed by the
+PDF's sha256, page, DPI, preprocessing, language, OCR engine, tesseract
+version and config. Re-running any extractor with an unchanged configuration skips both
+rendering and tesseract, so parsers can be iterated against cached output.
+
+With regions='tables', each page is split into table crops (ruled grid
+boxes, else bands of full-width rows) and only those are OCR'd, skipping
+titles, headers and footers. Word boxes in the TSV stay in page coordinates.
+
+With refine_dpi set, OCR is two-pass: the page is read at the base DPI, and
+only text lines whose mean word confidence is below min_conf are re-rendered
+at refine_dpi and re-read as single lines. Clean pages cost one low-DPI pass.
+
+Pages that already carry a usable text layer skip OCR entirely: page_texts()
+and extract_pages() read them with pdfplumber (milliseconds per page) and only
+send image-only pages to tesseract, reporting the path each page took.
+
+Two OCR engines share one interface: tesserocr runs libtesseract in-process
+and keeps a loaded model per thread (pages then run on a thread pool), and
+pytesseract, the fallback, spawns the tesseract CLI per call.
+
+Time spent per stage (render, regions, preprocess, ocr, text_layer) and cache
+hits/misses are accumulated in STAGE_SECONDS / STAGE_CALLS for benchmarks;
+pool workers keep their own counters, so measure with workers=1.
+
+Environment:
+  IFCT_OCR_ENGINE     auto (default: tesserocr if installed), tesserocr or pytesseract
+  IFCT_OCR_WORKERS    OCR processes or threads (default: one per CPU core)
+  IFCT_RENDER_WINDOW  pages rasterized per render call (default 2)
+  IFCT_OCR_CACHE      cache directory (default build/ocr-cache), "off" disables
+  IFCT_CROP_WORKERS   threads OCR'ing the table crops of one page (default 1)
+  IFCT_REFINE_DPI     second-pass DPI the extractors use for weak lines (default 300, 0 disables)
+"""
+
+import hashlib
+import inspect
+import json
+import os
+import shlex
+import tempfile
+import threading
+import time
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+import pytesseract
+from PIL import Image
+from pdf2image import convert_from_path, pdfinfo_from_path
+
+try:
+    import tesserocr
+except ImportError:
+    tesserocr = None
+
+try:
+    import pdfplumber
+except ImportError:
+    pdfplumber = None
+
+DEFAULT_LANG = 'eng'
+OCR_ENGINE = os.getenv('IFCT_OCR_ENGINE', 'auto')
+RENDER_WINDOW = int(os.getenv('IFCT_RENDER_WINDOW', '2'))
+CROP_WORKERS = int(os.getenv('IFCT_CROP_WORKERS', '1'))
+REFINE_DPI = int(os.getenv('IFCT_REFINE_DPI', '300'))
+CACHE_DIR = os.getenv('IFCT_OCR_CACHE', str(Path(__file__).resolve().parent.parent / 'build' / 'ocr-cache'))
+
+
+STAGE_SECONDS: Dict[str, float] = defaultdict(float)
+STAGE_CALLS: Counter = Counter()
+
+
+@contextmanager
+def timed(stage: str):
+    """Add the wall time of the block to STAGE_SECONDS[stage]."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        STAGE_SECONDS[stage] += time.perf_counter() - start
+        STAGE_CALLS[stage] += 1
+
+
+def reset_stage_stats() -> None:
+    STAGE_SECONDS.clear()
+    STAGE_CALLS.clear()
+
+
+class PageOCR(NamedTuple):
+    text: str   # image_to_string output
+    tsv: str    # image_to_data output (word boxes and confidences)
+
+
+class OCROptions(NamedTuple):
+    lang: str = DEFAULT_LANG
+    preprocess: Optional[str] = None    # key of PREPROCESSORS
+    config: str = ''                    # tesseract options, e.g. "--psm 6"
+    engine: Optional[str] = None        # key of ENGINES, default IFCT_OCR_ENGINE
+    regions: Optional[str] = None       # key of REGION_DETECTORS, default whole page
+    refine_dpi: Optional[int] = None    # re-read low-confidence lines at this DPI
+    min_conf: float = 60.0              # mean word confidence (0-100) a line needs to be kept
+
+
+def enhance_image(image):
+    """Grayscale, binarize and close small gaps for cleaner table OCR."""
+    import cv2
+    import numpy as np
+    gray = cv2.cvtColor(np.array(image), cv2.COLOR_RGB2GRAY)
+    _, thresh = cv2.threshold(gray, 150, 255, cv2.THRESH_BINARY)
+    kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (2, 2))
+    return cv2.morphologyEx(thresh, cv2.MORPH_CLOSE, kernel)
+
+
+# Named so they can be passed to pool workers and recorded in cache keys
+PREPROCESSORS: Dict[str, Callable] = {
+    'enhance': enhance_image,
+}
+
+
+# ==================== TABLE REGIONS ====================
+
+TABLE_MIN_WIDTH = 0.5   # fraction of the page width a table (or table row) spans
+REGION_PAD = 6          # pixels kept around each crop
+
+
+def _row_bands(ink, min_pixels: int) -> List[Tuple[int, int]]:
+    """[start, end) runs of image rows holding at least min_pixels of ink."""
+    rows = (ink > 0).sum(axis=1) >= min_pixels
+    bands, start = [], None
+    for y, filled in enumerate(rows):
+        if filled and start is None:
+            start = y
+        elif not filled and start is not None:
+            bands.append((start, y))
+            start = None
+    if start is not None:
+        bands.append((start, len(rows)))
+    return bands
+
+
+def detect_table_regions(image) -> List[Tuple[int, int, int, int]]:
+    """Table boxes (x, y, w, h) on a page, top to bottom.
+
+    Ruled tables are found from their long horizontal/vertical strokes. Pages
+    without rules fall back to row bands: lines of text spanning at least
+    TABLE_MIN_WIDTH of the page, merged when only a small gap separates them.
+    Titles, running headers and page numbers are narrow and get dropped.
+    """
+    import cv2
+    import numpy as np
+    gray = np.array(image.convert('L')) if isinstance(image, Image.Image) else np.asarray(image)
+    height, width = gray.shape[:2]
+    ink = cv2.adaptiveThreshold(gray, 255, cv2.ADAPTIVE_THRESH_MEAN_C, cv2.THRESH_BINARY_INV, 15, 10)
+
+    horizontal = cv2.morphologyEx(ink, cv2.MORPH_OPEN,
+                                  cv2.getStructuringElement(cv2.MORPH_RECT, (max(width // 30, 1), 1)))
+    vertical = cv2.morphologyEx(ink, cv2.MORPH_OPEN,
+                                cv2.getStructuringElement(cv2.MORPH_RECT, (1, max(height // 30, 1))))
+    grid = cv2.dilate(cv2.bitwise_or(horizontal, vertical), np.ones((3, 3), np.uint8))
+    contours, _ = cv2.findContours(grid, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+    boxes = [cv2.boundingRect(c) for c in contours]
+    boxes = [b for b in boxes if b[2] >= width * TABLE_MIN_WIDTH and b[3] >= height * 0.05]
+    if boxes:
+        return sorted(boxes, key=lambda b: (b[1], b[0]))
+
+    regions: List[List[int]] = []
+    max_gap = max(height // 50, 1)
+    for y0, y1 in _row_bands(ink, max(width // 200, 1)):
+        cols = np.flatnonzero((ink[y0:y1] > 0).any(axis=0))
+        if cols[-1] - cols[0] < width * TABLE_MIN_WIDTH:
+            continue
+        if regions and y0 - regions[-1][3] <= max_gap:
+            region = regions[-1]
+            region[0], region[2], region[3] = min(region[0], cols[0]), max(region[2], cols[-1]), y1
+        else:
+            regions.append([cols[0], y0, cols[-1], y1])
+
+    boxes = []
+    for x0, y0, x1, y1 in regions:
+        x0, y0 = max(x0 - REGION_PAD, 0), max(y0 - REGION_PAD, 0)
+        x1, y1 = min(x1 + REGION_PAD, width), min(y1 + REGION_PAD, height)
+        boxes.append((int(x0), int(y0), int(x1 - x0), int(y1 - y0)))
+    return boxes
+
+
+REGION_DETECTORS: Dict[str, Callable] = {
+    'tables': detect_table_regions,
+}
+
+
+# ==================== ENGINES ====================
+
+TSV_HEADER = 'level\tpage_num\tblock_num\tpar_num\tline_num\tword_num\tleft\ttop\twidth\theight\tconf\ttext'
+
+
+class PytesseractEngine:
+    """tesseract CLI via pytesseract: one subprocess and temp image per call."""
+
+    name = 'pytesseract'
+    in_process = False
+
+    def version(self) -> str:
+        return str(pytesseract.get_tesseract_version())
+
+    def recognize(self, image, lang: str, config: str) -> PageOCR:
+        return PageOCR(
+            pytesseract.image_to_string(image, lang=lang, config=config),
+            pytesseract.image_to_data(image, lang=lang, config=config),
+        )
+
+
+class TesserocrEngine:
+    """libtesseract in-process via tesserocr, one loaded API per thread, lang and config."""
+
+    name = 'tesserocr'
+    in_process = True
+
+    def __init__(self):
+        self._local = threading.local()
+
+    def version(self) -> str:
+        # "tesseract 5.3.0\n leptonica-..." -> "5.3.0", comparable with the CLI version
+        return tesserocr.tesseract_version().split()[1]
+
+    def _api(self, lang: str, config: str):
+        apis = self._local.__dict__.setdefault('apis', {})
+        if (lang, config) not in apis:
+            psm, oem, variables = parse_config(config)
+            api = tesserocr.PyTessBaseAPI(
+                lang=lang,
+                psm=tesserocr.PSM.AUTO if psm is None else psm,
+                oem=tesserocr.OEM.DEFAULT if oem is None else oem,
+            )
+            for name, value in variables.items():
+                api.SetVariable(name, value)
+            apis[(lang, config)] = api
+        return apis[(lang, config)]
+
+    def recognize(self, image, lang: str, config: str) -> PageOCR:
+        api = self._api(lang, config)
+        api.SetImage(image if isinstance(image, Image.Image) else Image.fromarray(image))
+        text = api.GetUTF8Text()
+        # Same columns as image_to_data; the CLI numbers pages from 1
+        tsv = TSV_HEADER + '\n' + api.GetTSVText(0).rstrip('\n')
+        return PageOCR(text, tsv)
+
+
+def parse_config(config: str) -> Tuple[Optional[int], Optional[int], Dict[str, str]]:
+    """Split a pytesseract config string into (psm, oem, -c variables)."""
+    psm = oem = None
+    variables: Dict[str, str] = {}
+    tokens = shlex.split(config)
+    while tokens:
+        flag = tokens.pop(0)
+        if flag == '--psm' and tokens:
+            psm = int(tokens.pop(0))
+        elif flag == '--oem' and tokens:
+            oem = int(tokens.pop(0))
+        elif flag == '-c' and tokens and '=' in tokens[0]:
+            name, value = tokens.pop(0).split('=', 1)
+            variables[name] = value
+        else:
+            raise ValueError(f"Unsupported tesseract option for tesserocr: {flag}")
+    return psm, oem, variables
+
+
+ENGINES = {
+    'pytesseract': PytesseractEngine,
+    'tesserocr': TesserocrEngine,
+}
+
+
+@lru_cache(maxsize=None)
+def get_engine(name: Optional[str] = None):
+    """Engine by name; 'auto' prefers tesserocr and falls back to pytesseract."""
+    name = name or OCR_ENGINE
+    if name == 'auto':
+        name = 'tesserocr' if tesserocr is not None else 'pytesseract'
+    if name not in ENGINES:
+        raise ValueError(f"Unknown OCR engine {name!r} (expected one of {', '.join(ENGINES)} or auto)")
+    if name == 'tesserocr' and tesserocr is None:
+        raise RuntimeError("tesserocr not installed. Install with: pip install tesserocr")
+    return ENGINES[name]()
+
+
+def default_workers() -> int:
+    """Worker count from IFCT_OCR_WORKERS, else one per CPU core."""
+    return int(os.getenv('IFCT_OCR_WORKERS', '0')) or os.cpu_count() or 1
+
+
+def page_count(pdf_path: str) -> int:
+    return int(pdfinfo_from_path(pdf_path)['Pages'])
+
+
+def page_range(pdf_path: str, start_page: int = 1, end_page: Optional[int] = None) -> List[int]:
+    """1-based page numbers from start_page to end_page, clamped to the PDF."""
+    last = page_count(pdf_path)
+    return list(range(max(start_page, 1), min(end_page or last, last) + 1))
+
+
+def render_pages(pdf_path: str, pages: Sequence[int], dpi: int,
+                 window: Optional[int] = None) -> Iterator[Tuple[int, Image.Image]]:
+    """Yield (page_num, image) for each page, rendering `window` pages at a time.
+
+    Each window covers consecutive pages only, and its images are released
+    before the next window is rasterized.
+    """
+    window = max(window or RENDER_WINDOW, 1)
+    i = 0
+    while i < len(pages):
+        chunk = [pages[i]]
+        while (len(chunk) < window and i + len(chunk) < len(pages)
+               and pages[i + len(chunk)] == chunk[-1] + 1):
+            chunk.append(pages[i + len(chunk)])
+        with timed('render'):
+            images = convert_from_path(pdf_path, dpi=dpi, first_page=chunk[0], last_page=chunk[-1])
+        for page_num, image in zip(chunk, images):
+            yield page_num, image
+            image.close()
+        del images
+        i += len(chunk)
+
+
+# ==================== OCR CACHE ====================
+
+def cache_enabled() -> bool:
+    return CACHE_DIR.lower() not in ('', '0', 'off', 'false', 'no')
+
+
+@lru_cache(maxsize=None)
+def pdf_sha256(pdf_path: str) -> str:
+    digest = hashlib.sha256()
+    with open(pdf_path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+@lru_cache(maxsize=None)
+def _fingerprint(stage: Optional[Callable]) -> str:
+    """Stage name plus a hash of its source, so edits invalidate entries."""
+    if stage is None:
+        return 'none'
+    source = inspect.getsource(stage)
+    return f"{stage.__name__}:{hashlib.sha256(source.encode('utf-8')).hexdigest()[:12]}"
+
+
+def cache_key(pdf_path: str, page_num: int, dpi: int, options: OCROptions) -> Dict:
+    ocr_engine = get_engine(options.engine)
+    return {
+        'pdf_sha256': pdf_sha256(pdf_path),
+        'page': page_num,
+        'dpi': dpi,
+        'preprocess': _fingerprint(PREPROCESSORS[options.preprocess] if options.preprocess else None),
+        'regions': _fingerprint(REGION_DETECTORS[options.regions] if options.regions else None),
+        'refine': f"{options.refine_dpi}@{options.min_conf}" if options.refine_dpi else 'none',
+        'lang': options.lang,
+        'engine': ocr_engine.name,
+        'tesseract': ocr_engine.version(),
+        'config': options.config,
+    }
+
+
+def _cache_path(key: Dict) -> Path:
+    digest = hashlib.sha256(json.dumps(key, sort_keys=True).encode('utf-8')).hexdigest()
+    return Path(CACHE_DIR) / digest[:2] / f"{digest}.json"
+
+
+def cache_get(key: Dict) -> Optional[PageOCR]:
+    path = _cache_path(key)
+    try:
+        entry = json.loads(path.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        STAGE_CALLS['cache_miss'] += 1
+        return None
+    hit = entry.get('key') == key
+    STAGE_CALLS['cache_hit' if hit else 'cache_miss'] += 1
+    return PageOCR(entry['text'], entry['tsv']) if hit else None
+
+
+def cache_put(key: Dict, result: PageOCR) -> None:
+    path = _cache_path(key)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Write-then-rename so concurrent workers never see a partial entry
+    fd, tmp = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+    with os.fdopen(fd, 'w', encoding='utf-8') as f:
+        json.dump({'key': key, 'text': result.text, 'tsv': result.tsv}, f)
+    os.replace(tmp, path)
+
+
+# ==================== TSV ====================
+
+class TSVRow(NamedTuple):
+    level: int      # 1 page, 2 block, 3 paragraph, 4 line, 5 word
+    page_num: int
+    block_num: int
+    par_num: int
+    line_num: int
+    word_num: int
+    left: int
+    top: int
+    width: int
+    height: int
+    conf: float     # -1 for non-word rows
+    text: str
+
+    @property
+    def line_key(self) -> Tuple[int, int, int]:
+        return self.block_num, self.par_num, self.line_num
+
+
+def parse_tsv(tsv: str) -> List[TSVRow]:
+    rows = []
+    for line in tsv.splitlines()[1:]:
+        cols = line.split('\t')
+        if len(cols) < 12:
+            continue
+        rows.append(TSVRow(*(int(c) for c in cols[:10]), float(cols[10]), '\t'.join(cols[11:])))
+    return rows
+
+
+def format_tsv(rows: Sequence[TSVRow]) -> str:
+    lines = [TSV_HEADER]
+    for row in rows:
+        conf = int(row.conf) if row.conf == int(row.conf) else row.conf
+        lines.append('\t'.join(str(v) for v in (*row[:10], conf, row.text)))
+    return '\n'.join(lines)
+
+
+def tsv_text(rows: Sequence[TSVRow]) -> str:
+    """Plain text from word rows: one line per TSV line, a blank line between blocks."""
+    out: List[str] = []
+    words: List[str] = []
+    current, block = None, None
+    for row in rows:
+        if row.level != 5 or not row.text.strip():
+            continue
+        if row.line_key != current:
+            if words:
+                out.append(' '.join(words))
+            if block is not None and row.block_num != block:
+                out.append('')
+            words, current, block = [], row.line_key, row.block_num
+        words.append(row.text)
+    if words:
+        out.append(' '.join(words))
+    return '\n'.join(out) + '\n' if out else ''
+
+
+def tsv_table(tsv: str, gap_ratio: float = 1.0) -> List[List[str]]:
+    """Table rows from word boxes: each TSV line split into cells wherever the
+    horizontal gap between words exceeds gap_ratio x the line's word height."""
+    lines: Dict[Tuple[int, int, int], List[TSVRow]] = {}
+    for row in parse_tsv(tsv):
+        if row.level == 5 and row.text.strip():
+            lines.setdefault(row.line_key, []).append(row)
+    table = []
+    for words in lines.values():
+        words.sort(key=lambda w: w.left)
+        height = max(w.height for w in words)
+        cells = [[words[0].text]]
+        for prev, word in zip(words, words[1:]):
+            if word.left - (prev.left + prev.width) > height * gap_ratio:
+                cells.append([])
+            cells[-1].append(word.text)
+        table.append([' '.join(cell) for cell in cells])
+    return table
+
+
+def _mean_conf(words: Sequence[TSVRow]) -> float:
+    scored = [w.conf for w in words if w.conf >= 0]
+    return sum(scored) / len(scored) if scored else -1.0
+
+
+# ==================== OCR ====================
+
+def _merge_regions(results: List[PageOCR], boxes: List[Tuple[int, int, int, int]],
+                   width: int, height: int) -> PageOCR:
+    """Join crop results into one page: text top to bottom, TSV boxes in page coordinates."""
+    rows = [TSV_HEADER, f"1\t1\t0\t0\t0\t0\t0\t0\t{width}\t{height}\t-1\t"]
+    block_base = 0
+    for result, (x, y, _, _) in zip(results, boxes):
+        last_block = 0
+        for line in result.tsv.splitlines()[1:]:
+            cols = line.split('\t')
+            if len(cols) < 12 or cols[0] == '1':
+                continue
+            last_block = max(last_block, int(cols[2]))
+            cols[2] = str(int(cols[2]) + block_base)
+            cols[6] = str(int(cols[6]) + x)
+            cols[7] = str(int(cols[7]) + y)
+            rows.append('\t'.join(cols))
+        block_base += last_block
+    text = '\n'.join(r.text.rstrip('\n') for r in results if r.text.strip())
+    return PageOCR(text + '\n' if text else '', '\n'.join(rows))
+
+
+def recognize(image, options: OCROptions = OCROptions()) -> PageOCR:
+    """OCR one rendered page, or just its detected regions when options.regions is set."""
+    if options.regions:
+        with timed('regions'):
+            boxes = REGION_DETECTORS[options.regions](image)
+        if boxes:
+            whole_page = options._replace(regions=None)
+            crops = [image.crop((x, y, x + w, y + h)) for x, y, w, h in boxes]
+            if CROP_WORKERS > 1 and len(crops) > 1:
+                with ThreadPoolExecutor(max_workers=CROP_WORKERS) as pool:
+                    results = list(pool.map(lambda crop: recognize(crop, whole_page), crops))
+            else:
+                results = [recognize(crop, whole_page) for crop in crops]
+            return _merge_regions(results, boxes, *image.size)
+    if options.preprocess:
+        with timed('preprocess'):
+            image = PREPROCESSORS[options.preprocess](image)
+    with timed('ocr'):
+        return get_engine(options.engine).recognize(image, options.lang, options.config)
+
+
+def refine_low_confidence(pdf_path: str, page_num: int, dpi: int, result: PageOCR,
+                          options: OCROptions) -> PageOCR:
+    """Second pass: re-read lines below options.min_conf from a refine_dpi render.
+
+    Each weak line's box (from the base pass) is cropped out of one high-DPI
+    render of the page and OCR'd as a single text line; the re-read words
+    replace the originals when their mean confidence is higher. Word boxes
+    stay in base-DPI page coordinates.
+    """
+    rows = parse_tsv(result.tsv)
+    boxes = {r.line_key: r for r in rows if r.level == 4}
+    words: Dict[Tuple[int, int, int], List[TSVRow]] = {}
+    for r in rows:
+        if r.level == 5 and r.text.strip():
+            words.setdefault(r.line_key, []).append(r)
+    weak = [k for k, ws in words.items() if k in boxes and 0 <= _mean_conf(ws) < options.min_conf]
+    if not weak:
+        return result
+
+    scale = options.refine_dpi / dpi
+    line_options = options._replace(regions=None, refine_dpi=None,
+                                    config=f"{options.config} --psm 7".strip())
+    replaced: Dict[Tuple[int, int, int], List[TSVRow]] = {}
+    for _, image in render_pages(pdf_path, [page_num], options.refine_dpi, window=1):
+        for key in weak:
+            box = boxes[key]
+            x0 = max(int((box.left - REGION_PAD) * scale), 0)
+            y0 = max(int((box.top - REGION_PAD) * scale), 0)
+            x1 = min(int((box.left + box.width + REGION_PAD) * scale), image.width)
+            y1 = min(int((box.top + box.height + REGION_PAD) * scale), image.height)
+            reread = [r for r in parse_tsv(recognize(image.crop((x0, y0, x1, y1)), line_options).tsv)
+                      if r.level == 5 and r.text.strip()]
+            if reread and _mean_conf(reread) > _mean_conf(words[key]):
+                replaced[key] = [
+                    r._replace(page_num=box.page_num, block_num=key[0], par_num=key[1],
+                               line_num=key[2], word_num=i + 1,
+                               left=round((x0 + r.left) / scale), top=round((y0 + r.top) / scale),
+                               width=round(r.width / scale), height=round(r.height / scale))
+                    for i, r in enumerate(reread)
+                ]
+    if not replaced:
+        return result
+
+    merged: List[TSVRow] = []
+    for r in rows:
+        if r.level == 5 and r.line_key in replaced:
+            if r.word_num == words[r.line_key][0].word_num:
+                merged.extend(replaced[r.line_key])
+            continue
+        merged.append(r)
+    return PageOCR(tsv_text(merged), format_tsv(merged))
+
+
+def ocr_page(pdf_path: str, page_num: int, dpi: int,
+             options: OCROptions = OCROptions()) -> Tuple[int, PageOCR]:
+    """Render one page and OCR it, or load it from the cache; runs inside pool workers."""
+    key = cache_key(pdf_path, page_num, dpi, options) if cache_enabled() else None
+    result = cache_get(key) if key else None
+    if result is None:
+        if options.refine_dpi:
+            # The base pass is cached on its own, so retuning min_conf reuses it
+            _, base = ocr_page(pdf_path, page_num, dpi, options._replace(refine_dpi=None))
+            result = refine_low_confidence(pdf_path, page_num, dpi, base, options)
+        else:
+            for _, image in render_pages(pdf_path, [page_num], dpi, window=1):
+                result = recognize(image, options)
+            result = result or PageOCR('', '')
+        if key:
+            cache_put(key, result)
+    return page_num, result
+
+
+def _ocr_sequential(pdf_path: str, pages: Sequence[int], dpi: int,
+                    options: OCROptions) -> Iterator[Tuple[int, PageOCR]]:
+    if options.refine_dpi:
+        base_options = options._replace(refine_dpi=None)
+        for page_num, base in _ocr_sequential(pdf_path, pages, dpi, base_options):
+            key = cache_key(pdf_path, page_num, dpi, options) if cache_enabled() else None
+            result = cache_get(key) if key else None
+            if result is None:
+                result = refine_low_confidence(pdf_path, page_num, dpi, base, options)
+                if key:
+                    cache_put(key, result)
+            yield page_num, result
+        return
+
+    keys = {p: cache_key(pdf_path, p, dpi, options) for p in pages} if cache_enabled() else {}
+    cached = {p: cache_get(key) for p, key in keys.items()}
+    rendered = render_pages(pdf_path, [p for p in pages if cached.get(p) is None], dpi)
+    for page_num in pages:
+        result = cached.get(page_num)
+        if result is None:
+            _, image = next(rendered)
+            result = recognize(image, options)
+            if keys:
+                cache_put(keys[page_num], result)
+        yield page_num, result
+
+
+def ocr_page_results(pdf_path: str, pages: Sequence[int], dpi: int, workers: Optional[int] = None,
+                     **options) -> Iterator[Tuple[int, PageOCR]]:
+    """Yield (page_num, PageOCR) for each page in order; options are OCROptions fields.
+
+    With more than one worker, pages are rendered and OCR'd in parallel
+    (threads for an in-process engine, processes for the CLI); results are
+    still yielded in page order as they complete.
+    """
+    settings = OCROptions(**options)
+    workers = min(workers or default_workers(), len(pages)) or 1
+    if workers == 1:
+        yield from _ocr_sequential(pdf_path, pages, dpi, settings)
+        return
+
+    n = len(pages)
+    executor = ThreadPoolExecutor if get_engine(settings.engine).in_process else ProcessPoolExecutor
+    with executor(max_workers=workers) as pool:
+        yield from pool.map(ocr_page, [pdf_path] * n, pages, [dpi] * n, [settings] * n)
+
+
+def ocr_pages(pdf_path: str, pages: Sequence[int], dpi: int, workers: Optional[int] = None,
+              **options) -> Iterator[Tuple[int, str]]:
+    """Yield (page_num, text) for each page in order; options are OCROptions fields."""
+    for page_num, result in ocr_page_results(pdf_path, pages, dpi, workers, **options):
+        yield page_num, result.text
+
+
+def ocr_crops(pdf_path: str, page_num: int, dpi: int, boxes: Sequence[Tuple[int, int, int, int]],
+              **options) -> List[PageOCR]:
+    """OCR page crops (x, y, w, h at `dpi`) from one render; TSV boxes in page coordinates.
+
+    Used for targeted re-reads such as digits-only passes over numeric
+    columns. Each crop is cached on its own; the page is only rendered when
+    some crop is missing.
+    """
+    settings = OCROptions(**options)
+    keys = ([{**cache_key(pdf_path, page_num, dpi, settings), 'crop': list(box)} for box in boxes]
+            if cache_enabled() else [])
+    results: List[Optional[PageOCR]] = [cache_get(key) for key in keys] or [None] * len(boxes)
+    if any(result is None for result in results):
+        for _, image in render_pages(pdf_path, [page_num], dpi, window=1):
+            for i, (x, y, w, h) in enumerate(boxes):
+                if results[i] is not None:
+                    continue
+                crop = recognize(image.crop((x, y, x + w, y + h)), settings)
+                rows = [r._replace(left=r.left + x, top=r.top + y) for r in parse_tsv(crop.tsv) if r.level != 1]
+                results[i] = PageOCR(crop.text, format_tsv(rows))
+                if keys:
+                    cache_put(keys[i], results[i])
+    return [result or PageOCR('', TSV_HEADER) for result in results]
+
+
+# ==================== TEXT LAYER ====================
+
+MIN_TEXT_CHARS = 200        # visible characters a page needs to count as text
+MAX_UNMAPPED_RATIO = 0.05   # "(cid:N)" glyphs without a Unicode mapping
+
+
+def has_text_layer(page) -> bool:
+    """Whether a pdfplumber page has enough real, decodable text to skip OCR."""
+    chars = [c['text'] for c in page.chars if c['text'].strip()]
+    if len(chars) < MIN_TEXT_CHARS:
+        return False
+    unmapped = sum(1 for c in chars if c.startswith('(cid:'))
+    return unmapped / len(chars) <= MAX_UNMAPPED_RATIO
+
+
+def classify_pages(pdf_path: str, pages: Sequence[int]) -> Dict[int, str]:
+    """'text' or 'ocr' per page; everything is 'ocr' without pdfplumber."""
+    if pdfplumber is None:
+        return {p: 'ocr' for p in pages}
+    with pdfplumber.open(pdf_path) as pdf:
+        return {p: 'text' if has_text_layer(pdf.pages[p - 1]) else 'ocr' for p in pages}
+
+
+def text_layer_result(page, dpi: int) -> PageOCR:
+    """PageOCR from a text layer: extract_text() plus word boxes as TSV at `dpi`."""
+    scale = dpi / 72
+    rows = [TSVRow(1, 1, 0, 0, 0, 0, 0, 0, round(page.width * scale), round(page.height * scale), -1, '')]
+    line: List[dict] = []
+    line_num = 0
+
+    def flush():
+        nonlocal line_num
+        if not line:
+            return
+        line_num += 1
+        x0 = min(w['x0'] for w in line)
+        top = min(w['top'] for w in line)
+        x1 = max(w['x1'] for w in line)
+        bottom = max(w['bottom'] for w in line)
+        rows.append(TSVRow(4, 1, 1, 1, line_num, 0, round(x0 * scale), round(top * scale),
+                           round((x1 - x0) * scale), round((bottom - top) * scale), -1, ''))
+        for i, w in enumerate(line, 1):
+            rows.append(TSVRow(5, 1, 1, 1, line_num, i, round(w['x0'] * scale), round(w['top'] * scale),
+                               round((w['x1'] - w['x0']) * scale), round((w['bottom'] - w['top']) * scale),
+                               100, w['text']))
+        line.clear()
+
+    for word in sorted(page.extract_words(), key=lambda w: (round(w['top']), w['x0'])):
+        if line and word['top'] - line[0]['top'] > (line[0]['bottom'] - line[0]['top']) / 2:
+            flush()
+        line.append(word)
+    flush()
+    return PageOCR(page.extract_text() or tsv_text(rows), format_tsv(rows))
+
+
+def extract_pages(pdf_path: str, pages: Sequence[int], dpi: int, workers: Optional[int] = None,
+                  **options) -> Iterator[Tuple[int, PageOCR, str]]:
+    """Yield (page_num, PageOCR, path) in page order, path being 'text' or 'ocr'.
+
+    Text-layer pages are read directly; the rest go through ocr_page_results
+    (parallel, cached) with the given OCROptions fields.
+    """
+    paths = classify_pages(pdf_path, pages)
+    ocr_list = [p for p in pages if paths[p] == 'ocr']
+    ocr_results = ocr_page_results(pdf_path, ocr_list, dpi, workers, **options) if ocr_list else iter(())
+    pdf = pdfplumber.open(pdf_path) if len(ocr_list) < len(pages) else None
+    try:
+        for page_num in pages:
+            if paths[page_num] == 'text':
+                with timed('text_layer'):
+                    result = text_layer_result(pdf.pages[page_num - 1], dpi)
+                yield page_num, result, 'text'
+            else:
+                _, result = next(ocr_results)
+                yield page_num, result, 'ocr'
+    finally:
+        if pdf is not None:
+            pdf.close()
+
+
+def page_texts(pdf_path: str, pages: Sequence[int], dpi: int, workers: Optional[int] = None,
+               **options) -> Iterator[Tuple[int, str, str]]:
+    """Yield (page_num, text, path) for each page in order; see extract_pages."""
+    for page_num, result, path in extract_pages(pdf_path, pages, dpi, workers, **options):
+        yield page_num, result.text, path
@@ -0,0 +1,448 @@
+#!/usr/bin/env python3
+"""
+Configurable IFCT extraction pipeline.
+
+Every page streams through the same stages, and each stage is a named
+plugin chosen by PipelineConfig:
+
+  source     extract_pages (ifct_ocr.py): windowed rendering, preprocessing,
+             table regions, OCR engine, text-layer routing, cache and pool
+  segmenter  page -> candidate food rows                          SEGMENTERS
+  parser     row -> food record (field mapping, energy)           PARSERS
+  validator  record -> record or None (ranges, required fields)   VALIDATORS
+  writer     streamed records -> CSV / JSON                       WRITERS
+
+The renderer, preprocessor and OCR backend are the ifct_ocr registries
+(PREPROCESSORS, REGION_DETECTORS, ENGINES), so caching and parallelism are
+implemented once for every strategy. PROFILES keeps the strategies of the
+former per-strategy extractor scripts as named configurations.
+
+Segmenting, parsing and validating a page is timed as the 'parse' stage in
+ifct_ocr.STAGE_SECONDS (the digits-only column re-read of the 'columns'
+segmenter is included, its tesseract calls also count under 'ocr').
+"""
+
+import csv
+import json
+import os
+import re
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+from ifct_ocr import REFINE_DPI, PageOCR, extract_pages, page_range, timed, tsv_table
+from ifct_table import HEADER_FIELDS, IFCT_COLUMNS, NUMBER, parse_page
+
+# Columns of the foods_indian import CSVs under data/ifct
+IMPORT_COLUMNS = [
+    'name', 'name_hindi', 'category', 'serving_size_g',
+    'calories', 'protein_g', 'carbs_g', 'fat_g', 'fiber_g',
+    'sodium_mg', 'potassium_mg', 'source',
+]
+
+MACROS = ['protein_g', 'carbs_g', 'fat_g', 'fiber_g']
+
+# Column order guessed by the early scripts for "summary" style tables
+SUMMARY_COLUMNS = ['calories', 'protein_g', 'carbs_g', 'fat_g', 'fiber_g']
+
+# Spelled-out table headers (text-layer tables) -> field; IFCT abbreviations come from HEADER_FIELDS
+TABLE_HEADERS = [
+    ('energy (kcal)', 'calories'),
+    ('protein (g)', 'protein_g'),
+    ('fat (g)', 'fat_g'),
+    ('carbohydrates (g)', 'carbs_g'),
+    ('fiber (g)', 'fiber_g'),
+    ('water (g)', 'water_g'),
+    ('iron (mg)', 'iron_mg'),
+    ('calcium (mg)', 'calcium_mg'),
+    ('phosphorus (mg)', 'phosphorus_mg'),
+    ('vitamin c (mg)', 'vitamin_c_mg'),
+    ('vitamin a (iu)', 'vitamin_a_iu'),
+]
+
+HEADER_WORDS = ('water', 'protcnt', 'fatce', 'food nam', 'fibre', 'energy', 'table', 'page')
+
+CODE_LINE = re.compile(r'^([A-Z]?\d{2,4})[.\s\-_]+(.+)$')
+SERIAL_LINE = re.compile(r'^([A-Za-z]?\d+)\.?\s+(.+)$')
+COLUMN_GAP = re.compile(r'\s{2,}|\t')
+
+
+class PipelineConfig(NamedTuple):
+    dpi: int = 140
+    pages: Optional[Tuple[int, int]] = None     # (first, last), default the whole PDF
+    segmenter: str = 'columns'                  # key of SEGMENTERS
+    fallback: Optional[str] = 'code-lines'      # segmenter for pages where the first finds no rows
+    parser: str = 'ifct'                        # key of PARSERS
+    validator: str = 'ranges'                   # key of VALIDATORS
+    preprocess: Optional[str] = None            # OCROptions fields, see ifct_ocr
+    regions: Optional[str] = None
+    engine: Optional[str] = None
+    refine_dpi: Optional[int] = None
+    min_conf: float = 60.0
+    numeric_pass: bool = True                   # digits-only column re-read ('columns', OCR'd pages)
+    category: str = 'IFCT2017'
+    source: str = 'IFCT2017_OCR'
+
+    def ocr_options(self) -> Dict:
+        options = {'preprocess': self.preprocess, 'regions': self.regions,
+                   'engine': self.engine, 'refine_dpi': self.refine_dpi}
+        return {'min_conf': self.min_conf, **{k: v for k, v in options.items() if v is not None}}
+
+
+class Page(NamedTuple):
+    num: int
+    result: PageOCR
+    path: str               # 'text' or 'ocr'
+
+
+class Row(NamedTuple):
+    page: int
+    code: str
+    name: str
+    values: List[float]         # numeric cells left to right, not yet tied to a field
+    fields: Dict[str, float]    # cells already tied to a field (column geometry, table header)
+
+
+def _number(token: str) -> Optional[float]:
+    match = NUMBER.match(token)
+    return float(match.group(1)) if match else None
+
+
+def _numbers(tokens: Sequence[str]) -> List[float]:
+    """Numeric tokens in order; "12.5±0.3" keeps the mean, a detached "±0.3" is skipped."""
+    return [v for v in map(_number, tokens) if v is not None]
+
+
+def _is_header(line: str) -> bool:
+    lower = line.lower()
+    return any(word in lower for word in HEADER_WORDS)
+
+
+# ==================== SEGMENTERS ====================
+
+def segment_columns(page: Page, run: 'Pipeline') -> List[Row]:
+    """Rows from word-box column geometry (ifct_table.parse_page)."""
+    config = run.config
+    numeric_pass = config.numeric_pass and page.path == 'ocr'
+    cells = parse_page(page.result, run.pdf_path, page.num, config.dpi, numeric_pass, **config.ocr_options())
+    return [Row(page.num, c.pop('code'), c.pop('name'), [], c) for c in cells]
+
+
+def segment_code_lines(page: Page, run: 'Pipeline') -> List[Row]:
+    """Text lines starting with a food code; the name runs up to the first number."""
+    rows = []
+    for line in page.result.text.split('\n'):
+        line = line.strip()
+        match = CODE_LINE.match(line)
+        if len(line) < 10 or _is_header(line) or not match:
+            continue
+        tokens = match.group(2).split()
+        first = next((i for i, t in enumerate(tokens) if _number(t) is not None), len(tokens))
+        rows.append(Row(page.num, match.group(1), ' '.join(tokens[:first]), _numbers(tokens[first:]), {}))
+    return rows
+
+
+def segment_spaced_lines(page: Page, run: 'Pipeline') -> List[Row]:
+    """Serial-numbered lines whose columns are separated by runs of spaces or tabs."""
+    rows = []
+    for line in page.result.text.split('\n'):
+        line = line.strip()
+        match = SERIAL_LINE.match(line)
+        if len(line) < 10 or _is_header(line) or not match:
+            continue
+        parts = [p for p in COLUMN_GAP.split(match.group(2)) if p.strip()]
+        if len(parts) < 2:
+            continue
+        values = _numbers([t for part in parts[1:] for t in part.split()])
+        rows.append(Row(page.num, match.group(1), parts[0].strip(), values, {}))
+    return rows
+
+
+def segment_pipes(page: Page, run: 'Pipeline') -> List[Row]:
+    """'|'-separated lines: name first, numbers after."""
+    rows = []
+    for line in page.result.text.split('\n'):
+        parts = [p.strip() for p in line.split('|')]
+        if len(parts) < 3 or not parts[0] or _is_header(parts[0]):
+            continue
+        values = _numbers([t for part in parts[1:] for t in part.split()])
+        rows.append(Row(page.num, '', parts[0], values, {}))
+    return rows
+
+
+def _header_field(cell: str) -> Optional[str]:
+    lower = cell.lower()
+    for key, field in TABLE_HEADERS + HEADER_FIELDS:
+        if key in lower:
+            return field
+    return None
+
+
+def segment_tables(page: Page, run: 'Pipeline') -> List[Row]:
+    """Word-gap table cells named by the page's header row (or the last header seen)."""
+    table = tsv_table(page.result.tsv)
+    start = next((i for i, row in enumerate(table)
+                  if sum(_header_field(c) is not None for c in row) >= 2), None)
+    if start is not None:
+        run.state['headers'] = [_header_field(c) for c in table[start]]
+        table = table[start + 1:]
+    headers = run.state.get('headers')
+    if not headers:
+        return []
+
+    rows = []
+    for cells in table:
+        if len(cells) < 2 or not cells[0]:
+            continue
+        code, _, name = cells[0].partition(' ')
+        if not CODE_LINE.match(cells[0]):
+            code, name = '', cells[0]
+        fields = {}
+        for field, cell in zip(headers, cells):
+            value = _number(cell.split()[0]) if field and cell.split() else None
+            if value is not None:
+                fields[field] = value
+        rows.append(Row(page.num, code, name, [], fields))
+    return rows
+
+
+SEGMENTERS: Dict[str, Callable[[Page, 'Pipeline'], List[Row]]] = {
+    'columns': segment_columns,
+    'code-lines': segment_code_lines,
+    'spaced-lines': segment_spaced_lines,
+    'pipes': segment_pipes,
+    'tables': segment_tables,
+}
+
+
+# ==================== PARSERS ====================
+
+def clean_name(name: str) -> str:
+    """Drop the scientific name in parentheses and OCR debris."""
+    name = re.sub(r'\s*\([^)]*\).*$', '', name)
+    name = name.replace('—', '-').replace('_', ' ')
+    name = re.sub(r'[^\w\s\-,]', '', name)
+    return re.sub(r'\s+', ' ', name).strip(' ,-')
+
+
+def energy_kcal(cells: Dict) -> Optional[float]:
+    """Printed energy: kcal when plausible, else kJ converted."""
+    if cells.get('calories') and 10 < cells['calories'] < 900:
+        return cells['calories']
+    if cells.get('energy_kj') and 40 < cells['energy_kj'] < 3800:
+        return round(cells['energy_kj'] / 4.184, 1)
+    return None
+
+
+def positional_parser(order: Sequence[str]) -> Callable[[Row, 'Pipeline'], Optional[Dict]]:
+    """Parser naming a row's unnamed values by column order; named cells take precedence."""
+    def parse(row: Row, run: 'Pipeline') -> Optional[Dict]:
+        cells = {**dict(zip(order, row.values)), **row.fields}
+        name = clean_name(row.name)
+        if len(name) < 2 or not re.search(r'[a-zA-Z]', name):
+            return None
+        record = {
+            'name': name,
+            'name_hindi': '',
+            'category': run.config.category,
+            'serving_size_g': 100,
+            'calories': energy_kcal(cells),
+            **{field: cells.get(field) for field in MACROS},
+            'sodium_mg': None,
+            'potassium_mg': None,
+            'source': run.config.source,
+            'code': row.code,
+            'page': row.page,
+        }
+        # Anything else the table named (water_g, iron_mg, ...) rides along for the JSON output
+        for field, value in cells.items():
+            record.setdefault(field, value)
+        record.pop('energy_kj', None)
+        return record
+    return parse
+
+
+PARSERS: Dict[str, Callable[[Row, 'Pipeline'], Optional[Dict]]] = {
+    'ifct': positional_parser(IFCT_COLUMNS),
+    'summary': positional_parser(SUMMARY_COLUMNS),
+}
+
+
+# ==================== VALIDATORS ====================
+
+RANGES = {
+    'protein_g': (0, 100),
+    'fat_g': (0, 100),
+    'carbs_g': (0, 100),
+    'fiber_g': (0, 50),
+    'calories': (10, 900),
+}
+
+
+def validate_ranges(record: Dict) -> Optional[Dict]:
+    """Null out-of-range values, fill energy from 4P + 4C + 9F, require calories and protein."""
+    for field, (low, high) in RANGES.items():
+        value = record.get(field)
+        if value is not None and not low <= value <= high:
+            record[field] = None
+    if record['calories'] is None and all(record[f] is not None for f in ('protein_g', 'carbs_g', 'fat_g')):
+        record['calories'] = round(record['protein_g'] * 4 + record['carbs_g'] * 4 + record['fat_g'] * 9, 1)
+    return record if record['calories'] and record['protein_g'] else None
+
+
+def validate_lenient(record: Dict) -> Optional[Dict]:
+    """Keep any record with a name and at least one energy or macro value."""
+    keys = ('calories', 'protein_g', 'fat_g', 'carbs_g')
+    return record if record['name'] and any(record.get(k) is not None for k in keys) else None
+
+
+VALIDATORS: Dict[str, Callable[[Dict], Optional[Dict]]] = {
+    'ranges': validate_ranges,
+    'lenient': validate_lenient,
+}
+
+
+# ==================== WRITERS ====================
+
+class CSVWriter:
+    """foods_indian import CSV (IMPORT_COLUMNS), written as records arrive."""
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self.part = self.path.with_name(self.path.name + '.part')
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.file = open(self.part, 'w', newline='', encoding='utf-8')
+        self.writer = csv.DictWriter(self.file, fieldnames=IMPORT_COLUMNS, extrasaction='ignore')
+        self.writer.writeheader()
+
+    def write(self, records: Sequence[Dict]) -> None:
+        self.writer.writerows(records)
+
+    def close(self, keep: bool = True) -> None:
+        """Replace the output with what was written, or discard it."""
+        self.file.close()
+        if keep:
+            os.replace(self.part, self.path)
+        else:
+            self.part.unlink()
+
+
+class JSONWriter(CSVWriter):
+    """JSON array of full records (code, page and extra fields included), streamed."""
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self.part = self.path.with_name(self.path.name + '.part')
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.file = open(self.part, 'w', encoding='utf-8')
+        self.file.write('[')
+        self.count = 0
+
+    def write(self, records: Sequence[Dict]) -> None:
+        for record in records:
+            self.file.write(',\n  ' if self.count else '\n  ')
+            self.file.write(json.dumps(record, ensure_ascii=False))
+            self.count += 1
+
+    def close(self, keep: bool = True) -> None:
+        self.file.write('\n]\n' if self.count else ']\n')
+        super().close(keep)
+
+
+WRITERS = {
+    'csv': CSVWriter,
+    'json': JSONWriter,
+}
+
+
+# ==================== PIPELINE ====================
+
+class Pipeline:
+    """Stream pages of an IFCT PDF through the configured stages."""
+
+    def __init__(self, pdf_path: str, config: PipelineConfig = PipelineConfig()):
+        for stage, registry in [('segmenter', SEGMENTERS), ('parser', PARSERS), ('validator', VALIDATORS)]:
+            name = getattr(config, stage)
+            if name not in registry:
+                raise ValueError(f"Unknown {stage} {name!r} (one of {', '.join(registry)})")
+        if config.fallback is not None and config.fallback not in SEGMENTERS:
+            raise ValueError(f"Unknown fallback segmenter {config.fallback!r}")
+        self.pdf_path = pdf_path
+        self.config = config
+        self.state: Dict = {}   # segmenter state carried across pages (e.g. the last table header)
+
+    def pages(self) -> List[int]:
+        return page_range(self.pdf_path, *self.config.pages) if self.config.pages else page_range(self.pdf_path)
+
+    def process(self, page: Page) -> List[Dict]:
+        """Segment, parse and validate one page."""
+        config = self.config
+        rows = SEGMENTERS[config.segmenter](page, self)
+        if not rows and config.fallback:
+            rows = SEGMENTERS[config.fallback](page, self)
+        parse, validate = PARSERS[config.parser], VALIDATORS[config.validator]
+        records = []
+        for row in rows:
+            record = parse(row, self)
+            record = validate(record) if record is not None else None
+            if record is not None:
+                records.append(record)
+        return records
+
+    def run(self, pages: Optional[Sequence[int]] = None,
+            workers: Optional[int] = None) -> Iterator[Tuple[Page, List[Dict]]]:
+        """Yield (page, records) in page order; OCR runs on `workers` ahead of parsing."""
+        config = self.config
+        pages = list(pages) if pages is not None else self.pages()
+        for num, result, path in extract_pages(self.pdf_path, pages, config.dpi, workers, **config.ocr_options()):
+            page = Page(num, result, path)
+            with timed('parse'):
+                records = self.process(page)
+            yield page, records
+
+
+def write_records(run: Iterator[Tuple[Page, List[Dict]]], outputs: Dict[str, str]) -> Iterator[Tuple[Page, List[Dict]]]:
+    """Pass (page, records) through while streaming records to each {writer: path}.
+
+    Outputs are replaced only when the run completes with at least one record,
+    so a failed or empty run leaves the previous files in place.
+    """
+    writers = [WRITERS[kind](path) for kind, path in outputs.items()]
+    count = 0
+    completed = False
+    try:
+        for page, records in run:
+            for writer in writers:
+                writer.write(records)
+            count += len(records)
+            yield page, records
+        completed = True
+    finally:
+        for writer in writers:
+            writer.close(keep=completed and count > 0)
+
+
+# Strategies of the former extractor scripts
+_REFINE = REFINE_DPI or None
+PROFILES: Dict[str, PipelineConfig] = {
+    # extract-all-ifct.py: column geometry, code-line fallback
+    'complete': PipelineConfig(dpi=140, refine_dpi=_REFINE, source='IFCT2017_Complete_OCR'),
+    # extract-ifct-complete.py: code lines
+    'all': PipelineConfig(dpi=140, segmenter='code-lines', fallback=None, refine_dpi=_REFINE,
+                          category='IFCT_Extracted', source='IFCT2017_Complete_OCR'),
+    # extract-ifct-final.py: code lines, low DPI
+    'extracted': PipelineConfig(dpi=100, segmenter='code-lines', fallback=None, refine_dpi=_REFINE,
+                                category='Extracted_IFCT'),
+    # extract-ifct-real.py: space-separated columns, food pages only
+    'real': PipelineConfig(dpi=120, pages=(5, 28), segmenter='spaced-lines', fallback=None,
+                           refine_dpi=_REFINE, category='Extracted_from_IFCT'),
+    # extract-ifct-fast.py: sample pages, summary column order
+    'ocr': PipelineConfig(dpi=150, pages=(5, 10), segmenter='spaced-lines', fallback=None,
+                          parser='summary', validator='lenient', category='Extracted'),
+    # extract-ifct-ocr.py: enhanced table crops, '|' cells
+    'enhanced': PipelineConfig(dpi=150, segmenter='pipes', fallback=None, parser='summary',
+                               validator='lenient', preprocess='enhance', regions='tables',
+                               category='Extracted'),
+    # extract-ifct-data.py: header-named table cells
+    'tables': PipelineConfig(dpi=150, segmenter='tables', fallback=None, validator='lenient',
+                             refine_dpi=_REFINE, category='Indian', source='IFCT'),
+}
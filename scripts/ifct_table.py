@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+Column-aligned parsing of IFCT table pages from OCR word boxes.
+
+Instead of regex-splitting OCR lines and guessing columns by position (where
+one dropped cell shifts every value after it), numeric words are clustered by
+x-coordinate into table columns once per page. Each column is named from the
+header row when one is visible (PROTCNT, FATCE, ...), otherwise by the IFCT
+column order. Every number is then assigned to its column by geometry, so a
+missing cell just leaves that field empty.
+
+For OCR'd pages, each numeric column strip is re-read once with a
+digits-only tesseract config and those values take precedence, which removes
+the letter/digit confusions ("O" for 0, "l" for 1) in numeric cells.
+"""
+
+import re
+import statistics
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from ifct_ocr import REGION_PAD, PageOCR, TSVRow, ocr_crops, parse_tsv
+
+# Default left-to-right order of the numeric columns after the food name
+IFCT_COLUMNS = [
+    'water_g', 'protein_g', 'ash_g', 'fat_g', 'carbs_g',
+    'fiber_g', 'fiber_insoluble_g', 'fiber_soluble_g', 'energy_kj', 'calories',
+]
+
+# IFCT 2017 header abbreviations (lowercase substrings) -> field
+HEADER_FIELDS = [
+    ('water', 'water_g'),
+    ('protcnt', 'protein_g'),
+    ('ash', 'ash_g'),
+    ('fatce', 'fat_g'),
+    ('choavldf', 'carbs_g'),
+    ('fibtg', 'fiber_g'),
+    ('fibins', 'fiber_insoluble_g'),
+    ('fibsol', 'fiber_soluble_g'),
+    ('enerc', 'energy_kj'),
+    ('kcal', 'calories'),
+]
+
+NUMERIC_CONFIG = '--psm 6 -c tessedit_char_whitelist=0123456789.'
+
+FOOD_CODE = re.compile(r'^[A-Z]?\d{2,4}[.\-_]?$')
+# "12.5", "12.5±0.3" (mean ± SD, the mean is kept), "0.81"
+NUMBER = re.compile(r'^(\d+(?:\.\d+)?)(?:±.*)?$')
+
+MIN_COLUMN_SUPPORT = 0.25   # fraction of food rows a column must appear in
+
+
+class Column(NamedTuple):
+    field: Optional[str]
+    left: int
+    right: int
+    center: float
+
+
+class FoodRow(NamedTuple):
+    code: str
+    name: str
+    top: int
+    bottom: int
+    numbers: List[TSVRow]   # numeric words on the row, left to right
+
+
+def _center(word: TSVRow) -> float:
+    return word.left + word.width / 2
+
+
+def _number(text: str) -> Optional[float]:
+    match = NUMBER.match(text.strip())
+    return float(match.group(1)) if match else None
+
+
+def _lines(rows: Sequence[TSVRow]) -> List[List[TSVRow]]:
+    lines: Dict[Tuple[int, int, int], List[TSVRow]] = {}
+    for row in rows:
+        if row.level == 5 and row.text.strip():
+            lines.setdefault(row.line_key, []).append(row)
+    return [sorted(words, key=lambda w: w.left) for words in lines.values()]
+
+
+def food_rows(rows: Sequence[TSVRow]) -> List[FoodRow]:
+    """Lines starting with a food code; code-less lines of plain text continue the previous name."""
+    foods: List[FoodRow] = []
+    for words in _lines(rows):
+        numbers = [w for w in words if _number(w.text) is not None]
+        text_words = [w for w in words if _number(w.text) is None and not w.text.startswith('±')]
+        top = min(w.top for w in words)
+        bottom = max(w.top + w.height for w in words)
+        if FOOD_CODE.match(words[0].text):
+            name_words = [w for w in text_words if w is not words[0]]
+            if numbers:
+                name_words = [w for w in name_words if w.left < numbers[0].left]
+            foods.append(FoodRow(words[0].text.rstrip('.-_'), ' '.join(w.text for w in name_words),
+                                 top, bottom, numbers))
+        elif foods and not numbers and text_words:
+            prev = foods[-1]
+            foods[-1] = prev._replace(name=f"{prev.name} {' '.join(w.text for w in text_words)}".strip(),
+                                      bottom=max(prev.bottom, bottom))
+    return foods
+
+
+def cluster_columns(foods: Sequence[FoodRow]) -> List[Tuple[int, int, float]]:
+    """(left, right, center) of numeric columns, found by 1-D clustering of x-centers."""
+    words = [w for food in foods for w in food.numbers]
+    if not words:
+        return []
+    gap = 1.5 * statistics.median(w.height for w in words)
+    words.sort(key=_center)
+    clusters: List[List[TSVRow]] = [[words[0]]]
+    for prev, word in zip(words, words[1:]):
+        if _center(word) - _center(prev) > gap:
+            clusters.append([])
+        clusters[-1].append(word)
+
+    min_support = max(2, MIN_COLUMN_SUPPORT * len(foods))
+    return [
+        (min(w.left for w in c), max(w.left + w.width for w in c), statistics.median(_center(w) for w in c))
+        for c in clusters if len(c) >= min_support
+    ]
+
+
+def name_columns(spans: Sequence[Tuple[int, int, float]], rows: Sequence[TSVRow]) -> List[Column]:
+    """Name columns from the header line when found, else by IFCT_COLUMNS order."""
+    header = None
+    for words in _lines(rows):
+        matched = [(w, field) for w in words for key, field in HEADER_FIELDS if key in w.text.lower()]
+        if len(matched) >= 3:
+            header = matched
+            break
+
+    if header is None:
+        return [Column(IFCT_COLUMNS[i] if i < len(IFCT_COLUMNS) else None, *span)
+                for i, span in enumerate(spans)]
+
+    columns = [Column(None, *span) for span in spans]
+    for word, field in header:
+        nearest = min(range(len(columns)), key=lambda i: abs(columns[i].center - _center(word)), default=None)
+        if nearest is not None and columns[nearest].field is None:
+            columns[nearest] = columns[nearest]._replace(field=field)
+    return columns
+
+
+def _column_for(word: TSVRow, columns: Sequence[Column], tolerance: float) -> Optional[int]:
+    x = _center(word)
+    best = min(range(len(columns)), key=lambda i: abs(columns[i].center - x), default=None)
+    if best is None:
+        return None
+    col = columns[best]
+    return best if col.left - tolerance <= x <= col.right + tolerance else None
+
+
+def assign_cells(foods: Sequence[FoodRow], columns: Sequence[Column],
+                 column_words: Optional[Sequence[Sequence[TSVRow]]] = None) -> List[Dict]:
+    """Field values per food row by column geometry.
+
+    column_words, when given, holds per-column words from a digits-only
+    re-read; a value found there for a row wins over the base OCR value.
+    """
+    records = []
+    for food in foods:
+        tolerance = max((w.height for w in food.numbers), default=0)
+        record: Dict = {'code': food.code, 'name': food.name}
+        for word in food.numbers:
+            i = _column_for(word, columns, tolerance)
+            if i is not None and columns[i].field and columns[i].field not in record:
+                record[columns[i].field] = _number(word.text)
+        if column_words:
+            for col, words in zip(columns, column_words):
+                if not col.field:
+                    continue
+                mid = (food.top + food.bottom) / 2
+                hits = [w for w in words if w.top <= mid <= w.top + w.height and _number(w.text) is not None]
+                if hits:
+                    record[col.field] = _number(min(hits, key=lambda w: w.left).text)
+        records.append(record)
+    return records
+
+
+def parse_page(result: PageOCR, pdf_path: Optional[str] = None, page_num: Optional[int] = None,
+               dpi: Optional[int] = None, numeric_pass: bool = True, **options) -> List[Dict]:
+    """Food records ({'code', 'name', <IFCT field>: value, ...}) from one page.
+
+    With pdf_path/page_num/dpi and numeric_pass, each numeric column strip is
+    re-OCR'd with NUMERIC_CONFIG (options are OCROptions fields for that pass).
+    """
+    rows = parse_tsv(result.tsv)
+    foods = food_rows(rows)
+    spans = cluster_columns(foods)
+    if not foods or not spans:
+        return []
+    columns = name_columns(spans, rows)
+
+    column_words = None
+    if numeric_pass and pdf_path and page_num and dpi:
+        top = min(f.top for f in foods) - REGION_PAD
+        bottom = max(f.bottom for f in foods) + REGION_PAD
+        boxes = [(max(c.left - REGION_PAD, 0), max(top, 0), c.right - c.left + 2 * REGION_PAD, bottom - max(top, 0))
+                 for c in columns]
+        options = {**options, 'config': NUMERIC_CONFIG, 'regions': None, 'refine_dpi': None}
+        strips = ocr_crops(pdf_path, page_num, dpi, boxes, **options)
+        column_words = [[r for r in parse_tsv(strip.tsv) if r.level == 5 and r.text.strip()] for strip in strips]
+
+    return assign_cells(foods, columns, column_words)
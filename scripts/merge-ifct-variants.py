@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Merge the overlapping IFCT extractions into one canonical dataset.
+
+Reads the CSV variants in data/ifct (or the files given as arguments, most
+trusted first), drops rows whose name is OCR debris, clusters the remaining
+rows with the blocked fuzzy matcher in ifct_dedup.py and writes one record
+per food to data/ifct/ifct_foods_canonical.csv and .json.
+
+Each canonical row keeps the foods_indian import columns plus provenance:
+  quality           food_quality.quality_score of the merged values
+  atwater_residual  |kcal - 4P - 4C - 9F| / kcal
+  chosen_from       file:line whose values were kept
+  merged_from       every file:line in the cluster, best first
+  name_variants     the distinct spellings that were merged
+
+Usage: python scripts/merge-ifct-variants.py [most_trusted.csv ...]
+
+Environment:
+  IFCT_OUTPUT_DIR   output directory (default data/ifct)
+  DEDUP_THRESHOLD   match score 0..1 (see ifct_dedup.py)
+  DEDUP_MAX_BLOCK, DEDUP_WINDOW   blocking limits (see ifct_dedup.py)
+"""
+
+import csv
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+from ifct_dedup import dedupe, make_candidate
+
+ROOT = Path(__file__).resolve().parent.parent
+DATA_DIR = ROOT / "data" / "ifct"
+OUTPUT_DIR = Path(os.getenv("IFCT_OUTPUT_DIR", DATA_DIR))
+OUTPUT_STEM = "ifct_foods_canonical"
+
+# Most trusted first: the curated file, then the cleaned and raw OCR extractions
+DEFAULT_INPUTS = [
+    DATA_DIR / "ifct_foods.csv",
+    DATA_DIR / "ifct_foods_final.csv",
+    DATA_DIR / "ifct_foods_complete.csv",
+    DATA_DIR / "ifct_foods_all.csv",
+    DATA_DIR / "ifct_foods_extracted.csv",
+]
+
+OUTPUT_COLUMNS = [
+    'name', 'name_hindi', 'category', 'serving_size_g',
+    'calories', 'protein_g', 'carbs_g', 'fat_g', 'fiber_g',
+    'sodium_mg', 'potassium_mg', 'source',
+    'quality', 'atwater_residual', 'chosen_from', 'merged_from', 'name_variants',
+]
+
+
+def main():
+    inputs = [Path(p) for p in sys.argv[1:]] or DEFAULT_INPUTS
+    missing = [str(p) for p in inputs if not p.exists()]
+    if missing:
+        print(f"❌ File not found: {', '.join(missing)}")
+        return False
+
+    print("=" * 70)
+    print("🔗 IFCT VARIANT MERGE")
+    print("=" * 70)
+
+    candidates, debris = [], 0
+    for rank, path in enumerate(inputs):
+        priority = 1 - rank / len(inputs)
+        with open(path, newline='', encoding='utf-8') as f:
+            rows = list(csv.DictReader(f))
+        kept = 0
+        for line, row in enumerate(rows, start=2):
+            candidate = make_candidate(row, path.name, line, priority)
+            if candidate is None:
+                debris += 1
+            else:
+                candidates.append(candidate)
+                kept += 1
+        print(f"📥 {path.name:30s} {kept:5,} rows ({len(rows) - kept} debris)")
+
+    start = time.perf_counter()
+    clusters, stats = dedupe(candidates)
+    seconds = time.perf_counter() - start
+    all_pairs = len(candidates) * (len(candidates) - 1) // 2
+
+    records = [c.record for c in clusters]
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+    csv_path = OUTPUT_DIR / f"{OUTPUT_STEM}.csv"
+    json_path = OUTPUT_DIR / f"{OUTPUT_STEM}.json"
+    with open(csv_path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=OUTPUT_COLUMNS, extrasaction='ignore')
+        writer.writeheader()
+        writer.writerows(records)
+    with open(json_path, 'w', encoding='utf-8') as f:
+        json.dump([{k: r.get(k) for k in OUTPUT_COLUMNS} for r in records], f, indent=2, ensure_ascii=False)
+
+    merged = [c for c in clusters if len(c.members) > 1]
+    print(f"\n📊 {len(candidates):,} rows -> {len(records):,} foods ({len(merged):,} merged from 2+ rows)")
+    print(f"   {stats['compared']:,} pairs compared of {all_pairs:,} ({stats['matches']:,} matches, "
+          f"{stats['blocks_windowed']} large blocks windowed) in {seconds:.2f}s")
+    print(f"   {debris:,} debris rows dropped")
+    if stats['name_collisions']:
+        print(f"⚠️  {stats['name_collisions']} same-name clusters with disagreeing values folded "
+              "into the best by quality (one row per name, as foods_indian requires)")
+
+    print("\n📍 Largest merges:")
+    for c in sorted(merged, key=lambda c: len(c.members), reverse=True)[:10]:
+        print(f"   {c.record['name'][:40]:40s} <- {c.record['name_variants'][:60]}")
+
+    print(f"\n💾 {csv_path}")
+    print(f"💾 {json_path}")
+    return True
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
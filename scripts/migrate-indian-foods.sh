@@ -19,7 +19,7 @@ if [ -z "$SUPABASE_URL" ] || [ -z "$SUPABASE_KEY" ]; then
 fi
 
 # Get the migration SQL
-MIGRATION_SQL="supabase/migrations/20260118_migrate_indian_foods_to_foods_table.sql"
+MIGRATION_SQL="supabase/migrations/20260130_add_indian_foods_reconciliation.sql"
 
 if [ ! -f "$MIGRATION_SQL" ]; then
     echo "❌ Migration file not found: $MIGRATION_SQL"
@@ -52,9 +52,13 @@ fi
 # For now, just provide instructions
 echo "📖 Instructions:"
 echo "1. Open: https://app.supabase.com/project/[your-project]/sql/new"
-echo "2. Copy the contents of: supabase/migrations/20260118_migrate_indian_foods_to_foods_table.sql"
+echo "2. Copy the contents of: $MIGRATION_SQL"
 echo "3. Paste and execute"
 echo ""
+echo "Once applied, new or changed foods_indian rows are migrated incrementally with:"
+echo "  SELECT * FROM reconcile_indian_foods();"
+echo "(the IFCT loaders in scripts/ run this after every load)"
+echo ""
 echo "Or use Supabase CLI:"
 echo "  supabase db push"
 echo ""
@@ -9,7 +9,7 @@
  *
  * Environment Variables:
  *   SUPABASE_URL - Supabase project URL
- *   SUPABASE_KEY - Supabase service role key (or anon key)
+ *   SUPABASE_KEY - Supabase service role key
  */
 
 import { createClient } from "@supabase/supabase-js";
@@ -29,65 +29,35 @@ if (!SUPABASE_URL || !SUPABASE_KEY) {
 
 const supabase = createClient(SUPABASE_URL, SUPABASE_KEY);
 
-interface IndianFood {
-  id: number;
-  name: string;
-  calories: number;
-  protein_g: number;
-  carbs_g: number;
-  fat_g: number;
-  serving_size_g: number;
+interface ReconcileCounts {
+  mapped: number;
+  inserted: number;
+  refreshed: number;
 }
 
 async function migrateIndianFoods() {
   console.log("🔄 Starting Indian Foods Migration...\n");
 
   try {
-    // Step 1: Fetch all Indian foods from foods_indian table
-    console.log("📥 Fetching Indian foods from foods_indian table...");
-    const { data: indianFoods, error: fetchError } = await supabase
-      .from("foods_indian")
-      .select("*")
-      .limit(1000);
-
-    if (fetchError) {
-      throw new Error(`Failed to fetch Indian foods: ${fetchError.message}`);
-    }
-
-    console.log(`✅ Found ${indianFoods?.length || 0} Indian foods\n`);
-
-    if (!indianFoods || indianFoods.length === 0) {
-      console.log("⚠️  No Indian foods to migrate");
-      return;
-    }
-
-    // Step 2: Transform and insert into main foods table
-    console.log("🔄 Transforming and migrating to main foods table...");
-
-    const foodsToInsert = (indianFoods as IndianFood[]).map((food) => ({
-      name: food.name,
-      calories_per_serving: Math.round(food.calories || 0),
-      protein_g: food.protein_g || 0,
-      carbs_g: food.carbs_g || 0,
-      fats_g: food.fat_g || 0,
-      serving_size_g: food.serving_size_g || 100,
-      category: "indian",
-      is_custom: false,
-    }));
-
-    // Insert foods (will skip duplicates based on unique constraint if it exists)
-    const { data: insertedFoods, error: insertError } = await supabase
-      .from("foods")
-      .insert(foodsToInsert)
-      .select()
-      .limit(1000);
+    // Steps 1-2: map foods_indian rows that are new or changed since the last
+    // run into the IFCT partition of foods (indexed on the normalized name,
+    // see supabase/migrations/20260130_add_indian_foods_reconciliation.sql)
+    console.log("🔄 Reconciling foods_indian into the main foods table...");
+    const { data, error: reconcileError } = await supabase.rpc(
+      "reconcile_indian_foods",
+    );
 
-    if (insertError) {
-      console.error(`⚠️  Some foods may already exist: ${insertError.message}`);
+    if (reconcileError) {
+      throw new Error(
+        `Failed to reconcile Indian foods: ${reconcileError.message} ` +
+          "(needs the service role key and the 20260130 migration)",
+      );
     }
 
+    const counts = (Array.isArray(data) ? data[0] : data) as ReconcileCounts;
     console.log(
-      `✅ Migrated ${insertedFoods?.length || 0} foods to main table\n`,
+      `✅ ${counts.inserted} new foods, ${counts.refreshed} refreshed, ` +
+        `${counts.mapped} mappings written\n`,
     );
 
     // Step 3: Verify the migration
@@ -111,7 +81,7 @@ async function migrateIndianFoods() {
 
     console.log("\n🎉 Migration completed successfully!");
     console.log("\n📝 Summary:");
-    console.log(`   • Migrated ${foodsToInsert.length} Indian foods`);
+    console.log(`   • Migrated ${counts.inserted} new Indian foods`);
     console.log("   • All foods now use proper UUID IDs");
     console.log("   • Food logging will work correctly");
     console.log("\n✨ You can now log Indian foods without UUID errors!");
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Fixed nutrient-id vocabulary for the packed foods.nutrients column.
+
+foods.nutrients (and foods_indian.nutrients) is a REAL[] of per-100 g values
+where element N (1-based, as in SQL) is nutrient id N of NUTRIENTS; missing
+nutrients are NULL and trailing NULLs are dropped, so a food with only
+energy and fiber stores two numbers. The same ids are in the
+nutrient_vocabulary table (20260131 migration) and must never be renumbered;
+new nutrients get the next id.
+
+Importers build the array with off_nutrients (Open Food Facts CSV rows) or
+ifct_nutrients (foods_indian records), then pack.
+"""
+
+from typing import Dict, List, NamedTuple, Optional
+
+from food_quality import to_float
+
+
+class Nutrient(NamedTuple):
+    id: int
+    code: str
+    unit: str
+    off_field: Optional[str]    # Open Food Facts <field>_100g column
+    off_scale: float            # OFF stores grams; scale to unit
+
+
+NUTRIENTS: List[Nutrient] = [
+    Nutrient(1, 'energy_kcal', 'kcal', 'energy-kcal_100g', 1),
+    Nutrient(2, 'fiber_g', 'g', 'fiber_100g', 1),
+    Nutrient(3, 'sugars_g', 'g', 'sugars_100g', 1),
+    Nutrient(4, 'saturated_fat_g', 'g', 'saturated-fat_100g', 1),
+    Nutrient(5, 'sodium_mg', 'mg', 'sodium_100g', 1000),
+    Nutrient(6, 'potassium_mg', 'mg', 'potassium_100g', 1000),
+    Nutrient(7, 'calcium_mg', 'mg', 'calcium_100g', 1000),
+    Nutrient(8, 'iron_mg', 'mg', 'iron_100g', 1000),
+    Nutrient(9, 'phosphorus_mg', 'mg', 'phosphorus_100g', 1000),
+    Nutrient(10, 'vitamin_c_mg', 'mg', 'vitamin-c_100g', 1000),
+    Nutrient(11, 'vitamin_a_ug', 'ug', 'vitamin-a_100g', 1e6),
+    Nutrient(12, 'water_g', 'g', None, 1),
+    Nutrient(13, 'cholesterol_mg', 'mg', 'cholesterol_100g', 1000),
+    Nutrient(14, 'magnesium_mg', 'mg', 'magnesium_100g', 1000),
+    Nutrient(15, 'zinc_mg', 'mg', 'zinc_100g', 1000),
+]
+
+NUTRIENT_IDS = {n.code: n.id for n in NUTRIENTS}
+
+# IFCT reports vitamin A in IU; 1 IU of retinol is 0.3 ug
+VITAMIN_A_UG_PER_IU = 0.3
+
+
+def pack(values: Dict[str, Optional[float]]) -> Optional[List[Optional[float]]]:
+    """Per-100 g values by code -> array by id without trailing NULLs, None if empty"""
+    packed: List[Optional[float]] = [None] * len(NUTRIENTS)
+    for code, value in values.items():
+        if value is not None and code in NUTRIENT_IDS:
+            packed[NUTRIENT_IDS[code] - 1] = round(float(value), 4)
+    while packed and packed[-1] is None:
+        packed.pop()
+    return packed or None
+
+
+def unpack(packed: Optional[List[Optional[float]]]) -> Dict[str, float]:
+    return {n.code: packed[n.id - 1] for n in NUTRIENTS
+            if packed and n.id <= len(packed) and packed[n.id - 1] is not None}
+
+
+def off_nutrients(row: Dict) -> Dict[str, Optional[float]]:
+    """Per-100 g values of an Open Food Facts CSV row; negative values are dropped"""
+    values = {}
+    for n in NUTRIENTS:
+        value = to_float(row.get(n.off_field)) if n.off_field else None
+        if value is not None and value >= 0:
+            values[n.code] = value * n.off_scale
+    return values
+
+
+def ifct_nutrients(record: Dict) -> Dict[str, Optional[float]]:
+    """Per-100 g values of a foods_indian record (values per serving_size_g, micronutrients JSON)"""
+    scale = 100 / (to_float(record.get('serving_size_g')) or 100)
+    micro = record.get('micronutrients') or {}
+    raw = {
+        'energy_kcal': to_float(record.get('calories')),
+        'fiber_g': to_float(record.get('fiber_g')),
+        'water_g': to_float(record.get('water_g')),
+        **{code: to_float(micro.get(code)) for code in NUTRIENT_IDS if code in micro},
+    }
+    vitamin_a_iu = to_float(micro.get('vitamin_a_iu'))
+    if vitamin_a_iu is not None:
+        raw['vitamin_a_ug'] = vitamin_a_iu * VITAMIN_A_UG_PER_IU
+    return {code: value * scale for code, value in raw.items() if value is not None}
+
+
+def pg_array(packed: Optional[List[Optional[float]]]) -> Optional[str]:
+    """Postgres array literal for COPY ('{98,3.4,NULL,...}'), None for NULL"""
+    if not packed:
+        return None
+    return '{' + ','.join('NULL' if v is None else repr(v) for v in packed) + '}'
@@ -81,7 +81,7 @@ def test_extracted_data():
             return False
     else:
         print(f"⚠ JSON file not found at {json_file}")
-        print("  Run: python scripts/extract-ifct-data.py")
+        print("  Run: python scripts/extract-ifct.py IFCT2017.pdf tables")
         return False
     
     # Check CSV file
@@ -280,7 +280,7 @@ def main():
     if passed == total:
         print("\n✓ All tests passed! Ready to import data.")
         print("\nNext steps:")
-        print("1. Extract data: python scripts/extract-ifct-data.py")
+        print("1. Extract data: python scripts/extract-ifct.py IFCT2017.pdf tables")
         print("2. Import data: python scripts/import-ifct-data.py data/ifct/ifct_foods.csv")
         print("3. Test in app: Open FoodLoggingScreen and toggle to Indian Foods")
         return 0
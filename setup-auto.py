@@ -3,11 +3,13 @@
 Fully automated Indian Foods Setup
 """
 
-import csv
 from pathlib import Path
 import sys
 import time
 
+sys.path.insert(0, str(Path(__file__).parent / "scripts"))
+from foods_indian_loader import create_client_factory, prepare, print_result, read_foods, reconcile_foods, upsert_foods
+
 def main():
     print("\n" + "=" * 70)
     print("🇮🇳 Indian Foods Database - Automated Setup")
@@ -23,25 +25,8 @@ def main():
     
     # Step 2: Load CSV
     print("\n📋 Step 2: Loading Indian foods data...")
-    foods_data = []
     try:
-        with open(csv_file, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                foods_data.append({
-                    'name': row['name'],
-                    'name_hindi': row['name_hindi'],
-                    'category': row['category'],
-                    'serving_size_g': float(row['serving_size_g']),
-                    'calories': float(row['calories']),
-                    'protein_g': float(row['protein_g']),
-                    'carbs_g': float(row['carbs_g']),
-                    'fat_g': float(row['fat_g']),
-                    'fiber_g': float(row['fiber_g']),
-                    'sodium_mg': float(row.get('sodium_mg', 0)),
-                    'potassium_mg': float(row.get('potassium_mg', 0)),
-                    'source': 'IFCT'
-                })
+        foods_data, skipped = prepare(read_foods(csv_file), source='IFCT')
         print(f"   ✅ Loaded {len(foods_data)} foods")
     except Exception as e:
         print(f"   ❌ Error loading CSV: {e}")
@@ -118,26 +103,23 @@ CREATE POLICY "Allow reads" ON foods_indian FOR SELECT USING (true);
     
     # Step 5: Import data
     print(f"\n📊 Step 5: Importing {len(foods_data)} foods...")
-    batch_size = 10
-    imported = 0
-    
-    for i in range(0, len(foods_data), batch_size):
-        batch = foods_data[i:i+batch_size]
-        try:
-            supabase.table('foods_indian').insert(batch).execute()
-            imported = min(i + batch_size, len(foods_data))
-            percentage = (imported / len(foods_data)) * 100
-            print(f"   ✅ {imported}/{len(foods_data)} ({percentage:.0f}%)")
-        except Exception as e:
-            # Check if it's duplicate error (OK)
-            if "duplicate" in str(e).lower() or "unique" in str(e).lower():
-                imported = min(i + batch_size, len(foods_data))
-                print(f"   ℹ️  {imported}/{len(foods_data)} (some duplicates)")
-            else:
-                print(f"   ❌ Import error: {e}")
-                return False
+    # upsert_foods_indian is service-role only; the anon key cannot execute it
+    try:
+        client = create_client_factory(SUPABASE_URL)
+        result = upsert_foods(foods_data, client)
+    except RuntimeError as e:
+        print(f"   ❌ {e}")
+        print("   Apply supabase/migrations/20260129_add_foods_indian_upsert.sql "
+              "and set SUPABASE_SERVICE_ROLE_KEY")
+        return False
+    print_result(result, skipped)
+    imported = result.inserted + result.updated
+    if imported == 0 and result.rejected:
+        print("   ❌ Import failed")
+        return False
     
     print(f"   ✅ Imported {imported} foods")
+    reconcile_foods(client)
     
     # Step 6: Verify
     print("\n✅ Step 6: Verifying...")
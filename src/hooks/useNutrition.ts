@@ -1,9 +1,16 @@
 import * as foodService from "@services/foodService";
 import { supabase } from "@services/supabase";
 import { useMutation, useQuery, useQueryClient } from "@tanstack/react-query";
+import { useMemo } from "react";
+import { searchFoodSearchIndex } from "@utils/foodSearchIndex";
 import { recordCacheHit, recordCacheMiss } from "@utils/foodUtils";
 import type { FitnessGoal } from "@utils/nutritionUtils";
-import type { Food, UserProfile } from "../types";
+import type {
+  DailyNutritionSummary,
+  Food,
+  NutritionPeriodSummary,
+  UserProfile,
+} from "../types";
 
 export const useProfile = (userId: string) => {
   return useQuery({
@@ -155,6 +162,53 @@ export const useDailyFoodLogs = (userId: string, date: string) => {
   });
 };
 
+// Single rollup row for one day (null until something is logged)
+export const useDailyNutritionSummary = (userId: string, date: string) => {
+  return useQuery({
+    queryKey: ["nutritionSummary", userId, date],
+    queryFn: async (): Promise<DailyNutritionSummary | null> => {
+      const { data, error } = await supabase
+        .from("daily_nutrition_summary")
+        .select("*")
+        .eq("user_id", userId)
+        .eq("date", date)
+        .maybeSingle();
+
+      if (error) throw error;
+      return data;
+    },
+    enabled: !!userId && !!date,
+    staleTime: 5 * 60 * 1000,
+    gcTime: 10 * 60 * 1000,
+    retry: 1,
+  });
+};
+
+// Week/month totals summed server-side from the daily rollups
+export const useNutritionSummary = (
+  userId: string,
+  startDate: string,
+  endDate: string,
+  enabled = true,
+) => {
+  return useQuery({
+    queryKey: ["nutritionSummary", userId, startDate, endDate],
+    queryFn: async (): Promise<NutritionPeriodSummary | null> => {
+      const { data, error } = await supabase.rpc("get_nutrition_summary", {
+        start_date: startDate,
+        end_date: endDate,
+      });
+
+      if (error) throw error;
+      return data?.[0] ?? null;
+    },
+    enabled: enabled && !!userId && !!startDate && !!endDate,
+    staleTime: 5 * 60 * 1000,
+    gcTime: 10 * 60 * 1000,
+    retry: 1,
+  });
+};
+
 export const useAddFoodLog = () => {
   const queryClient = useQueryClient();
 
@@ -177,6 +231,7 @@ export const useAddFoodLog = () => {
     onSuccess: () => {
       queryClient.invalidateQueries({ queryKey: ["foodLogs"] });
       queryClient.invalidateQueries({ queryKey: ["dailyStats"] });
+      queryClient.invalidateQueries({ queryKey: ["nutritionSummary"] });
     },
   });
 };
@@ -196,35 +251,29 @@ export const useDeleteFoodLog = () => {
     onSuccess: () => {
       queryClient.invalidateQueries({ queryKey: ["foodLogs"] });
       queryClient.invalidateQueries({ queryKey: ["dailyStats"] });
+      queryClient.invalidateQueries({ queryKey: ["nutritionSummary"] });
     },
   });
 };
 
 export const useFoodDatabase = (
   category?: string,
-  offset: number = 0,
+  cursor: string | null = null,
   limit: number = 1000,
 ) => {
-  return useQuery<Food[]>({
-    queryKey: ["foods", category, offset, limit],
+  return useQuery<(Food & { next_cursor: string })[]>({
+    queryKey: ["foods", category, cursor, limit],
     queryFn: async () => {
-      // Optimization: Select only needed columns to reduce payload size
-      let query = supabase
-        .from("foods")
-        .select(
-          "id,name,category,calories_per_serving,protein_g,carbs_g,fats_g,serving_size_g",
-        )
-        .eq("is_custom", false);
-
-      if (category) {
-        query = query.eq("category", category);
-      }
-
-      // No sorting on server - dramatically faster for large sets
-      const { data, error } = await query.range(offset, offset + limit - 1);
+      // Keyset pagination: list_foods seeks straight to the cursor position, so
+      // deep pages cost the same as the first and never overlap
+      const { data, error } = await supabase.rpc("list_foods", {
+        list_category: category ?? null,
+        page_limit: limit,
+        page_cursor: cursor,
+      });
 
       if (error) throw error;
-      return (data || []) as Food[];
+      return data || [];
     },
     // Aggressive caching: 10 minutes for food data (rarely changes)
     staleTime: 10 * 60 * 1000,
@@ -235,6 +284,36 @@ export const useFoodDatabase = (
   });
 };
 
+/**
+ * Search the foods catalogue via the trigram-indexed search_foods RPC
+ * Results are ranked by similarity; pass the last row's next_cursor for the next page
+ */
+export const useSearchFoodDatabase = (
+  query: string,
+  category?: string,
+  limit: number = 50,
+  cursor: string | null = null,
+) => {
+  return useQuery<(Food & { similarity: number; next_cursor: string })[]>({
+    queryKey: ["searchFoodDatabase", query, category, limit, cursor],
+    queryFn: async () => {
+      const { data, error } = await supabase.rpc("search_foods", {
+        search_query: query,
+        search_category: category ?? null,
+        result_limit: limit,
+        search_cursor: cursor,
+      });
+
+      if (error) throw error;
+      return data || [];
+    },
+    enabled: query.trim().length >= 2,
+    staleTime: 10 * 60 * 1000,
+    gcTime: 30 * 60 * 1000,
+    retry: 1,
+  });
+};
+
 export const useFavoriteFoods = (userId: string) => {
   return useQuery({
     queryKey: ["favoriteFoods", userId],
@@ -289,6 +368,36 @@ export const useRemoveFavoriteFood = () => {
     },
   });
 };
+
+/**
+ * Autocomplete against the offline food index (no network per keystroke)
+ * `results` is null until the index is available; an empty array is a
+ * local miss, so callers fall back to the network search in both cases
+ */
+export const useLocalFoodSearch = (
+  query: string,
+  category?: string,
+  limit: number = 20,
+) => {
+  const { data: index = null } = useQuery({
+    queryKey: ["localFoodIndex"],
+    queryFn: () => foodService.loadLocalFoodIndex(),
+    staleTime: 24 * 60 * 60 * 1000,
+    gcTime: Infinity,
+    retry: 1,
+  });
+
+  const results = useMemo(
+    () =>
+      index
+        ? searchFoodSearchIndex(index, query, limit, category ?? null)
+        : null,
+    [index, query, limit, category],
+  );
+
+  return { results, indexVersion: index?.version ?? null };
+};
+
 /**
  * Search foods using USDA FoodData Central API
  * Results are cached locally for 48 hours
@@ -382,6 +491,7 @@ export const useLogUSDAFood = () => {
     onSuccess: () => {
       queryClient.invalidateQueries({ queryKey: ["foodLogs"] });
       queryClient.invalidateQueries({ queryKey: ["dailyStats"] });
+      queryClient.invalidateQueries({ queryKey: ["nutritionSummary"] });
     },
   });
 };
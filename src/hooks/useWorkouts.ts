@@ -64,6 +64,7 @@ export const useAddWorkoutLog = () => {
     onSuccess: () => {
       queryClient.invalidateQueries({ queryKey: ["workoutLogs"] });
       queryClient.invalidateQueries({ queryKey: ["dailyStats"] });
+      queryClient.invalidateQueries({ queryKey: ["nutritionSummary"] });
     },
   });
 };
@@ -83,6 +84,7 @@ export const useDeleteWorkoutLog = () => {
     onSuccess: () => {
       queryClient.invalidateQueries({ queryKey: ["workoutLogs"] });
       queryClient.invalidateQueries({ queryKey: ["dailyStats"] });
+      queryClient.invalidateQueries({ queryKey: ["nutritionSummary"] });
     },
   });
 };
@@ -156,6 +158,7 @@ export const useAddStrengthWorkout = () => {
     onSuccess: () => {
       queryClient.invalidateQueries({ queryKey: ["workoutLogs"] });
       queryClient.invalidateQueries({ queryKey: ["dailyStats"] });
+      queryClient.invalidateQueries({ queryKey: ["nutritionSummary"] });
       queryClient.invalidateQueries({ queryKey: ["weeklyWorkoutSummary"] });
     },
   });
@@ -193,6 +196,7 @@ export const useAddCardioWorkout = () => {
     onSuccess: () => {
       queryClient.invalidateQueries({ queryKey: ["workoutLogs"] });
       queryClient.invalidateQueries({ queryKey: ["dailyStats"] });
+      queryClient.invalidateQueries({ queryKey: ["nutritionSummary"] });
       queryClient.invalidateQueries({ queryKey: ["weeklyWorkoutSummary"] });
     },
   });
@@ -228,6 +232,7 @@ export const useAddYogaWorkout = () => {
     onSuccess: () => {
       queryClient.invalidateQueries({ queryKey: ["workoutLogs"] });
       queryClient.invalidateQueries({ queryKey: ["dailyStats"] });
+      queryClient.invalidateQueries({ queryKey: ["nutritionSummary"] });
       queryClient.invalidateQueries({ queryKey: ["weeklyWorkoutSummary"] });
     },
   });
@@ -267,6 +272,7 @@ export const useAddHIITWorkout = () => {
     onSuccess: () => {
       queryClient.invalidateQueries({ queryKey: ["workoutLogs"] });
       queryClient.invalidateQueries({ queryKey: ["dailyStats"] });
+      queryClient.invalidateQueries({ queryKey: ["nutritionSummary"] });
       queryClient.invalidateQueries({ queryKey: ["weeklyWorkoutSummary"] });
     },
   });
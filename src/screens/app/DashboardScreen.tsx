@@ -9,7 +9,11 @@ import {
 import { ExtremeGoalWarning } from "@components/modals/ExtremeGoalWarning";
 import { COLORS, MEAL_TYPES } from "@constants/index";
 import { useAuth } from "@context/AuthContext";
-import { useDailyFoodLogs, useUpdateUserGoal } from "@hooks/useNutrition";
+import {
+  useDailyFoodLogs,
+  useDailyNutritionSummary,
+  useUpdateUserGoal,
+} from "@hooks/useNutrition";
 import { useDailyWorkoutLogs } from "@hooks/useWorkouts";
 import { useNavigation } from "@react-navigation/native";
 import { formatDate } from "@utils/dateUtils";
@@ -94,23 +98,18 @@ export const DashboardScreen: React.FC<DashboardScreenProps> = () => {
   const { data: workoutLogs = [], isLoading: workoutLoading } =
     useDailyWorkoutLogs(user?.id || "", date);
 
+  // Today's totals come from the trigger-maintained rollup row
+  const { data: summary, isLoading: summaryLoading } =
+    useDailyNutritionSummary(user?.id || "", date);
+
   const updateGoalMutation = useUpdateUserGoal();
 
   const calorieTarget = currentCalories;
-  const totalCalories = foodLogs.reduce(
-    (sum, log) => sum + (log.calories || 0),
-    0,
-  );
-  const totalProtein = foodLogs.reduce(
-    (sum, log) => sum + (log.protein_g || 0),
-    0,
-  );
-  const totalCarbs = foodLogs.reduce((sum, log) => sum + (log.carbs_g || 0), 0);
-  const totalFats = foodLogs.reduce((sum, log) => sum + (log.fats_g || 0), 0);
-  const totalCaloriesBurned = workoutLogs.reduce(
-    (sum, log) => sum + (log.calories_burned || 0),
-    0,
-  );
+  const totalCalories = summary?.calories_consumed || 0;
+  const totalProtein = Number(summary?.protein_g || 0);
+  const totalCarbs = Number(summary?.carbs_g || 0);
+  const totalFats = Number(summary?.fats_g || 0);
+  const totalCaloriesBurned = summary?.calories_burned || 0;
 
   const caloriePercentage = (totalCalories / calorieTarget) * 100;
   const remainingCalories = calorieTarget - totalCalories;
@@ -194,7 +193,7 @@ export const DashboardScreen: React.FC<DashboardScreenProps> = () => {
     setTimeout(() => setRefreshing(false), 1000);
   }, []);
 
-  if (foodLoading || workoutLoading) {
+  if (foodLoading || workoutLoading || summaryLoading) {
     return <LoadingSpinner />;
   }
 
@@ -481,10 +480,7 @@ export const DashboardScreen: React.FC<DashboardScreenProps> = () => {
             <>
               <StatBox
                 label="Total Duration"
-                value={workoutLogs.reduce(
-                  (sum, w) => sum + (w.duration_minutes || 0),
-                  0,
-                )}
+                value={summary?.workout_minutes || 0}
                 unit="min"
               />
               <StatBox
@@ -7,7 +7,9 @@ import {
     useDeleteFoodLog,
     useFoodDatabase,
     useGetFoodDetails,
+    useLocalFoodSearch,
     useLogUSDAFood,
+    useSearchFoodDatabase,
     useSearchFoods,
 } from "@hooks/useNutrition";
 import { useNavigation } from "@react-navigation/native";
@@ -25,9 +27,22 @@ import {
     View,
 } from "react-native";
 import { SafeAreaView } from "react-native-safe-area-context";
+import type { Food } from "../../types";
 
 interface FoodLoggingScreenProps {}
 
+// Fields shared by catalogue rows, search_foods rows and offline index entries
+type FoodOption = Pick<
+  Food,
+  | "id"
+  | "name"
+  | "calories_per_serving"
+  | "protein_g"
+  | "carbs_g"
+  | "fats_g"
+  | "serving_size_g"
+>;
+
 type FoodSource = "database" | "usda" | "manual";
 
 export const FoodLoggingScreen: React.FC<FoodLoggingScreenProps> = () => {
@@ -44,7 +59,8 @@ export const FoodLoggingScreen: React.FC<FoodLoggingScreenProps> = () => {
   const [usedaSearch, setUSDASearch] = useState("");
   const [selectedFdcId, setSelectedFdcId] = useState<string | null>(null);
   const [categorySearch, setCategorySearch] = useState("");
-  const [foodOffset, setFoodOffset] = useState(0);
+  const [foodCursor, setFoodCursor] = useState<string | null>(null);
+  const [foodPage, setFoodPage] = useState(0);
 
   // Manual Entry Form State
   const [manualFoodName, setManualFoodName] = useState("");
@@ -82,9 +98,23 @@ export const FoodLoggingScreen: React.FC<FoodLoggingScreenProps> = () => {
   );
   const { data: foods = [], isLoading: foodsLoading } = useFoodDatabase(
     selectedCategory,
-    foodOffset,
+    foodCursor,
     FOODS_PER_PAGE,
   );
+  // Name search: offline index first (no request per keystroke), the
+  // search_foods RPC only when the index is unavailable or has no match
+  const isSearchingFoods = categorySearch.trim().length > 0;
+  const { results: localSearchResults } = useLocalFoodSearch(
+    categorySearch,
+    selectedCategory,
+    50,
+  );
+  const hasLocalHit = !!localSearchResults && localSearchResults.length > 0;
+  const { data: remoteSearchResults = [], isLoading: remoteSearchLoading } =
+    useSearchFoodDatabase(
+      isSearchingFoods && !hasLocalHit ? categorySearch : "",
+      selectedCategory,
+    );
   const { data: usdaResults = [], isLoading: usdaLoading } =
     useSearchFoods(usedaSearch);
   const { data: selectedFoodDetails, isLoading: detailsLoading } =
@@ -160,7 +190,7 @@ export const FoodLoggingScreen: React.FC<FoodLoggingScreenProps> = () => {
   };
 
   const handleAddFood = async (foodId: string) => {
-    const food = foods.find((f) => f.id === foodId);
+    const food = filteredFoods.find((f) => f.id === foodId);
     if (!food || !user || !quantity) return;
 
     setLoading(true);
@@ -279,16 +309,19 @@ export const FoodLoggingScreen: React.FC<FoodLoggingScreenProps> = () => {
     }
   };
 
-  // Filter foods based on category search
-  const filteredFoods = useMemo(() => {
-    if (!categorySearch.trim()) {
+  // Category page when not searching, otherwise local hits or the RPC fallback
+  const filteredFoods: FoodOption[] = useMemo(() => {
+    if (!isSearchingFoods) {
       return foods;
     }
-    const searchLower = categorySearch.toLowerCase();
-    return foods.filter(
-      (food) => food.name && food.name.toLowerCase().includes(searchLower),
-    );
-  }, [foods, categorySearch]);
+    return hasLocalHit ? localSearchResults! : remoteSearchResults;
+  }, [
+    foods,
+    isSearchingFoods,
+    hasLocalHit,
+    localSearchResults,
+    remoteSearchResults,
+  ]);
 
   // Calculate total nutrition for display
   const totalNutrition = useMemo(() => {
@@ -700,7 +733,8 @@ export const FoodLoggingScreen: React.FC<FoodLoggingScreenProps> = () => {
                         key={cat.id}
                         onPress={() => {
                           setSelectedCategory(cat.id);
-                          setFoodOffset(0);
+                          setFoodCursor(null);
+                          setFoodPage(0);
                         }}
                         style={{
                           paddingHorizontal: 12,
@@ -778,7 +812,7 @@ export const FoodLoggingScreen: React.FC<FoodLoggingScreenProps> = () => {
                 </View>
 
                 {/* Food List from Database */}
-                {foodsLoading ? (
+                {(isSearchingFoods ? remoteSearchLoading : foodsLoading) ? (
                   <LoadingSpinner />
                 ) : (
                   <>
@@ -791,15 +825,20 @@ export const FoodLoggingScreen: React.FC<FoodLoggingScreenProps> = () => {
                         marginTop: 12,
                       }}
                     >
-                      Foods ({foodOffset + filteredFoods.length})
+                      Foods (
+                      {isSearchingFoods
+                        ? filteredFoods.length
+                        : foodPage * FOODS_PER_PAGE + filteredFoods.length}
+                      )
                     </Text>
 
                     {/* Load More Button - Top */}
-                    {foods.length >= FOODS_PER_PAGE && (
+                    {!isSearchingFoods && foods.length >= FOODS_PER_PAGE && (
                       <TouchableOpacity
-                        onPress={() =>
-                          setFoodOffset(foodOffset + FOODS_PER_PAGE)
-                        }
+                        onPress={() => {
+                          setFoodCursor(foods[foods.length - 1].next_cursor);
+                          setFoodPage(foodPage + 1);
+                        }}
                         style={{
                           marginBottom: 16,
                           paddingVertical: 12,
@@ -830,7 +869,7 @@ export const FoodLoggingScreen: React.FC<FoodLoggingScreenProps> = () => {
                           paddingVertical: 20,
                         }}
                       >
-                        {foods.length === 0
+                        {!isSearchingFoods
                           ? "No foods in this category"
                           : "No foods match your search"}
                       </Text>
@@ -1,6 +1,7 @@
 import { Card } from "@components/common";
 import { COLORS } from "@constants/index";
 import { useAuth } from "@context/AuthContext";
+import { useNutritionSummary } from "@hooks/useNutrition";
 import { useWeightLogs } from "@hooks/useTracking";
 import { supabase } from "@services/supabase";
 import { useQuery } from "@tanstack/react-query";
@@ -34,139 +35,22 @@ export const ProgressScreen: React.FC = () => {
   const monthStartStr = formatDate(monthStart);
   const monthEndStr = formatDate(monthEnd);
 
-  // Fetch period-based data
-  const {
-    data: weekFoodLogs = [],
-    error: weekFoodLogsError,
-    isLoading: weekFoodLogsLoading,
-  } = useQuery({
-    queryKey: ["periodFoodLogs", user?.id, weekStartStr, weekEndStr],
-    queryFn: async () => {
-      console.log(
-        `[ProgressScreen] Fetching week food logs for user ${user?.id} from ${weekStartStr} to ${weekEndStr}`,
-      );
-      const { data, error } = await supabase
-        .from("food_logs")
-        .select("*")
-        .eq("user_id", user?.id || "")
-        .gte("date", weekStartStr)
-        .lte("date", weekEndStr);
-      if (error) {
-        console.error("[ProgressScreen] Error fetching week food logs:", error);
-        throw error;
-      }
-      console.log(
-        `[ProgressScreen] Week food logs returned: ${data?.length || 0} items`,
-        data,
-      );
-      return data || [];
-    },
-    enabled: !!user?.id && selectedPeriod === "week",
-    staleTime: 0, // Ensure fresh data
-    gcTime: 5 * 60 * 1000,
-  });
-
-  const {
-    data: monthFoodLogs = [],
-    error: monthFoodLogsError,
-    isLoading: monthFoodLogsLoading,
-  } = useQuery({
-    queryKey: ["periodFoodLogs", user?.id, monthStartStr, monthEndStr],
-    queryFn: async () => {
-      console.log(
-        `[ProgressScreen] Fetching month food logs for user ${user?.id} from ${monthStartStr} to ${monthEndStr}`,
-      );
-      const { data, error } = await supabase
-        .from("food_logs")
-        .select("*")
-        .eq("user_id", user?.id || "")
-        .gte("date", monthStartStr)
-        .lte("date", monthEndStr);
-      if (error) {
-        console.error(
-          "[ProgressScreen] Error fetching month food logs:",
-          error,
-        );
-        throw error;
-      }
-      console.log(
-        `[ProgressScreen] Month food logs returned: ${data?.length || 0} items`,
-        data,
-      );
-      return data || [];
-    },
-    enabled: !!user?.id && selectedPeriod === "month",
-    staleTime: 0, // Ensure fresh data
-    gcTime: 5 * 60 * 1000,
-  });
-
-  const {
-    data: weekWorkoutLogs = [],
-    error: weekWorkoutLogsError,
-    isLoading: weekWorkoutLogsLoading,
-  } = useQuery({
-    queryKey: ["periodWorkoutLogs", user?.id, weekStartStr, weekEndStr],
-    queryFn: async () => {
-      console.log(
-        `[ProgressScreen] Fetching week workout logs for user ${user?.id} from ${weekStartStr} to ${weekEndStr}`,
-      );
-      const { data, error } = await supabase
-        .from("workout_logs")
-        .select("*")
-        .eq("user_id", user?.id || "")
-        .gte("date", weekStartStr)
-        .lte("date", weekEndStr);
-      if (error) {
-        console.error(
-          "[ProgressScreen] Error fetching week workout logs:",
-          error,
-        );
-        throw error;
-      }
-      console.log(
-        `[ProgressScreen] Week workout logs returned: ${data?.length || 0} items`,
-        data,
-      );
-      return data || [];
-    },
-    enabled: !!user?.id && selectedPeriod === "week",
-    staleTime: 0,
-    gcTime: 5 * 60 * 1000,
-  });
+  // Period totals are one row summed from daily_nutrition_summary
+  const { data: weekSummary = null, error: weekSummaryError } =
+    useNutritionSummary(
+      user?.id || "",
+      weekStartStr,
+      weekEndStr,
+      selectedPeriod === "week",
+    );
 
-  const {
-    data: monthWorkoutLogs = [],
-    error: monthWorkoutLogsError,
-    isLoading: monthWorkoutLogsLoading,
-  } = useQuery({
-    queryKey: ["periodWorkoutLogs", user?.id, monthStartStr, monthEndStr],
-    queryFn: async () => {
-      console.log(
-        `[ProgressScreen] Fetching month workout logs for user ${user?.id} from ${monthStartStr} to ${monthEndStr}`,
-      );
-      const { data, error } = await supabase
-        .from("workout_logs")
-        .select("*")
-        .eq("user_id", user?.id || "")
-        .gte("date", monthStartStr)
-        .lte("date", monthEndStr);
-      if (error) {
-        console.error(
-          "[ProgressScreen] Error fetching month workout logs:",
-          error,
-        );
-        throw error;
-      }
-      console.log(
-        `[ProgressScreen] Month workout logs returned: ${data?.length || 0} items`,
-        data,
-      );
-      return data || [];
-    },
-    enabled: !!user?.id && selectedPeriod === "month",
-    staleTime: 0,
-    gcTime: 5 * 60 * 1000,
-  });
+  const { data: monthSummary = null, error: monthSummaryError } =
+    useNutritionSummary(
+      user?.id || "",
+      monthStartStr,
+      monthEndStr,
+      selectedPeriod === "month",
+    );
 
   const { data: weightLogs = [] } = useWeightLogs(user?.id || "", {
     start: selectedPeriod === "week" ? weekStartStr : monthStartStr,
@@ -216,12 +100,7 @@ export const ProgressScreen: React.FC = () => {
   });
 
   useEffect(() => {
-    const dataError =
-      weekFoodLogsError ||
-      monthFoodLogsError ||
-      weekWorkoutLogsError ||
-      monthWorkoutLogsError ||
-      goalHistoryError;
+    const dataError = weekSummaryError || monthSummaryError || goalHistoryError;
 
     if (dataError) {
       Alert.alert(
@@ -229,13 +108,7 @@ export const ProgressScreen: React.FC = () => {
         "We couldn't load your progress data. Please try again.",
       );
     }
-  }, [
-    weekFoodLogsError,
-    monthFoodLogsError,
-    weekWorkoutLogsError,
-    monthWorkoutLogsError,
-    goalHistoryError,
-  ]);
+  }, [weekSummaryError, monthSummaryError, goalHistoryError]);
 
   // Calculate maintenance calories for reference with validation
   const maintenanceCalories =
@@ -262,27 +135,15 @@ export const ProgressScreen: React.FC = () => {
       : null;
 
   // Select data based on period
-  const foodLogs = selectedPeriod === "week" ? weekFoodLogs : monthFoodLogs;
-  const workoutLogs =
-    selectedPeriod === "week" ? weekWorkoutLogs : monthWorkoutLogs;
+  const summary = selectedPeriod === "week" ? weekSummary : monthSummary;
 
   // Calculate stats for period
   const periodStats = React.useMemo(() => {
-    console.log(
-      `[ProgressScreen] Calculating stats - Food logs: ${foodLogs.length}, Workout logs: ${workoutLogs.length}, Weight logs: ${weightLogs.length}`,
-    );
-
-    const totalWorkouts = workoutLogs.length;
-    const totalCaloriesBurned = workoutLogs.reduce(
-      (sum, log) => sum + (log.calories_burned || 0),
-      0,
-    );
-    const totalCaloriesConsumed = foodLogs.reduce(
-      (sum, log) => sum + (log.calories || 0),
-      0,
-    );
+    const totalWorkouts = summary?.workout_count || 0;
+    const totalCaloriesBurned = summary?.calories_burned || 0;
+    const totalCaloriesConsumed = summary?.calories_consumed || 0;
     // Calculate using actual days with logs instead of fixed period days
-    const daysWithLogs = new Set(foodLogs.map((log) => log.date)).size;
+    const daysWithLogs = summary?.days_with_food_logs || 0;
     const avgDailyCalories = totalCaloriesConsumed / Math.max(daysWithLogs, 1);
 
     console.log(
@@ -321,7 +182,7 @@ export const ProgressScreen: React.FC = () => {
       netCalories: Math.abs(netCalories),
       startDate: selectedPeriod === "week" ? weekStartStr : monthStartStr,
     };
-  }, [selectedPeriod, workoutLogs, foodLogs, weightLogs, today]);
+  }, [selectedPeriod, summary, weightLogs, today]);
 
   return (
     <SafeAreaView
@@ -714,7 +575,7 @@ export const ProgressScreen: React.FC = () => {
             marginBottom: 24,
           }}
         >
-          {workoutLogs.length === 0 && foodLogs.length === 0 ? (
+          {!summary?.workout_count && !summary?.food_log_count ? (
             <Text
               style={{
                 fontSize: 13,
@@ -13,6 +13,12 @@
  */
 
 import AsyncStorage from "@react-native-async-storage/async-storage";
+import { Directory, File, Paths } from "expo-file-system";
+import {
+  applyFoodSearchDelta,
+  parseFoodSearchIndex,
+  type FoodSearchIndex,
+} from "../utils/foodSearchIndex";
 import { supabase } from "./supabase";
 
 /**
@@ -119,6 +125,18 @@ const CACHE_DURATION_MS = 48 * 60 * 60 * 1000; // 48 hours
 const CACHE_KEY = "usda_food_cache";
 const SEARCH_CACHE_KEY = "usda_search_cache";
 
+// Offline search index built by build-food-search-index.py
+// Provide the directory holding manifest.json via EXPO_PUBLIC_FOOD_INDEX_URL
+const FOOD_INDEX_URL = (process.env.EXPO_PUBLIC_FOOD_INDEX_URL ?? "").replace(
+  /\/$/,
+  "",
+);
+// The downloaded artifact and deltas are kept on disk (too large for
+// AsyncStorage); this key records which files make up the stored version
+const FOOD_INDEX_STATE_KEY = "food_search_index_state";
+// Past this many stored deltas the next update downloads the full artifact
+const MAX_STORED_FOOD_INDEX_DELTAS = 10;
+
 // USDA placeholder food ID for foods without local database entry
 const USDA_FOOD_PLACEHOLDER_ID = "00000000-0000-0000-0000-000000000001";
 
@@ -164,6 +182,7 @@ async function ensureUSDAPlaceholderFoodExists(): Promise<void> {
         category: "global",
         is_custom: false,
         user_id: null,
+        source: "usda",
       })
       .select();
 
@@ -197,6 +216,110 @@ ensureUSDAPlaceholderFoodExists().catch((err) => {
   console.error("[FoodService] Background placeholder init error:", err);
 });
 
+/**
+ * USDA foods imported locally by import-usda-fdc.py (foods_usda partition)
+ */
+interface LocalUSDAFood {
+  id: string;
+  fdc_id: number;
+  name: string;
+  fdc_data_type: string | null;
+  brand_owner: string | null;
+  calories_per_serving: number;
+  protein_g: number;
+  carbs_g: number;
+  fats_g: number;
+  serving_size_g: number;
+}
+
+async function searchLocalUSDAFoods(
+  query: string,
+  pageNumber: number,
+  pageSize: number,
+): Promise<USDASearchResult[]> {
+  const { data, error } = await supabase.rpc("search_usda_foods", {
+    search_query: query,
+    result_limit: pageSize,
+    result_offset: (pageNumber - 1) * pageSize,
+  });
+
+  if (error) {
+    console.warn("[FoodService] Local USDA search unavailable:", error);
+    return [];
+  }
+
+  return (data || []).map((row: any) => ({
+    fdcId: String(row.fdc_id),
+    description: row.name,
+    dataType: row.fdc_data_type,
+    brandOwner: row.brand_owner ?? undefined,
+    score: row.similarity,
+  }));
+}
+
+async function getLocalUSDAFood(
+  fdcId: string,
+): Promise<LocalUSDAFood | null> {
+  const id = Number(fdcId);
+  if (!Number.isInteger(id)) return null;
+
+  const { data, error } = await supabase
+    .from("foods")
+    .select(
+      "id, fdc_id, name, fdc_data_type, brand_owner, calories_per_serving, protein_g, carbs_g, fats_g, serving_size_g",
+    )
+    .eq("source", "usda")
+    .eq("fdc_id", id)
+    .maybeSingle();
+
+  if (error) {
+    console.warn(`[FoodService] Local USDA lookup failed for ${fdcId}:`, error);
+    return null;
+  }
+  return data;
+}
+
+/**
+ * Present a locally stored USDA food in the API's details shape, using the
+ * nutrient ids extractNutrition reads (values are per 100 g)
+ */
+function toUSDAFoodDetails(food: LocalUSDAFood): USDAFoodDetails {
+  return {
+    fdcId: String(food.fdc_id),
+    description: food.name,
+    dataType: food.fdc_data_type || "",
+    brandOwner: food.brand_owner ?? undefined,
+    servingSize: food.serving_size_g,
+    servingSizeUnit: "g",
+    foodNutrients: [
+      {
+        nutrientId: 1008,
+        nutrientName: "Energy",
+        value: food.calories_per_serving,
+        unitName: "KCAL",
+      },
+      {
+        nutrientId: 1003,
+        nutrientName: "Protein",
+        value: food.protein_g,
+        unitName: "G",
+      },
+      {
+        nutrientId: 1005,
+        nutrientName: "Carbohydrate, by difference",
+        value: food.carbs_g,
+        unitName: "G",
+      },
+      {
+        nutrientId: 1004,
+        nutrientName: "Total lipid (fat)",
+        value: food.fats_g,
+        unitName: "G",
+      },
+    ],
+  };
+}
+
 /**
  * Search foods using USDA FoodData Central API
  *
@@ -215,6 +338,16 @@ export async function searchFoods(
       throw new Error("Search query cannot be empty");
     }
 
+    // Imported FDC foods answer most searches without an API round trip
+    const localResults = await searchLocalUSDAFoods(
+      query,
+      pageNumber,
+      pageSize,
+    );
+    if (localResults.length > 0) {
+      return localResults;
+    }
+
     // Check if API key is configured
     if (!USDA_API_KEY) {
       throw new Error(
@@ -296,6 +429,11 @@ export async function getFoodDetails(
   fdcId: string,
 ): Promise<USDAFoodDetails | null> {
   try {
+    const localFood = await getLocalUSDAFood(fdcId);
+    if (localFood) {
+      return toUSDAFoodDetails(localFood);
+    }
+
     // Check if API key is configured
     if (!USDA_API_KEY) {
       throw new Error(
@@ -597,10 +735,11 @@ export async function logFoodToDatabase(entry: FoodLogEntry): Promise<any> {
     });
 
     // Build insert object
-    // Use the placeholder UUID for USDA foods (created during service initialization)
+    // Imported FDC foods have a real foods row; others use the placeholder UUID
+    const localFood = await getLocalUSDAFood(entry.fdc_id);
     const insertData = {
       user_id: entry.user_id,
-      food_id: USDA_FOOD_PLACEHOLDER_ID, // Placeholder UUID for USDA foods
+      food_id: localFood?.id ?? USDA_FOOD_PLACEHOLDER_ID,
       food_name: entry.food_name,
       fdc_id: entry.fdc_id,
       quantity: entry.quantity,
@@ -613,7 +752,9 @@ export async function logFoodToDatabase(entry: FoodLogEntry): Promise<any> {
       fats_g: entry.fats_g,
     };
 
-    console.log("[FoodService] Using placeholder food_id for USDA food");
+    if (!localFood) {
+      console.log("[FoodService] Using placeholder food_id for USDA food");
+    }
 
     // Insert food log into Supabase
     const { data, error } = await supabase
@@ -693,8 +834,171 @@ export async function clearFoodCache(): Promise<void> {
   try {
     await AsyncStorage.removeItem(CACHE_KEY);
     await AsyncStorage.removeItem(SEARCH_CACHE_KEY);
+    await clearStoredFoodIndex();
     console.log("[FoodService] Food cache cleared");
   } catch (error) {
     console.error("[FoodService] Error clearing cache:", error);
   }
 }
+
+interface FoodIndexManifest {
+  format: number;
+  version: number;
+  artifact: { file: string };
+  deltas: { from: number; to: number; file: string }[];
+}
+
+interface StoredFoodIndexState {
+  version: number;
+  artifact: string;
+  deltas: string[]; // applied in order on top of the artifact
+}
+
+let localFoodIndex: FoodSearchIndex | null = null;
+
+function foodIndexDirectory(): Directory {
+  return new Directory(Paths.document, "food-index");
+}
+
+async function fetchArrayBuffer(file: string): Promise<ArrayBuffer> {
+  const response = await fetch(`${FOOD_INDEX_URL}/${file}`);
+  if (!response.ok) {
+    throw new Error(`Failed to download ${file}: ${response.status}`);
+  }
+  return response.arrayBuffer();
+}
+
+async function readStoredBuffer(file: string): Promise<ArrayBuffer> {
+  const bytes = await new File(foodIndexDirectory(), file).bytes();
+  return bytes.buffer.slice(
+    bytes.byteOffset,
+    bytes.byteOffset + bytes.byteLength,
+  ) as ArrayBuffer;
+}
+
+function writeStoredBuffer(file: string, buffer: ArrayBuffer): void {
+  const directory = foodIndexDirectory();
+  if (!directory.exists) directory.create({ intermediates: true });
+  const target = new File(directory, file);
+  if (target.exists) target.delete();
+  target.create();
+  target.write(new Uint8Array(buffer));
+}
+
+async function saveFoodIndexState(state: StoredFoodIndexState): Promise<void> {
+  await AsyncStorage.setItem(FOOD_INDEX_STATE_KEY, JSON.stringify(state));
+
+  // Drop files the stored version no longer uses
+  const keep = new Set([state.artifact, ...state.deltas]);
+  for (const entry of foodIndexDirectory().list()) {
+    if (entry instanceof File && !keep.has(entry.name)) entry.delete();
+  }
+}
+
+async function clearStoredFoodIndex(): Promise<void> {
+  localFoodIndex = null;
+  await AsyncStorage.removeItem(FOOD_INDEX_STATE_KEY);
+  const directory = foodIndexDirectory();
+  if (directory.exists) directory.delete();
+}
+
+/**
+ * Rebuild the index saved by a previous launch (artifact + applied deltas)
+ * Returns null when nothing is stored or the files are unusable
+ */
+async function restoreStoredFoodIndex(): Promise<FoodSearchIndex | null> {
+  const raw = await AsyncStorage.getItem(FOOD_INDEX_STATE_KEY);
+  if (!raw) return null;
+
+  try {
+    const state: StoredFoodIndexState = JSON.parse(raw);
+    let index = parseFoodSearchIndex(await readStoredBuffer(state.artifact));
+    for (const file of state.deltas) {
+      index = applyFoodSearchDelta(index, await readStoredBuffer(file));
+    }
+    if (index.version !== state.version) {
+      throw new Error(`stored v${state.version}, rebuilt v${index.version}`);
+    }
+    return index;
+  } catch (error) {
+    console.warn("[FoodService] Discarding stored food index:", error);
+    await clearStoredFoodIndex().catch(() => {});
+    return null;
+  }
+}
+
+/**
+ * Load (or bring up to date) the offline food search index
+ * Starts from the copy stored on the device, applies deltas when it has a
+ * chain to the latest version, otherwise downloads the full artifact; the
+ * result is stored for the next launch. Returns null when not configured.
+ */
+export async function loadLocalFoodIndex(): Promise<FoodSearchIndex | null> {
+  if (!FOOD_INDEX_URL) return null;
+
+  try {
+    if (!localFoodIndex) {
+      localFoodIndex = await restoreStoredFoodIndex();
+    }
+
+    const response = await fetch(`${FOOD_INDEX_URL}/manifest.json`);
+    if (!response.ok) throw new Error(`manifest: ${response.status}`);
+    const manifest: FoodIndexManifest = await response.json();
+
+    if (localFoodIndex?.version === manifest.version) {
+      return localFoodIndex;
+    }
+
+    const rawState = await AsyncStorage.getItem(FOOD_INDEX_STATE_KEY);
+    const state: StoredFoodIndexState | null = rawState
+      ? JSON.parse(rawState)
+      : null;
+
+    if (localFoodIndex && state?.version === localFoodIndex.version) {
+      let index: FoodSearchIndex | null = localFoodIndex;
+      const applied: { file: string; buffer: ArrayBuffer }[] = [];
+      while (index && index.version < manifest.version) {
+        const delta = manifest.deltas.find((d) => d.from === index!.version);
+        if (!delta) {
+          index = null;
+          break;
+        }
+        const buffer = await fetchArrayBuffer(delta.file);
+        index = applyFoodSearchDelta(index, buffer);
+        applied.push({ file: delta.file, buffer });
+      }
+      if (
+        index &&
+        state.deltas.length + applied.length <= MAX_STORED_FOOD_INDEX_DELTAS
+      ) {
+        applied.forEach(({ file, buffer }) => writeStoredBuffer(file, buffer));
+        await saveFoodIndexState({
+          version: index.version,
+          artifact: state.artifact,
+          deltas: [...state.deltas, ...applied.map(({ file }) => file)],
+        });
+        console.log(
+          `[FoodService] Food index updated to v${index.version} via deltas`,
+        );
+        localFoodIndex = index;
+        return index;
+      }
+    }
+
+    const buffer = await fetchArrayBuffer(manifest.artifact.file);
+    localFoodIndex = parseFoodSearchIndex(buffer);
+    writeStoredBuffer(manifest.artifact.file, buffer);
+    await saveFoodIndexState({
+      version: localFoodIndex.version,
+      artifact: manifest.artifact.file,
+      deltas: [],
+    });
+    console.log(
+      `[FoodService] Food index v${localFoodIndex.version} loaded (${localFoodIndex.foods.length} foods)`,
+    );
+    return localFoodIndex;
+  } catch (error) {
+    console.warn("[FoodService] Offline food index unavailable:", error);
+    return localFoodIndex;
+  }
+}
@@ -79,6 +79,34 @@ export interface DailyNutrition {
   };
 }
 
+// Maintained per (user_id, date) by triggers on food_logs and workout_logs
+export interface DailyNutritionSummary {
+  user_id: string;
+  date: string;
+  calories_consumed: number;
+  protein_g: number;
+  carbs_g: number;
+  fats_g: number;
+  food_log_count: number;
+  calories_burned: number;
+  workout_minutes: number;
+  workout_count: number;
+  updated_at: string;
+}
+
+// Totals over a date range from get_nutrition_summary
+export interface NutritionPeriodSummary {
+  calories_consumed: number;
+  protein_g: number;
+  carbs_g: number;
+  fats_g: number;
+  food_log_count: number;
+  days_with_food_logs: number;
+  calories_burned: number;
+  workout_minutes: number;
+  workout_count: number;
+}
+
 // Workout Types
 export interface Workout {
   id: string;
@@ -0,0 +1,322 @@
+/**
+ * Utility Functions: Offline food search index
+ *
+ * - Decode the versioned artifact built by build-food-search-index.py
+ * - Apply delta files between versions
+ * - Word-prefix search (autocomplete) without network calls
+ */
+
+const INDEX_MAGIC = "FWSI";
+const DELTA_MAGIC = "FWSD";
+const FORMAT_VERSION = 1;
+const HEADER_BYTES = 32;
+const DELTA_HEADER_BYTES = 24;
+const RECORD_BYTES = 28;
+
+// Must match CATEGORIES / SOURCES in build-food-search-index.py
+const CATEGORIES = ["indian", "global", "homemade", "packaged"] as const;
+const SOURCES = ["ifct", "openfoodfacts", "usda", "custom"] as const;
+
+export interface LocalFood {
+  id: string;
+  key: string; // normalized name used for prefix matching
+  name: string;
+  calories_per_serving: number;
+  protein_g: number;
+  carbs_g: number;
+  fats_g: number;
+  serving_size_g: number;
+  category: string | null;
+  source: string | null;
+}
+
+export interface FoodSearchIndex {
+  version: number;
+  foods: LocalFood[]; // sorted by key, then id
+  words: WordEntry[]; // every word start of every key, sorted by suffix
+}
+
+// The key from one of its words on ("moong dal" → "moong dal", "dal"), so a
+// query matches any word of the name, not only its first
+interface WordEntry {
+  suffix: string;
+  food: LocalFood;
+  atStart: boolean;
+}
+
+/**
+ * Same normalization as normalize_food_name() in the database
+ * ([^[:alnum:]]+ → " "): any Unicode letter or digit is kept, so "café"
+ * stays "café"; the Devanagari block is kept whole for its vowel signs
+ */
+export function normalizeFoodName(name: string): string {
+  return name
+    .toLowerCase()
+    .replace(/[^\p{L}\p{N}\u0900-\u097F]+/gu, " ")
+    .trim();
+}
+
+function compareFoods(a: LocalFood, b: LocalFood): number {
+  if (a.key !== b.key) return a.key < b.key ? -1 : 1;
+  return a.id < b.id ? -1 : a.id > b.id ? 1 : 0;
+}
+
+function buildWordEntries(foods: LocalFood[]): WordEntry[] {
+  const words: WordEntry[] = [];
+  for (const food of foods) {
+    let start = 0;
+    while (start >= 0) {
+      words.push({ suffix: food.key.slice(start), food, atStart: start === 0 });
+      const space = food.key.indexOf(" ", start);
+      start = space < 0 ? -1 : space + 1;
+    }
+  }
+  words.sort((a, b) =>
+    a.suffix !== b.suffix
+      ? a.suffix < b.suffix
+        ? -1
+        : 1
+      : compareFoods(a.food, b.food),
+  );
+  return words;
+}
+
+function decodeUtf8(bytes: Uint8Array): string {
+  let out = "";
+  let i = 0;
+  while (i < bytes.length) {
+    const b0 = bytes[i++];
+    let code: number;
+    if (b0 < 0x80) {
+      code = b0;
+    } else if (b0 < 0xe0) {
+      code = ((b0 & 0x1f) << 6) | (bytes[i++] & 0x3f);
+    } else if (b0 < 0xf0) {
+      code =
+        ((b0 & 0x0f) << 12) |
+        ((bytes[i++] & 0x3f) << 6) |
+        (bytes[i++] & 0x3f);
+    } else {
+      code =
+        ((b0 & 0x07) << 18) |
+        ((bytes[i++] & 0x3f) << 12) |
+        ((bytes[i++] & 0x3f) << 6) |
+        (bytes[i++] & 0x3f);
+    }
+    out += String.fromCodePoint(code);
+  }
+  return out;
+}
+
+function formatUuid(bytes: Uint8Array): string {
+  const hex = Array.from(bytes, (b) => b.toString(16).padStart(2, "0")).join(
+    "",
+  );
+  return `${hex.slice(0, 8)}-${hex.slice(8, 12)}-${hex.slice(12, 16)}-${hex.slice(16, 20)}-${hex.slice(20)}`;
+}
+
+function readMagic(view: DataView): string {
+  return String.fromCharCode(
+    view.getUint8(0),
+    view.getUint8(1),
+    view.getUint8(2),
+    view.getUint8(3),
+  );
+}
+
+function readVarint(bytes: Uint8Array, pos: number): [number, number] {
+  let value = 0;
+  let shift = 0;
+  while (true) {
+    const byte = bytes[pos++];
+    value += (byte & 0x7f) * 2 ** shift;
+    if (byte < 0x80) return [value, pos];
+    shift += 7;
+  }
+}
+
+function decodeRecord(
+  view: DataView,
+  bytes: Uint8Array,
+  offset: number,
+  key: string,
+  name: string,
+): LocalFood {
+  return {
+    id: formatUuid(bytes.subarray(offset, offset + 16)),
+    key,
+    name,
+    calories_per_serving: view.getUint16(offset + 16, true),
+    protein_g: view.getUint16(offset + 18, true) / 10,
+    carbs_g: view.getUint16(offset + 20, true) / 10,
+    fats_g: view.getUint16(offset + 22, true) / 10,
+    serving_size_g: view.getUint16(offset + 24, true),
+    category: CATEGORIES[view.getUint8(offset + 26)] ?? null,
+    source: SOURCES[view.getUint8(offset + 27)] ?? null,
+  };
+}
+
+/**
+ * Decode a full index artifact (foods-v<N>.fwsi)
+ */
+export function parseFoodSearchIndex(buffer: ArrayBuffer): FoodSearchIndex {
+  const view = new DataView(buffer);
+  const bytes = new Uint8Array(buffer);
+  if (
+    readMagic(view) !== INDEX_MAGIC ||
+    view.getUint16(4, true) !== FORMAT_VERSION
+  ) {
+    throw new Error("Unsupported food search index");
+  }
+
+  const blockSize = view.getUint16(6, true);
+  const version = view.getUint32(8, true);
+  const count = view.getUint32(12, true);
+  const blocks = view.getUint32(16, true);
+  const dictBytes = view.getUint32(20, true);
+
+  const dictStart = HEADER_BYTES + 4 * blocks;
+  const recordsStart = dictStart + dictBytes;
+  const namesStart = recordsStart + RECORD_BYTES * count;
+  const poolStart = namesStart + 4 * (count + 1);
+
+  const foods: LocalFood[] = new Array(count);
+  let pos = dictStart;
+  let previous = new Uint8Array(0);
+  for (let i = 0; i < count; i++) {
+    let keyBytes: Uint8Array;
+    if (i % blockSize === 0) {
+      let length: number;
+      [length, pos] = readVarint(bytes, pos);
+      keyBytes = bytes.slice(pos, pos + length);
+      pos += length;
+    } else {
+      let shared: number;
+      let length: number;
+      [shared, pos] = readVarint(bytes, pos);
+      [length, pos] = readVarint(bytes, pos);
+      keyBytes = new Uint8Array(shared + length);
+      keyBytes.set(previous.subarray(0, shared));
+      keyBytes.set(bytes.subarray(pos, pos + length), shared);
+      pos += length;
+    }
+    previous = keyBytes;
+
+    const nameStart = view.getUint32(namesStart + 4 * i, true);
+    const nameEnd = view.getUint32(namesStart + 4 * (i + 1), true);
+    foods[i] = decodeRecord(
+      view,
+      bytes,
+      recordsStart + RECORD_BYTES * i,
+      decodeUtf8(keyBytes),
+      decodeUtf8(bytes.subarray(poolStart + nameStart, poolStart + nameEnd)),
+    );
+  }
+
+  // File order is UTF-8 byte order; re-sort so searches use JS string order
+  foods.sort(compareFoods);
+  return { version, foods, words: buildWordEntries(foods) };
+}
+
+/**
+ * Apply a delta (foods-v<A>-v<B>.fwsd) to an index at version A
+ */
+export function applyFoodSearchDelta(
+  index: FoodSearchIndex,
+  buffer: ArrayBuffer,
+): FoodSearchIndex {
+  const view = new DataView(buffer);
+  const bytes = new Uint8Array(buffer);
+  if (
+    readMagic(view) !== DELTA_MAGIC ||
+    view.getUint16(4, true) !== FORMAT_VERSION
+  ) {
+    throw new Error("Unsupported food search delta");
+  }
+
+  const fromVersion = view.getUint32(8, true);
+  const toVersion = view.getUint32(12, true);
+  const removedCount = view.getUint32(16, true);
+  const upsertCount = view.getUint32(20, true);
+  if (fromVersion !== index.version) {
+    throw new Error(
+      `Delta v${fromVersion}→v${toVersion} does not apply to v${index.version}`,
+    );
+  }
+
+  const dropped = new Set<string>();
+  let pos = DELTA_HEADER_BYTES;
+  for (let i = 0; i < removedCount; i++, pos += 16) {
+    dropped.add(formatUuid(bytes.subarray(pos, pos + 16)));
+  }
+
+  const upserts: LocalFood[] = [];
+  for (let i = 0; i < upsertCount; i++) {
+    let keyLength: number;
+    let nameLength: number;
+    [keyLength, pos] = readVarint(bytes, pos);
+    const key = decodeUtf8(bytes.subarray(pos, pos + keyLength));
+    pos += keyLength;
+    [nameLength, pos] = readVarint(bytes, pos);
+    const name = decodeUtf8(bytes.subarray(pos, pos + nameLength));
+    pos += nameLength;
+    const food = decodeRecord(view, bytes, pos, key, name);
+    pos += RECORD_BYTES;
+    dropped.add(food.id);
+    upserts.push(food);
+  }
+
+  const foods = index.foods
+    .filter((food) => !dropped.has(food.id))
+    .concat(upserts);
+  foods.sort(compareFoods);
+  return { version: toVersion, foods, words: buildWordEntries(foods) };
+}
+
+/**
+ * Foods with a word of the normalized name starting with the query
+ * ("dal" finds "moong dal"); names starting with it come first, then name order
+ * Pass a category to only return foods from it
+ */
+export function searchFoodSearchIndex(
+  index: FoodSearchIndex,
+  query: string,
+  limit = 20,
+  category: string | null = null,
+): LocalFood[] {
+  const prefix = normalizeFoodName(query);
+  if (!prefix) return [];
+
+  // Lower bound: first suffix >= prefix
+  const { words } = index;
+  let lo = 0;
+  let hi = words.length;
+  while (lo < hi) {
+    const mid = (lo + hi) >>> 1;
+    if (words[mid].suffix < prefix) lo = mid + 1;
+    else hi = mid;
+  }
+
+  // Food id → whether the name itself starts with the query
+  const matches = new Map<string, boolean>();
+  const foods = new Map<string, LocalFood>();
+  let startCount = 0;
+  for (let i = lo; i < words.length && startCount < limit; i++) {
+    const entry = words[i];
+    if (!entry.suffix.startsWith(prefix)) break;
+    if (category && entry.food.category !== category) continue;
+    if (entry.atStart) startCount++;
+    if (!matches.get(entry.food.id)) {
+      matches.set(entry.food.id, entry.atStart);
+      foods.set(entry.food.id, entry.food);
+    }
+  }
+
+  return Array.from(foods.values())
+    .sort(
+      (a, b) =>
+        Number(matches.get(b.id)) - Number(matches.get(a.id)) ||
+        compareFoods(a, b),
+    )
+    .slice(0, limit);
+}
@@ -0,0 +1,80 @@
+-- Migration: Trigram-indexed food search
+-- Date: 2026-01-22
+-- Purpose: Replace leading-wildcard ILIKE scans on foods.name with a pg_trgm
+--          GIN index on a normalized name column and a ranked search RPC
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+-- Normalize food names for matching: lowercase, punctuation collapsed to single spaces
+-- Must stay IMMUTABLE so it can back a generated column and index expressions
+CREATE OR REPLACE FUNCTION normalize_food_name(raw_name TEXT)
+  RETURNS TEXT AS $$
+  SELECT btrim(regexp_replace(lower(COALESCE(raw_name, '')), '[^[:alnum:]]+', ' ', 'g'));
+$$ LANGUAGE SQL IMMUTABLE PARALLEL SAFE;
+
+-- Stored so the trigram index and ranking never recompute it per row
+-- Note: this rewrites the foods table once (~3.7M rows), run outside peak hours
+ALTER TABLE foods
+  ADD COLUMN IF NOT EXISTS normalized_name TEXT
+  GENERATED ALWAYS AS (normalize_food_name(name)) STORED;
+
+-- Serves LIKE '%term%', similarity (%) and word similarity (<%) lookups
+CREATE INDEX IF NOT EXISTS idx_foods_normalized_name_trgm
+  ON foods USING GIN (normalized_name gin_trgm_ops);
+
+-- Ranked food search with opaque keyset cursors
+-- Pass the next_cursor of the last row returned to fetch the following page
+CREATE OR REPLACE FUNCTION search_foods(
+  search_query TEXT,
+  search_category TEXT DEFAULT NULL,
+  result_limit INTEGER DEFAULT 50,
+  search_cursor TEXT DEFAULT NULL
+)
+  RETURNS TABLE (
+    id UUID,
+    name VARCHAR,
+    category VARCHAR,
+    calories_per_serving INTEGER,
+    protein_g DECIMAL,
+    carbs_g DECIMAL,
+    fats_g DECIMAL,
+    serving_size_g DECIMAL,
+    similarity REAL,
+    next_cursor TEXT
+  ) AS $$
+  WITH params AS (
+    SELECT
+      normalize_food_name(search_query) AS q,
+      split_part(convert_from(decode(NULLIF(search_cursor, ''), 'base64'), 'UTF8'), '|', 1)::REAL AS after_rank,
+      NULLIF(split_part(convert_from(decode(NULLIF(search_cursor, ''), 'base64'), 'UTF8'), '|', 2), '')::UUID AS after_id
+  ),
+  ranked AS (
+    SELECT
+      f.*,
+      ((word_similarity(p.q, f.normalized_name) + similarity(p.q, f.normalized_name)) / 2)::REAL AS rank
+    FROM foods f, params p
+    WHERE p.q <> ''
+      AND (f.normalized_name LIKE '%' || p.q || '%' OR p.q <% f.normalized_name)
+      AND (search_category IS NULL OR f.category = search_category)
+  )
+  SELECT
+    r.id,
+    r.name,
+    r.category,
+    r.calories_per_serving,
+    r.protein_g,
+    r.carbs_g,
+    r.fats_g,
+    r.serving_size_g,
+    r.rank AS similarity,
+    encode(convert_to(r.rank::TEXT || '|' || r.id::TEXT, 'UTF8'), 'base64') AS next_cursor
+  FROM ranked r, params p
+  WHERE p.after_rank IS NULL
+     OR r.rank < p.after_rank
+     OR (r.rank = p.after_rank AND r.id > p.after_id)
+  ORDER BY r.rank DESC, r.id ASC
+  LIMIT LEAST(GREATEST(COALESCE(result_limit, 50), 1), 500);
+$$ LANGUAGE SQL STABLE;
+
+-- Refresh planner statistics for the new column
+ANALYZE foods;
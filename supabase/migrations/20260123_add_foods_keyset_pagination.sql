@@ -0,0 +1,66 @@
+-- Migration: Keyset (cursor) pagination for the foods catalogue
+-- Date: 2026-01-23
+-- Purpose: Replace OFFSET paging (.range) with a stable (category, normalized_name, id)
+--          ordering so deep pages cost the same as the first and never overlap
+-- Requires: 20260122_add_foods_trigram_search.sql (normalized_name column)
+
+-- Composite index matching the public catalogue ordering
+CREATE INDEX IF NOT EXISTS idx_foods_public_category_name_id
+  ON foods (category, normalized_name, id)
+  WHERE is_custom = FALSE;
+
+-- Page through public foods in (category, normalized_name, id) order
+-- Pass the next_cursor of the last row returned to fetch the following page
+--
+-- The WHERE clause is assembled per call so that only the predicates in use
+-- are present: a cursor page gets a bare (category, normalized_name, id) > (...)
+-- row comparison, which is the Index Cond of idx_foods_public_category_name_id,
+-- so every page starts at the cursor instead of re-reading the category from
+-- its first row. EXECUTE plans each call with its actual values.
+CREATE OR REPLACE FUNCTION list_foods(
+  list_category TEXT DEFAULT NULL,
+  page_limit INTEGER DEFAULT 100,
+  page_cursor TEXT DEFAULT NULL
+)
+  RETURNS TABLE (
+    id UUID,
+    name VARCHAR,
+    category VARCHAR,
+    calories_per_serving INTEGER,
+    protein_g DECIMAL,
+    carbs_g DECIMAL,
+    fats_g DECIMAL,
+    serving_size_g DECIMAL,
+    next_cursor TEXT
+  ) AS $$
+  DECLARE
+    decoded TEXT := convert_from(decode(NULLIF(page_cursor, ''), 'base64'), 'UTF8');
+    after_id UUID := NULLIF(split_part(decoded, '|', 3), '')::UUID;
+  BEGIN
+    RETURN QUERY EXECUTE
+      $q$
+      SELECT
+        f.id,
+        f.name,
+        f.category,
+        f.calories_per_serving,
+        f.protein_g,
+        f.carbs_g,
+        f.fats_g,
+        f.serving_size_g,
+        replace(encode(convert_to(f.category || '|' || f.normalized_name || '|' || f.id::TEXT, 'UTF8'), 'base64'), E'\n', '')
+      FROM foods f
+      WHERE f.is_custom = FALSE
+      $q$
+      || CASE WHEN list_category IS NOT NULL THEN ' AND f.category = $1' ELSE '' END
+      || CASE WHEN after_id IS NOT NULL
+           THEN ' AND (f.category, f.normalized_name, f.id) > ($2, $3, $4)' ELSE '' END
+      || ' ORDER BY f.category, f.normalized_name, f.id LIMIT $5'
+    USING
+      list_category,
+      split_part(decoded, '|', 1),
+      split_part(decoded, '|', 2),
+      after_id,
+      LEAST(GREATEST(COALESCE(page_limit, 100), 1), 1000);
+  END;
+$$ LANGUAGE plpgsql STABLE;
@@ -0,0 +1,123 @@
+-- Migration: Maintained per-category / per-source food counts
+-- Date: 2026-01-24
+-- Purpose: Replace count=exact scans over millions of foods rows with a small
+--          food_stats table kept current by statement-level triggers
+
+-- ==================== FOOD SOURCE ====================
+
+-- Track where each food came from ('openfoodfacts', 'ifct', 'usda', 'custom')
+-- The fast default tags the existing OFF bulk without rewriting the table
+ALTER TABLE foods ADD COLUMN IF NOT EXISTS source VARCHAR(50) DEFAULT 'openfoodfacts';
+
+UPDATE foods SET source = 'custom' WHERE is_custom = TRUE;
+
+UPDATE foods SET source = 'ifct'
+WHERE id IN (SELECT foods_uuid FROM foods_indian_migration_map);
+
+UPDATE foods SET source = 'usda' WHERE id = '00000000-0000-0000-0000-000000000001';
+
+-- New rows from the app are user-created unless an importer says otherwise
+ALTER TABLE foods ALTER COLUMN source SET DEFAULT 'custom';
+ALTER TABLE foods ALTER COLUMN source SET NOT NULL;
+
+-- ==================== FOOD STATS ====================
+
+CREATE TABLE IF NOT EXISTS food_stats (
+  category VARCHAR(50) NOT NULL,
+  source VARCHAR(50) NOT NULL,
+  food_count BIGINT NOT NULL DEFAULT 0,
+  updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+  PRIMARY KEY (category, source)
+);
+
+ALTER TABLE food_stats ENABLE ROW LEVEL SECURITY;
+
+CREATE POLICY "Food stats are readable by everyone" ON food_stats
+  FOR SELECT USING (true);
+
+-- Apply a batch of (category, source, delta) adjustments
+CREATE OR REPLACE FUNCTION apply_food_stats_delta(deltas JSONB)
+  RETURNS VOID AS $$
+  INSERT INTO food_stats (category, source, food_count, updated_at)
+  SELECT d.category, d.source, d.delta, CURRENT_TIMESTAMP
+  FROM jsonb_to_recordset(deltas) AS d(category VARCHAR, source VARCHAR, delta BIGINT)
+  WHERE d.delta <> 0
+  ON CONFLICT (category, source) DO UPDATE
+    SET food_count = food_stats.food_count + EXCLUDED.food_count,
+        updated_at = CURRENT_TIMESTAMP;
+$$ LANGUAGE SQL;
+
+-- One aggregate per statement, so a 5000-row batch insert is a single upsert
+-- SECURITY DEFINER: anon importers may insert foods but cannot write food_stats directly
+CREATE OR REPLACE FUNCTION update_food_stats()
+  RETURNS TRIGGER AS $$
+  BEGIN
+    IF TG_OP = 'INSERT' THEN
+      PERFORM apply_food_stats_delta((
+        SELECT jsonb_agg(jsonb_build_object('category', category, 'source', source, 'delta', n))
+        FROM (SELECT category, source, COUNT(*) AS n FROM new_rows GROUP BY category, source) s
+      ));
+    ELSIF TG_OP = 'DELETE' THEN
+      PERFORM apply_food_stats_delta((
+        SELECT jsonb_agg(jsonb_build_object('category', category, 'source', source, 'delta', -n))
+        FROM (SELECT category, source, COUNT(*) AS n FROM old_rows GROUP BY category, source) s
+      ));
+    ELSIF TG_OP = 'UPDATE' THEN
+      PERFORM apply_food_stats_delta((
+        SELECT jsonb_agg(jsonb_build_object('category', category, 'source', source, 'delta', n))
+        FROM (
+          SELECT category, source, SUM(n) AS n FROM (
+            SELECT category, source, COUNT(*) AS n FROM new_rows GROUP BY category, source
+            UNION ALL
+            SELECT category, source, -COUNT(*) AS n FROM old_rows GROUP BY category, source
+          ) u
+          GROUP BY category, source
+        ) s
+      ));
+    END IF;
+    RETURN NULL;
+  END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public;
+
+CREATE TRIGGER foods_stats_insert
+  AFTER INSERT ON foods
+  REFERENCING NEW TABLE AS new_rows
+  FOR EACH STATEMENT EXECUTE FUNCTION update_food_stats();
+
+CREATE TRIGGER foods_stats_update
+  AFTER UPDATE ON foods
+  REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+  FOR EACH STATEMENT EXECUTE FUNCTION update_food_stats();
+
+CREATE TRIGGER foods_stats_delete
+  AFTER DELETE ON foods
+  REFERENCING OLD TABLE AS old_rows
+  FOR EACH STATEMENT EXECUTE FUNCTION update_food_stats();
+
+-- Full recount (TRUNCATE bypasses the triggers; run this after one)
+CREATE OR REPLACE FUNCTION refresh_food_stats()
+  RETURNS VOID AS $$
+  BEGIN
+    DELETE FROM food_stats;
+    INSERT INTO food_stats (category, source, food_count)
+    SELECT category, source, COUNT(*) FROM foods GROUP BY category, source;
+  END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public;
+
+REVOKE EXECUTE ON FUNCTION refresh_food_stats() FROM PUBLIC, anon, authenticated;
+
+-- Cheap count lookup for scripts and the app
+CREATE OR REPLACE FUNCTION get_food_stats()
+  RETURNS TABLE (
+    category VARCHAR,
+    source VARCHAR,
+    food_count BIGINT
+  ) AS $$
+  SELECT fs.category, fs.source, fs.food_count
+  FROM food_stats fs
+  WHERE fs.food_count > 0
+  ORDER BY fs.food_count DESC;
+$$ LANGUAGE SQL STABLE;
+
+-- Seed the counts once
+SELECT refresh_food_stats();
@@ -0,0 +1,107 @@
+-- Migration: Full-text search over English names, Hindi names and category keywords
+-- Date: 2026-01-25
+-- Purpose: Index-backed multi-word and Hindi prefix search on foods
+-- Transliterations are computed by the importers (scripts/hindi_transliteration.py)
+
+-- ==================== HINDI NAME COLUMNS ====================
+
+ALTER TABLE foods ADD COLUMN IF NOT EXISTS name_hindi VARCHAR(255);
+ALTER TABLE foods ADD COLUMN IF NOT EXISTS name_hindi_translit VARCHAR(255);
+ALTER TABLE foods_indian ADD COLUMN IF NOT EXISTS name_hindi_translit VARCHAR(255);
+
+-- Carry Hindi names across for IFCT foods already migrated into foods
+UPDATE foods f
+SET name_hindi = fi.name_hindi,
+    name_hindi_translit = fi.name_hindi_translit
+FROM foods_indian_migration_map m
+JOIN foods_indian fi ON fi.id = m.foods_indian_id
+WHERE f.id = m.foods_uuid
+  AND fi.name_hindi IS NOT NULL
+  AND fi.name_hindi <> '';
+
+-- ==================== SEARCH VECTOR ====================
+
+-- Extra words a category should answer to ("desi", "packet", ...)
+CREATE OR REPLACE FUNCTION food_category_keywords(food_category TEXT)
+  RETURNS TEXT AS $$
+  SELECT CASE food_category
+    WHEN 'indian' THEN 'indian desi'
+    WHEN 'global' THEN 'global international'
+    WHEN 'homemade' THEN 'homemade home cooked'
+    WHEN 'packaged' THEN 'packaged packet branded'
+    ELSE COALESCE(food_category, '')
+  END;
+$$ LANGUAGE SQL IMMUTABLE PARALLEL SAFE;
+
+-- English name is stemmed and weighted highest; Hindi forms are kept verbatim
+-- Note: this rewrites the foods table once, run outside peak hours
+ALTER TABLE foods
+  ADD COLUMN IF NOT EXISTS search_vector TSVECTOR
+  GENERATED ALWAYS AS (
+    setweight(to_tsvector('english', COALESCE(name, '')), 'A') ||
+    setweight(to_tsvector('simple', COALESCE(name_hindi_translit, '')), 'B') ||
+    setweight(to_tsvector('simple', COALESCE(name_hindi, '')), 'B') ||
+    setweight(to_tsvector('simple', food_category_keywords(category)), 'C')
+  ) STORED;
+
+CREATE INDEX IF NOT EXISTS idx_foods_search_vector
+  ON foods USING GIN (search_vector);
+
+-- ==================== PREFIX SEARCH RPC ====================
+
+-- Turn free text into an AND of per-word prefix matches, each word tried both
+-- stemmed (english) and verbatim (simple) so "chick bir" and "चावल" both work
+CREATE OR REPLACE FUNCTION food_prefix_tsquery(search_query TEXT)
+  RETURNS TSQUERY AS $$
+  DECLARE
+    word TEXT;
+    term TSQUERY;
+    result TSQUERY;
+  BEGIN
+    FOREACH word IN ARRAY regexp_split_to_array(lower(btrim(COALESCE(search_query, ''))), '\s+') LOOP
+      word := regexp_replace(word, '[&|!():*''\\<>,.-]', '', 'g');
+      CONTINUE WHEN word = '';
+      term := to_tsquery('simple', quote_literal(word) || ':*') ||
+              to_tsquery('english', quote_literal(word) || ':*');
+      result := CASE WHEN result IS NULL THEN term ELSE result && term END;
+    END LOOP;
+    RETURN result;
+  END;
+$$ LANGUAGE plpgsql IMMUTABLE;
+
+CREATE OR REPLACE FUNCTION search_foods_fulltext(
+  search_query TEXT,
+  search_category TEXT DEFAULT NULL,
+  result_limit INTEGER DEFAULT 50
+)
+  RETURNS TABLE (
+    id UUID,
+    name VARCHAR,
+    name_hindi VARCHAR,
+    category VARCHAR,
+    calories_per_serving INTEGER,
+    protein_g DECIMAL,
+    carbs_g DECIMAL,
+    fats_g DECIMAL,
+    serving_size_g DECIMAL,
+    rank REAL
+  ) AS $$
+  SELECT
+    f.id,
+    f.name,
+    f.name_hindi,
+    f.category,
+    f.calories_per_serving,
+    f.protein_g,
+    f.carbs_g,
+    f.fats_g,
+    f.serving_size_g,
+    ts_rank_cd(f.search_vector, q.query) AS rank
+  FROM foods f, (SELECT food_prefix_tsquery(search_query) AS query) q
+  WHERE f.search_vector @@ q.query
+    AND (search_category IS NULL OR f.category = search_category)
+  ORDER BY rank DESC, f.id ASC
+  LIMIT LEAST(GREATEST(COALESCE(result_limit, 50), 1), 500);
+$$ LANGUAGE SQL STABLE;
+
+ANALYZE foods;
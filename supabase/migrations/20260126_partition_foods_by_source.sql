@@ -0,0 +1,318 @@
+-- Migration: List-partition foods by source, with the OFF partition sub-partitioned by category
+-- Date: 2026-01-26
+-- Purpose: Let category filters prune the 3.7M Open Food Facts rows down to one
+--          partition, and make reloading OFF a TRUNCATE instead of a mass DELETE
+-- Requires: 20260122 (normalized_name), 20260123 (keyset index), 20260124 (source,
+--           food_stats), 20260125 (search_vector)
+--
+-- Layout:
+--   foods                            PARTITION BY LIST (source)
+--     foods_openfoodfacts            'openfoodfacts', PARTITION BY LIST (category)
+--       foods_openfoodfacts_indian   'indian'
+--       foods_openfoodfacts_global   'global'
+--       foods_openfoodfacts_packaged 'packaged'
+--       foods_openfoodfacts_other    DEFAULT
+--     foods_ifct                     'ifct'
+--     foods_usda                     'usda'
+--     foods_custom                   DEFAULT (user-created and anything else)
+--
+-- A partitioned table's primary key must include the partition keys, so foods.id
+-- can no longer be the target of a FOREIGN KEY. The food_logs / favorite_foods /
+-- foods_indian_migration_map references are enforced by triggers below instead.
+
+-- ==================== PARTITIONED TABLE ====================
+
+CREATE TABLE foods_partitioned (
+  id UUID NOT NULL DEFAULT uuid_generate_v4(),
+  name VARCHAR(255) NOT NULL,
+  calories_per_serving INTEGER NOT NULL CHECK (calories_per_serving >= 0),
+  protein_g DECIMAL(6, 2) NOT NULL CHECK (protein_g >= 0),
+  carbs_g DECIMAL(6, 2) NOT NULL CHECK (carbs_g >= 0),
+  fats_g DECIMAL(6, 2) NOT NULL CHECK (fats_g >= 0),
+  serving_size_g DECIMAL(6, 2) NOT NULL CHECK (serving_size_g > 0),
+  category VARCHAR(50) NOT NULL CHECK (category IN ('indian', 'global', 'homemade', 'packaged')),
+  is_custom BOOLEAN DEFAULT FALSE,
+  user_id UUID REFERENCES auth.users(id) ON DELETE CASCADE,
+  created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+  updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+  normalized_name TEXT GENERATED ALWAYS AS (normalize_food_name(name)) STORED,
+  source VARCHAR(50) NOT NULL DEFAULT 'custom',
+  name_hindi VARCHAR(255),
+  name_hindi_translit VARCHAR(255),
+  search_vector TSVECTOR GENERATED ALWAYS AS (
+    setweight(to_tsvector('english', COALESCE(name, '')), 'A') ||
+    setweight(to_tsvector('simple', COALESCE(name_hindi_translit, '')), 'B') ||
+    setweight(to_tsvector('simple', COALESCE(name_hindi, '')), 'B') ||
+    setweight(to_tsvector('simple', food_category_keywords(category)), 'C')
+  ) STORED,
+  PRIMARY KEY (id, source, category)
+) PARTITION BY LIST (source);
+
+CREATE TABLE foods_openfoodfacts PARTITION OF foods_partitioned
+  FOR VALUES IN ('openfoodfacts') PARTITION BY LIST (category);
+CREATE TABLE foods_openfoodfacts_indian PARTITION OF foods_openfoodfacts FOR VALUES IN ('indian');
+CREATE TABLE foods_openfoodfacts_global PARTITION OF foods_openfoodfacts FOR VALUES IN ('global');
+CREATE TABLE foods_openfoodfacts_packaged PARTITION OF foods_openfoodfacts FOR VALUES IN ('packaged');
+CREATE TABLE foods_openfoodfacts_other PARTITION OF foods_openfoodfacts DEFAULT;
+
+CREATE TABLE foods_ifct PARTITION OF foods_partitioned FOR VALUES IN ('ifct');
+CREATE TABLE foods_usda PARTITION OF foods_partitioned FOR VALUES IN ('usda');
+CREATE TABLE foods_custom PARTITION OF foods_partitioned DEFAULT;
+
+-- ==================== COPY DATA ====================
+
+INSERT INTO foods_partitioned (
+  id, name, calories_per_serving, protein_g, carbs_g, fats_g, serving_size_g,
+  category, is_custom, user_id, created_at, updated_at, source, name_hindi, name_hindi_translit
+)
+SELECT
+  id, name, calories_per_serving, protein_g, carbs_g, fats_g, serving_size_g,
+  category, is_custom, user_id, created_at, updated_at, source, name_hindi, name_hindi_translit
+FROM foods;
+
+-- ==================== SWAP ====================
+
+ALTER TABLE food_logs DROP CONSTRAINT IF EXISTS food_logs_food_id_fkey;
+ALTER TABLE favorite_foods DROP CONSTRAINT IF EXISTS favorite_foods_food_id_fkey;
+ALTER TABLE foods_indian_migration_map DROP CONSTRAINT IF EXISTS foods_indian_migration_map_foods_uuid_fkey;
+
+ALTER TABLE foods RENAME TO foods_unpartitioned;
+ALTER TABLE foods_partitioned RENAME TO foods;
+
+-- Index names are schema-global, so the old table's go first
+DROP TABLE foods_unpartitioned;
+
+-- ==================== INDEXES ====================
+-- Created on the parent, cascaded to every partition
+
+CREATE INDEX idx_foods_user_id ON foods(user_id);
+CREATE INDEX idx_foods_category ON foods(category);
+CREATE INDEX idx_foods_is_custom ON foods(is_custom);
+CREATE INDEX idx_foods_normalized_name_trgm ON foods USING GIN (normalized_name gin_trgm_ops);
+CREATE INDEX idx_foods_public_category_name_id ON foods (category, normalized_name, id) WHERE is_custom = FALSE;
+CREATE INDEX idx_foods_search_vector ON foods USING GIN (search_vector);
+
+-- Needed by the reference check on foods deletes
+CREATE INDEX IF NOT EXISTS idx_food_logs_food_id ON food_logs(food_id);
+CREATE INDEX IF NOT EXISTS idx_favorite_foods_food_id ON favorite_foods(food_id);
+
+-- ==================== RLS ====================
+
+ALTER TABLE foods ENABLE ROW LEVEL SECURITY;
+
+CREATE POLICY "Public foods are readable, custom foods only by owner" ON foods
+  FOR SELECT USING (
+    is_custom = FALSE OR auth.uid() = user_id
+  );
+
+CREATE POLICY "Users can create custom foods" ON foods
+  FOR INSERT WITH CHECK (auth.uid() = user_id AND is_custom = TRUE);
+
+CREATE POLICY "Anyone can create public foods" ON foods
+  FOR INSERT WITH CHECK (is_custom = FALSE AND user_id IS NULL);
+
+CREATE POLICY "Users can update own foods" ON foods
+  FOR UPDATE USING (auth.uid() = user_id AND is_custom = TRUE);
+
+CREATE POLICY "Users can delete own foods" ON foods
+  FOR DELETE USING (auth.uid() = user_id AND is_custom = TRUE);
+
+-- PostgREST exposes every partition as its own table, and a query naming a
+-- partition is checked against that partition's policies only (queries through
+-- foods use the ones above). So every partition has RLS; importers write straight
+-- into their source partition, anything else is read-only or owner-only.
+ALTER TABLE foods_openfoodfacts ENABLE ROW LEVEL SECURITY;
+ALTER TABLE foods_openfoodfacts_indian ENABLE ROW LEVEL SECURITY;
+ALTER TABLE foods_openfoodfacts_global ENABLE ROW LEVEL SECURITY;
+ALTER TABLE foods_openfoodfacts_packaged ENABLE ROW LEVEL SECURITY;
+ALTER TABLE foods_openfoodfacts_other ENABLE ROW LEVEL SECURITY;
+ALTER TABLE foods_ifct ENABLE ROW LEVEL SECURITY;
+ALTER TABLE foods_custom ENABLE ROW LEVEL SECURITY;
+-- No policies yet: closed to anon/authenticated until 20260128 opens it for reads
+ALTER TABLE foods_usda ENABLE ROW LEVEL SECURITY;
+
+CREATE POLICY "OFF foods are readable" ON foods_openfoodfacts
+  FOR SELECT USING (true);
+
+CREATE POLICY "Anyone can load public OFF foods" ON foods_openfoodfacts
+  FOR INSERT WITH CHECK (is_custom = FALSE AND user_id IS NULL);
+
+CREATE POLICY "IFCT foods are readable" ON foods_ifct
+  FOR SELECT USING (true);
+
+CREATE POLICY "Anyone can load public IFCT foods" ON foods_ifct
+  FOR INSERT WITH CHECK (is_custom = FALSE AND user_id IS NULL);
+
+-- OFF leaves: loads go through foods_openfoodfacts, direct access is read-only
+CREATE POLICY "OFF indian foods are readable" ON foods_openfoodfacts_indian
+  FOR SELECT USING (true);
+
+CREATE POLICY "OFF global foods are readable" ON foods_openfoodfacts_global
+  FOR SELECT USING (true);
+
+CREATE POLICY "OFF packaged foods are readable" ON foods_openfoodfacts_packaged
+  FOR SELECT USING (true);
+
+CREATE POLICY "OFF other foods are readable" ON foods_openfoodfacts_other
+  FOR SELECT USING (true);
+
+-- User-created foods: same owner-only rules as foods
+CREATE POLICY "Public custom-partition foods are readable, custom foods only by owner" ON foods_custom
+  FOR SELECT USING (
+    is_custom = FALSE OR auth.uid() = user_id
+  );
+
+CREATE POLICY "Users can create custom foods" ON foods_custom
+  FOR INSERT WITH CHECK (auth.uid() = user_id AND is_custom = TRUE);
+
+CREATE POLICY "Users can update own foods" ON foods_custom
+  FOR UPDATE USING (auth.uid() = user_id AND is_custom = TRUE);
+
+CREATE POLICY "Users can delete own foods" ON foods_custom
+  FOR DELETE USING (auth.uid() = user_id AND is_custom = TRUE);
+
+-- ==================== TRIGGERS ====================
+
+CREATE TRIGGER update_foods_timestamp BEFORE UPDATE ON foods
+  FOR EACH ROW EXECUTE FUNCTION update_timestamp();
+
+CREATE TRIGGER foods_stats_insert
+  AFTER INSERT ON foods
+  REFERENCING NEW TABLE AS new_rows
+  FOR EACH STATEMENT EXECUTE FUNCTION update_food_stats();
+
+CREATE TRIGGER foods_stats_update
+  AFTER UPDATE ON foods
+  REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+  FOR EACH STATEMENT EXECUTE FUNCTION update_food_stats();
+
+CREATE TRIGGER foods_stats_delete
+  AFTER DELETE ON foods
+  REFERENCING OLD TABLE AS old_rows
+  FOR EACH STATEMENT EXECUTE FUNCTION update_food_stats();
+
+-- Statement triggers only fire on the table named in the statement (never on
+-- its parent or its own partitions), so every partition that can be written
+-- directly gets the same stats triggers; foods_usda gets them in 20260128
+DO $$
+  DECLARE
+    part TEXT;
+  BEGIN
+    FOREACH part IN ARRAY ARRAY[
+      'foods_openfoodfacts', 'foods_openfoodfacts_indian', 'foods_openfoodfacts_global',
+      'foods_openfoodfacts_packaged', 'foods_openfoodfacts_other', 'foods_ifct', 'foods_custom'
+    ] LOOP
+      EXECUTE format(
+        'CREATE TRIGGER %1$s_stats_insert AFTER INSERT ON %1$I
+           REFERENCING NEW TABLE AS new_rows
+           FOR EACH STATEMENT EXECUTE FUNCTION update_food_stats()', part);
+      EXECUTE format(
+        'CREATE TRIGGER %1$s_stats_update AFTER UPDATE ON %1$I
+           REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+           FOR EACH STATEMENT EXECUTE FUNCTION update_food_stats()', part);
+      EXECUTE format(
+        'CREATE TRIGGER %1$s_stats_delete AFTER DELETE ON %1$I
+           REFERENCING OLD TABLE AS old_rows
+           FOR EACH STATEMENT EXECUTE FUNCTION update_food_stats()', part);
+    END LOOP;
+  END;
+$$;
+
+-- ==================== REFERENCE CHECKS ====================
+
+-- Replaces food_logs / favorite_foods REFERENCES foods(id)
+CREATE OR REPLACE FUNCTION check_food_reference()
+  RETURNS TRIGGER AS $$
+  BEGIN
+    IF NEW.food_id IS NOT NULL AND NOT EXISTS (SELECT 1 FROM foods WHERE id = NEW.food_id) THEN
+      RAISE EXCEPTION 'food_id % is not present in table "foods"', NEW.food_id
+        USING ERRCODE = 'foreign_key_violation';
+    END IF;
+    RETURN NEW;
+  END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public;
+
+CREATE TRIGGER food_logs_check_food_id
+  BEFORE INSERT OR UPDATE OF food_id ON food_logs
+  FOR EACH ROW EXECUTE FUNCTION check_food_reference();
+
+CREATE TRIGGER favorite_foods_check_food_id
+  BEFORE INSERT OR UPDATE OF food_id ON favorite_foods
+  FOR EACH ROW EXECUTE FUNCTION check_food_reference();
+
+-- Replaces ON DELETE RESTRICT (food_logs) and ON DELETE CASCADE (favorites, migration map)
+CREATE OR REPLACE FUNCTION enforce_food_delete_references()
+  RETURNS TRIGGER AS $$
+  BEGIN
+    IF EXISTS (SELECT 1 FROM food_logs fl JOIN old_rows o ON o.id = fl.food_id) THEN
+      RAISE EXCEPTION 'foods are still referenced from table "food_logs"'
+        USING ERRCODE = 'foreign_key_violation';
+    END IF;
+    DELETE FROM favorite_foods ff USING old_rows o WHERE ff.food_id = o.id;
+    DELETE FROM foods_indian_migration_map m USING old_rows o WHERE m.foods_uuid = o.id;
+    RETURN NULL;
+  END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public;
+
+CREATE TRIGGER foods_delete_references
+  AFTER DELETE ON foods
+  REFERENCING OLD TABLE AS old_rows
+  FOR EACH STATEMENT EXECUTE FUNCTION enforce_food_delete_references();
+
+-- Same statement-trigger rule as food_stats: deletes addressed to a partition
+DO $$
+  DECLARE
+    part TEXT;
+  BEGIN
+    FOREACH part IN ARRAY ARRAY[
+      'foods_openfoodfacts', 'foods_openfoodfacts_indian', 'foods_openfoodfacts_global',
+      'foods_openfoodfacts_packaged', 'foods_openfoodfacts_other', 'foods_ifct', 'foods_usda',
+      'foods_custom'
+    ] LOOP
+      EXECUTE format(
+        'CREATE TRIGGER %1$s_delete_references AFTER DELETE ON %1$I
+           REFERENCING OLD TABLE AS old_rows
+           FOR EACH STATEMENT EXECUTE FUNCTION enforce_food_delete_references()', part);
+    END LOOP;
+  END;
+$$;
+
+-- PostgREST resource embedding (food_logs.select("*, foods(*)")) used the dropped
+-- foreign keys; computed relationships keep those selects working unchanged
+CREATE OR REPLACE FUNCTION foods(food_logs)
+  RETURNS SETOF foods ROWS 1 AS $$
+  SELECT * FROM foods WHERE id = $1.food_id;
+$$ LANGUAGE SQL STABLE;
+
+CREATE OR REPLACE FUNCTION foods(favorite_foods)
+  RETURNS SETOF foods ROWS 1 AS $$
+  SELECT * FROM foods WHERE id = $1.food_id;
+$$ LANGUAGE SQL STABLE;
+
+-- ==================== OFF RELOAD ====================
+
+-- Empty the OFF partition in one step before a full reload.
+-- TRUNCATE skips row triggers, so references and food_stats are handled here.
+CREATE OR REPLACE FUNCTION truncate_openfoodfacts_foods()
+  RETURNS BIGINT AS $$
+  DECLARE
+    removed BIGINT;
+  BEGIN
+    IF EXISTS (SELECT 1 FROM food_logs fl JOIN foods_openfoodfacts f ON f.id = fl.food_id) THEN
+      RAISE EXCEPTION 'Open Food Facts foods are referenced from table "food_logs"; reload with upserts instead'
+        USING ERRCODE = 'foreign_key_violation';
+    END IF;
+
+    DELETE FROM favorite_foods ff USING foods_openfoodfacts f WHERE ff.food_id = f.id;
+
+    SELECT COALESCE(SUM(food_count), 0) INTO removed FROM food_stats WHERE source = 'openfoodfacts';
+    TRUNCATE foods_openfoodfacts;
+    DELETE FROM food_stats WHERE source = 'openfoodfacts';
+    RETURN removed;
+  END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public;
+
+-- Service role only (importers must run with SUPABASE_SERVICE_ROLE_KEY to reload)
+REVOKE EXECUTE ON FUNCTION truncate_openfoodfacts_foods() FROM PUBLIC, anon, authenticated;
+
+ANALYZE foods;
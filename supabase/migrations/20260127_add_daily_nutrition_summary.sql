@@ -0,0 +1,201 @@
+-- Migration: Per-user daily nutrition rollups
+-- Date: 2026-01-27
+-- Purpose: Keep one row per (user_id, date) with consumed/burned totals so the
+--          dashboard and progress views read rollups instead of every log row
+-- Historical days are filled by backfill-daily-nutrition.py after this runs
+
+-- ==================== SUMMARY TABLE ====================
+
+CREATE TABLE IF NOT EXISTS daily_nutrition_summary (
+  user_id UUID NOT NULL REFERENCES auth.users(id) ON DELETE CASCADE,
+  date DATE NOT NULL,
+  calories_consumed INTEGER NOT NULL DEFAULT 0,
+  protein_g DECIMAL(10, 2) NOT NULL DEFAULT 0,
+  carbs_g DECIMAL(10, 2) NOT NULL DEFAULT 0,
+  fats_g DECIMAL(10, 2) NOT NULL DEFAULT 0,
+  food_log_count INTEGER NOT NULL DEFAULT 0,
+  calories_burned INTEGER NOT NULL DEFAULT 0,
+  workout_minutes INTEGER NOT NULL DEFAULT 0,
+  workout_count INTEGER NOT NULL DEFAULT 0,
+  updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+  PRIMARY KEY (user_id, date)
+);
+
+ALTER TABLE daily_nutrition_summary ENABLE ROW LEVEL SECURITY;
+
+CREATE POLICY "Users can view own daily nutrition summary" ON daily_nutrition_summary
+  FOR SELECT USING (auth.uid() = user_id);
+
+-- ==================== INCREMENTAL MAINTENANCE ====================
+
+-- Add (direction = 1) or subtract (direction = -1) per-day aggregates
+-- Users removed in the same statement are skipped, so the auth.users cascade
+-- into food_logs/workout_logs cannot re-insert a summary row for them
+CREATE OR REPLACE FUNCTION apply_daily_nutrition_delta(deltas JSONB, direction INTEGER)
+  RETURNS VOID AS $$
+  BEGIN
+    INSERT INTO daily_nutrition_summary AS s (
+      user_id, date, calories_consumed, protein_g, carbs_g, fats_g, food_log_count,
+      calories_burned, workout_minutes, workout_count, updated_at
+    )
+    SELECT
+      d.user_id,
+      d.date,
+      direction * COALESCE(d.calories, 0),
+      direction * COALESCE(d.protein_g, 0),
+      direction * COALESCE(d.carbs_g, 0),
+      direction * COALESCE(d.fats_g, 0),
+      direction * COALESCE(d.food_logs, 0),
+      direction * COALESCE(d.calories_burned, 0),
+      direction * COALESCE(d.workout_minutes, 0),
+      direction * COALESCE(d.workouts, 0),
+      CURRENT_TIMESTAMP
+    FROM jsonb_to_recordset(deltas) AS d(
+      user_id UUID, date DATE, calories BIGINT, protein_g NUMERIC, carbs_g NUMERIC, fats_g NUMERIC,
+      food_logs INTEGER, calories_burned BIGINT, workout_minutes BIGINT, workouts INTEGER
+    )
+    WHERE EXISTS (SELECT 1 FROM auth.users u WHERE u.id = d.user_id)
+    ON CONFLICT (user_id, date) DO UPDATE
+      SET calories_consumed = s.calories_consumed + EXCLUDED.calories_consumed,
+          protein_g = s.protein_g + EXCLUDED.protein_g,
+          carbs_g = s.carbs_g + EXCLUDED.carbs_g,
+          fats_g = s.fats_g + EXCLUDED.fats_g,
+          food_log_count = s.food_log_count + EXCLUDED.food_log_count,
+          calories_burned = s.calories_burned + EXCLUDED.calories_burned,
+          workout_minutes = s.workout_minutes + EXCLUDED.workout_minutes,
+          workout_count = s.workout_count + EXCLUDED.workout_count,
+          updated_at = CURRENT_TIMESTAMP;
+
+    -- Days whose last log was removed disappear rather than linger as zeros
+    DELETE FROM daily_nutrition_summary s
+    USING jsonb_to_recordset(deltas) AS d(user_id UUID, date DATE)
+    WHERE s.user_id = d.user_id
+      AND s.date = d.date
+      AND s.food_log_count = 0
+      AND s.workout_count = 0;
+  END;
+$$ LANGUAGE plpgsql;
+
+-- One aggregate per (user, day) per statement; updates subtract old rows and add new ones
+-- SECURITY DEFINER: users can read their summary rows but not write them
+CREATE OR REPLACE FUNCTION update_daily_nutrition_from_food_logs()
+  RETURNS TRIGGER AS $$
+  BEGIN
+    IF TG_OP IN ('DELETE', 'UPDATE') THEN
+      PERFORM apply_daily_nutrition_delta((
+        SELECT jsonb_agg(jsonb_build_object(
+          'user_id', user_id, 'date', date, 'calories', calories, 'protein_g', protein_g,
+          'carbs_g', carbs_g, 'fats_g', fats_g, 'food_logs', n))
+        FROM (
+          SELECT user_id, date, SUM(calories) AS calories, SUM(protein_g) AS protein_g,
+                 SUM(carbs_g) AS carbs_g, SUM(fats_g) AS fats_g, COUNT(*) AS n
+          FROM old_rows GROUP BY user_id, date
+        ) s
+      ), -1);
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+      PERFORM apply_daily_nutrition_delta((
+        SELECT jsonb_agg(jsonb_build_object(
+          'user_id', user_id, 'date', date, 'calories', calories, 'protein_g', protein_g,
+          'carbs_g', carbs_g, 'fats_g', fats_g, 'food_logs', n))
+        FROM (
+          SELECT user_id, date, SUM(calories) AS calories, SUM(protein_g) AS protein_g,
+                 SUM(carbs_g) AS carbs_g, SUM(fats_g) AS fats_g, COUNT(*) AS n
+          FROM new_rows GROUP BY user_id, date
+        ) s
+      ), 1);
+    END IF;
+    RETURN NULL;
+  END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public;
+
+CREATE OR REPLACE FUNCTION update_daily_nutrition_from_workout_logs()
+  RETURNS TRIGGER AS $$
+  BEGIN
+    IF TG_OP IN ('DELETE', 'UPDATE') THEN
+      PERFORM apply_daily_nutrition_delta((
+        SELECT jsonb_agg(jsonb_build_object(
+          'user_id', user_id, 'date', date, 'calories_burned', calories_burned,
+          'workout_minutes', workout_minutes, 'workouts', n))
+        FROM (
+          SELECT user_id, date, SUM(calories_burned) AS calories_burned,
+                 SUM(duration_minutes) AS workout_minutes, COUNT(*) AS n
+          FROM old_rows GROUP BY user_id, date
+        ) s
+      ), -1);
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+      PERFORM apply_daily_nutrition_delta((
+        SELECT jsonb_agg(jsonb_build_object(
+          'user_id', user_id, 'date', date, 'calories_burned', calories_burned,
+          'workout_minutes', workout_minutes, 'workouts', n))
+        FROM (
+          SELECT user_id, date, SUM(calories_burned) AS calories_burned,
+                 SUM(duration_minutes) AS workout_minutes, COUNT(*) AS n
+          FROM new_rows GROUP BY user_id, date
+        ) s
+      ), 1);
+    END IF;
+    RETURN NULL;
+  END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public;
+
+CREATE TRIGGER food_logs_daily_nutrition_insert
+  AFTER INSERT ON food_logs
+  REFERENCING NEW TABLE AS new_rows
+  FOR EACH STATEMENT EXECUTE FUNCTION update_daily_nutrition_from_food_logs();
+
+CREATE TRIGGER food_logs_daily_nutrition_update
+  AFTER UPDATE ON food_logs
+  REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+  FOR EACH STATEMENT EXECUTE FUNCTION update_daily_nutrition_from_food_logs();
+
+CREATE TRIGGER food_logs_daily_nutrition_delete
+  AFTER DELETE ON food_logs
+  REFERENCING OLD TABLE AS old_rows
+  FOR EACH STATEMENT EXECUTE FUNCTION update_daily_nutrition_from_food_logs();
+
+CREATE TRIGGER workout_logs_daily_nutrition_insert
+  AFTER INSERT ON workout_logs
+  REFERENCING NEW TABLE AS new_rows
+  FOR EACH STATEMENT EXECUTE FUNCTION update_daily_nutrition_from_workout_logs();
+
+CREATE TRIGGER workout_logs_daily_nutrition_update
+  AFTER UPDATE ON workout_logs
+  REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+  FOR EACH STATEMENT EXECUTE FUNCTION update_daily_nutrition_from_workout_logs();
+
+CREATE TRIGGER workout_logs_daily_nutrition_delete
+  AFTER DELETE ON workout_logs
+  REFERENCING OLD TABLE AS old_rows
+  FOR EACH STATEMENT EXECUTE FUNCTION update_daily_nutrition_from_workout_logs();
+
+-- ==================== PERIOD LOOKUP RPC ====================
+
+-- Week/month totals for the signed-in user as a single row
+CREATE OR REPLACE FUNCTION get_nutrition_summary(start_date DATE, end_date DATE)
+  RETURNS TABLE (
+    calories_consumed BIGINT,
+    protein_g DECIMAL,
+    carbs_g DECIMAL,
+    fats_g DECIMAL,
+    food_log_count BIGINT,
+    days_with_food_logs BIGINT,
+    calories_burned BIGINT,
+    workout_minutes BIGINT,
+    workout_count BIGINT
+  ) AS $$
+  SELECT
+    COALESCE(SUM(s.calories_consumed), 0),
+    COALESCE(SUM(s.protein_g), 0),
+    COALESCE(SUM(s.carbs_g), 0),
+    COALESCE(SUM(s.fats_g), 0),
+    COALESCE(SUM(s.food_log_count), 0),
+    COUNT(*) FILTER (WHERE s.food_log_count > 0),
+    COALESCE(SUM(s.calories_burned), 0),
+    COALESCE(SUM(s.workout_minutes), 0),
+    COALESCE(SUM(s.workout_count), 0)
+  FROM daily_nutrition_summary s
+  WHERE s.user_id = auth.uid()
+    AND s.date BETWEEN start_date AND end_date;
+$$ LANGUAGE SQL STABLE;
@@ -0,0 +1,74 @@
+-- Migration: Local USDA FoodData Central foods
+-- Date: 2026-01-28
+-- Purpose: Store FDC bulk-download foods in the foods_usda partition, keyed by
+--          fdc_id, so USDA search and details are local indexed queries
+-- Loaded by import-usda-fdc.py
+
+-- ==================== FDC COLUMNS ====================
+
+ALTER TABLE foods ADD COLUMN IF NOT EXISTS fdc_id INTEGER;
+ALTER TABLE foods ADD COLUMN IF NOT EXISTS fdc_data_type VARCHAR(20);
+ALTER TABLE foods ADD COLUMN IF NOT EXISTS brand_owner VARCHAR(255);
+
+-- A partitioned table's unique indexes must include the partition key, so the
+-- fdc_id key lives on the USDA leaf (the importer upserts into foods_usda)
+CREATE UNIQUE INDEX IF NOT EXISTS foods_usda_fdc_id_key
+  ON foods_usda (fdc_id);
+
+-- ==================== PARTITION ACCESS ====================
+
+ALTER TABLE foods_usda ENABLE ROW LEVEL SECURITY;
+
+CREATE POLICY "USDA foods are readable" ON foods_usda
+  FOR SELECT USING (true);
+
+-- Statement triggers only fire on the table named in the statement
+CREATE TRIGGER foods_usda_stats_insert
+  AFTER INSERT ON foods_usda
+  REFERENCING NEW TABLE AS new_rows
+  FOR EACH STATEMENT EXECUTE FUNCTION update_food_stats();
+
+CREATE TRIGGER foods_usda_stats_update
+  AFTER UPDATE ON foods_usda
+  REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+  FOR EACH STATEMENT EXECUTE FUNCTION update_food_stats();
+
+CREATE TRIGGER foods_usda_stats_delete
+  AFTER DELETE ON foods_usda
+  REFERENCING OLD TABLE AS old_rows
+  FOR EACH STATEMENT EXECUTE FUNCTION update_food_stats();
+
+-- ==================== SEARCH RPC ====================
+
+-- Same result shape as the FDC /foods/search endpoint the app used to call
+CREATE OR REPLACE FUNCTION search_usda_foods(
+  search_query TEXT,
+  result_limit INTEGER DEFAULT 10,
+  result_offset INTEGER DEFAULT 0
+)
+  RETURNS TABLE (
+    fdc_id INTEGER,
+    name VARCHAR,
+    fdc_data_type VARCHAR,
+    brand_owner VARCHAR,
+    similarity REAL
+  ) AS $$
+  WITH q AS (
+    SELECT normalize_food_name(search_query) AS q
+  )
+  SELECT
+    f.fdc_id,
+    f.name,
+    f.fdc_data_type,
+    f.brand_owner,
+    ((word_similarity(q.q, f.normalized_name) + similarity(q.q, f.normalized_name)) / 2)::REAL
+  FROM foods_usda f, q
+  WHERE q.q <> ''
+    AND f.fdc_id IS NOT NULL
+    AND (f.normalized_name LIKE '%' || q.q || '%' OR q.q <% f.normalized_name)
+  ORDER BY 5 DESC, f.fdc_id ASC
+  LIMIT LEAST(GREATEST(COALESCE(result_limit, 10), 1), 200)
+  OFFSET GREATEST(COALESCE(result_offset, 0), 0);
+$$ LANGUAGE SQL STABLE;
+
+ANALYZE foods_usda;
@@ -0,0 +1,73 @@
+-- Migration: Batched merge-upsert for foods_indian
+-- Date: 2026-01-29
+-- Purpose: Let the IFCT loaders send hundreds of rows per request instead of
+--          one insert per row, re-runnable on the UNIQUE name key.
+--
+-- upsert_foods_indian(foods) takes a JSON array of foods_indian rows and
+-- upserts them in one statement. On a name conflict, values are merged
+-- rather than overwritten: a column is only replaced when the incoming value
+-- is not null (or, for text, not empty), and micronutrients are merged key by
+-- key. Returns how many rows were inserted and how many updated.
+
+-- The loaders conflict on name; make sure the unique index exists
+CREATE UNIQUE INDEX IF NOT EXISTS foods_indian_name_key ON foods_indian (name);
+
+CREATE OR REPLACE FUNCTION upsert_foods_indian(foods JSONB)
+  RETURNS TABLE (inserted BIGINT, updated BIGINT) AS $$
+  WITH incoming AS (
+    -- One row per name, the last occurrence in the batch wins
+    SELECT DISTINCT ON (r.name) r.*
+    FROM ROWS FROM (jsonb_to_recordset(foods) AS (
+      name VARCHAR(255),
+      name_hindi VARCHAR(255),
+      name_hindi_translit VARCHAR(255),
+      category VARCHAR(100),
+      description TEXT,
+      serving_size_g DECIMAL(8, 2),
+      calories DECIMAL(10, 2),
+      protein_g DECIMAL(10, 2),
+      carbs_g DECIMAL(10, 2),
+      fat_g DECIMAL(10, 2),
+      fiber_g DECIMAL(10, 2),
+      water_g DECIMAL(10, 2),
+      micronutrients JSONB,
+      source VARCHAR(50),
+      source_id VARCHAR(255)
+    )) WITH ORDINALITY AS r
+    WHERE NULLIF(BTRIM(r.name), '') IS NOT NULL
+    ORDER BY r.name, r.ordinality DESC
+  ),
+  upserted AS (
+    INSERT INTO foods_indian AS fi (
+      name, name_hindi, name_hindi_translit, category, description, serving_size_g,
+      calories, protein_g, carbs_g, fat_g, fiber_g, water_g,
+      micronutrients, source, source_id
+    )
+    SELECT
+      name, name_hindi, name_hindi_translit, COALESCE(category, 'Indian'), description,
+      COALESCE(serving_size_g, 100), calories, protein_g, carbs_g, fat_g, fiber_g, water_g,
+      COALESCE(micronutrients, '{}'::jsonb), source, source_id
+    FROM incoming
+    ON CONFLICT (name) DO UPDATE SET
+      name_hindi = COALESCE(NULLIF(EXCLUDED.name_hindi, ''), fi.name_hindi),
+      name_hindi_translit = COALESCE(NULLIF(EXCLUDED.name_hindi_translit, ''), fi.name_hindi_translit),
+      category = COALESCE(NULLIF(EXCLUDED.category, ''), fi.category),
+      description = COALESCE(NULLIF(EXCLUDED.description, ''), fi.description),
+      serving_size_g = COALESCE(EXCLUDED.serving_size_g, fi.serving_size_g),
+      calories = COALESCE(EXCLUDED.calories, fi.calories),
+      protein_g = COALESCE(EXCLUDED.protein_g, fi.protein_g),
+      carbs_g = COALESCE(EXCLUDED.carbs_g, fi.carbs_g),
+      fat_g = COALESCE(EXCLUDED.fat_g, fi.fat_g),
+      fiber_g = COALESCE(EXCLUDED.fiber_g, fi.fiber_g),
+      water_g = COALESCE(EXCLUDED.water_g, fi.water_g),
+      micronutrients = COALESCE(fi.micronutrients, '{}'::jsonb) || EXCLUDED.micronutrients,
+      source = COALESCE(NULLIF(EXCLUDED.source, ''), fi.source),
+      source_id = COALESCE(NULLIF(EXCLUDED.source_id, ''), fi.source_id)
+    RETURNING (xmax = 0) AS was_inserted
+  )
+  SELECT COUNT(*) FILTER (WHERE was_inserted), COUNT(*) FILTER (WHERE NOT was_inserted)
+  FROM upserted;
+$$ LANGUAGE SQL SECURITY DEFINER SET search_path = public;
+
+-- Service role only (loaders must run with SUPABASE_SERVICE_ROLE_KEY)
+REVOKE EXECUTE ON FUNCTION upsert_foods_indian(JSONB) FROM PUBLIC, anon, authenticated;
@@ -0,0 +1,143 @@
+-- Migration: Incremental, indexed reconciliation of foods_indian into foods
+-- Date: 2026-01-30
+-- Purpose: Replace the one-off LOWER(name) joins of 20260118 (two unindexed scans
+--          of foods per run) with a job that only looks at foods_indian rows not
+--          yet mapped and matches them on an indexed normalized-name key
+-- Requires: 20260122 (normalize_food_name, foods.normalized_name), 20260126 (foods_ifct)
+--
+-- reconcile_indian_foods():
+--   1. collects the foods_indian rows missing from foods_indian_migration_map
+--      (plus mapped rows updated since their last sync) into a temp table keyed
+--      by normalize_food_name(name)
+--   2. matches them to existing IFCT foods on foods_ifct.normalized_name (a hash
+--      join against one small partition; the 3.7M OFF rows are never read)
+--   3. inserts one foods row per still-unmatched key, maps every pending row, and
+--      refreshes the nutrition of changed rows
+-- Running it again only touches rows that arrived or changed since the last run,
+-- so the IFCT loaders call it after every load.
+
+-- ==================== KEYS ====================
+
+CREATE INDEX IF NOT EXISTS idx_foods_ifct_normalized_name ON foods_ifct (normalized_name);
+
+CREATE INDEX IF NOT EXISTS idx_foods_indian_normalized_name
+  ON foods_indian (normalize_food_name(name));
+
+-- When each mapping last copied its foods_indian values into foods
+ALTER TABLE foods_indian_migration_map
+  ADD COLUMN IF NOT EXISTS synced_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP;
+
+CREATE INDEX IF NOT EXISTS idx_foods_indian_migration_map_foods_uuid
+  ON foods_indian_migration_map (foods_uuid);
+
+-- ==================== RECONCILIATION ====================
+
+CREATE OR REPLACE FUNCTION reconcile_indian_foods()
+  RETURNS TABLE (mapped BIGINT, inserted BIGINT, refreshed BIGINT) AS $$
+  DECLARE
+    n_mapped BIGINT;
+    n_inserted BIGINT;
+    n_refreshed BIGINT;
+  BEGIN
+    -- One reconciliation at a time; a concurrent call waits and then finds nothing to do
+    PERFORM pg_advisory_xact_lock(hashtext('reconcile_indian_foods'));
+
+    CREATE TEMP TABLE pending_indian_foods ON COMMIT DROP AS
+    SELECT
+      fi.id,
+      fi.name,
+      normalize_food_name(fi.name) AS name_key,
+      m.foods_uuid,
+      FALSE AS is_new
+    FROM foods_indian fi
+    LEFT JOIN foods_indian_migration_map m ON m.foods_indian_id = fi.id
+    WHERE m.foods_indian_id IS NULL
+       OR fi.updated_at > COALESCE(m.synced_at, m.created_at);
+
+    -- Drops the empty key too: a name of only punctuation cannot be matched or searched
+    DELETE FROM pending_indian_foods WHERE name_key = '';
+
+    ANALYZE pending_indian_foods;
+
+    -- Existing IFCT foods with the same key (the oldest one if several)
+    UPDATE pending_indian_foods p
+    SET foods_uuid = f.id
+    FROM (
+      SELECT DISTINCT ON (normalized_name) id, normalized_name
+      FROM foods_ifct
+      WHERE normalized_name IN (SELECT name_key FROM pending_indian_foods WHERE foods_uuid IS NULL)
+      ORDER BY normalized_name, created_at, id
+    ) f
+    WHERE p.foods_uuid IS NULL
+      AND f.normalized_name = p.name_key;
+
+    -- One new food per remaining key, shared by every foods_indian row with that key
+    UPDATE pending_indian_foods p
+    SET foods_uuid = k.new_id, is_new = TRUE
+    FROM (
+      SELECT name_key, uuid_generate_v4() AS new_id
+      FROM pending_indian_foods
+      WHERE foods_uuid IS NULL
+      GROUP BY name_key
+    ) k
+    WHERE p.foods_uuid IS NULL
+      AND k.name_key = p.name_key;
+
+    INSERT INTO foods (
+      id, name, name_hindi, name_hindi_translit, calories_per_serving,
+      protein_g, carbs_g, fats_g, serving_size_g, category, is_custom, source
+    )
+    SELECT DISTINCT ON (p.foods_uuid)
+      p.foods_uuid,
+      fi.name,
+      NULLIF(fi.name_hindi, ''),
+      NULLIF(fi.name_hindi_translit, ''),
+      ROUND(COALESCE(fi.calories, 0))::INTEGER,
+      COALESCE(fi.protein_g, 0),
+      COALESCE(fi.carbs_g, 0),
+      COALESCE(fi.fat_g, 0),
+      COALESCE(NULLIF(fi.serving_size_g, 0), 100),
+      'indian',
+      FALSE,
+      'ifct'
+    FROM pending_indian_foods p
+    JOIN foods_indian fi ON fi.id = p.id
+    WHERE p.is_new
+    ORDER BY p.foods_uuid, p.id;
+    GET DIAGNOSTICS n_inserted = ROW_COUNT;
+
+    -- Matched rows take the latest foods_indian values (new rows were just written)
+    UPDATE foods_ifct f
+    SET name_hindi = COALESCE(NULLIF(fi.name_hindi, ''), f.name_hindi),
+        name_hindi_translit = COALESCE(NULLIF(fi.name_hindi_translit, ''), f.name_hindi_translit),
+        calories_per_serving = COALESCE(ROUND(fi.calories)::INTEGER, f.calories_per_serving),
+        protein_g = COALESCE(fi.protein_g, f.protein_g),
+        carbs_g = COALESCE(fi.carbs_g, f.carbs_g),
+        fats_g = COALESCE(fi.fat_g, f.fats_g),
+        serving_size_g = COALESCE(NULLIF(fi.serving_size_g, 0), f.serving_size_g)
+    FROM pending_indian_foods p
+    JOIN foods_indian fi ON fi.id = p.id
+    WHERE NOT p.is_new
+      AND f.id = p.foods_uuid;
+    GET DIAGNOSTICS n_refreshed = ROW_COUNT;
+
+    INSERT INTO foods_indian_migration_map (foods_indian_id, foods_uuid, food_name, synced_at)
+    SELECT id, foods_uuid, name, CURRENT_TIMESTAMP
+    FROM pending_indian_foods
+    ON CONFLICT (foods_indian_id) DO UPDATE
+      SET foods_uuid = EXCLUDED.foods_uuid,
+          food_name = EXCLUDED.food_name,
+          synced_at = EXCLUDED.synced_at;
+    GET DIAGNOSTICS n_mapped = ROW_COUNT;
+
+    DROP TABLE pending_indian_foods;
+
+    RETURN QUERY SELECT n_mapped, n_inserted, n_refreshed;
+  END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public;
+
+-- Service role only (loaders must run with SUPABASE_SERVICE_ROLE_KEY)
+REVOKE EXECUTE ON FUNCTION reconcile_indian_foods() FROM PUBLIC, anon, authenticated;
+
+-- Catch up foods_indian rows added since 20260118
+SELECT * FROM reconcile_indian_foods();
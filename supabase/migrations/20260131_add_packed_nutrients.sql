@@ -0,0 +1,364 @@
+-- Migration: Packed per-100 g nutrient arrays with a fixed nutrient-id vocabulary
+-- Date: 2026-01-31
+-- Purpose: Keep fiber, sugars, sodium, minerals and vitamins from both IFCT and
+--          Open Food Facts in a compact column, and serve "most X per kcal"
+--          rankings from an index instead of parsing JSON per row
+-- Requires: 20260126 (partitioned foods), 20260129 (upsert_foods_indian),
+--           20260130 (reconcile_indian_foods)
+--
+-- foods.nutrients / foods_indian.nutrients are REAL[] of per-100 g values where
+-- element N is nutrient_vocabulary id N (NULL when unknown, trailing NULLs
+-- omitted): 4 bytes per nutrient and no key strings per row. The ids are fixed
+-- and shared with scripts/nutrient_vocabulary.py, which the importers use to
+-- build the arrays; never renumber them, append new nutrients instead.
+--
+-- Energy is nutrient 1 (kcal per 100 g), so densities such as fiber per kcal do
+-- not depend on the serving size behind calories_per_serving.
+
+-- ==================== VOCABULARY ====================
+
+CREATE TABLE IF NOT EXISTS nutrient_vocabulary (
+  id SMALLINT PRIMARY KEY,
+  code VARCHAR(50) NOT NULL UNIQUE,
+  unit VARCHAR(10) NOT NULL
+);
+
+INSERT INTO nutrient_vocabulary (id, code, unit) VALUES
+  (1, 'energy_kcal', 'kcal'),
+  (2, 'fiber_g', 'g'),
+  (3, 'sugars_g', 'g'),
+  (4, 'saturated_fat_g', 'g'),
+  (5, 'sodium_mg', 'mg'),
+  (6, 'potassium_mg', 'mg'),
+  (7, 'calcium_mg', 'mg'),
+  (8, 'iron_mg', 'mg'),
+  (9, 'phosphorus_mg', 'mg'),
+  (10, 'vitamin_c_mg', 'mg'),
+  (11, 'vitamin_a_ug', 'ug'),
+  (12, 'water_g', 'g'),
+  (13, 'cholesterol_mg', 'mg'),
+  (14, 'magnesium_mg', 'mg'),
+  (15, 'zinc_mg', 'mg')
+ON CONFLICT (id) DO NOTHING;
+
+ALTER TABLE nutrient_vocabulary ENABLE ROW LEVEL SECURITY;
+
+CREATE POLICY "Nutrient vocabulary is readable by everyone" ON nutrient_vocabulary
+  FOR SELECT USING (true);
+
+-- ==================== COLUMNS ====================
+
+-- Nullable without a default: a catalog-only change, no rewrite of the 3.7M OFF rows
+ALTER TABLE foods ADD COLUMN IF NOT EXISTS nutrients REAL[];
+ALTER TABLE foods_indian ADD COLUMN IF NOT EXISTS nutrients REAL[];
+
+-- Amount of a nutrient per kcal, NULL without energy or the nutrient
+CREATE OR REPLACE FUNCTION nutrient_per_kcal(nutrients REAL[], nutrient_id INTEGER)
+  RETURNS REAL AS $$
+  SELECT nutrients[nutrient_id] / NULLIF(nutrients[1], 0);
+$$ LANGUAGE SQL IMMUTABLE PARALLEL SAFE;
+
+-- Drop trailing NULLs (NULL when nothing is left), the shape the loaders store
+CREATE OR REPLACE FUNCTION trim_nutrients(nutrients REAL[])
+  RETURNS REAL[] AS $$
+  SELECT nutrients[1:last_id]
+  FROM (
+    SELECT MAX(i) AS last_id
+    FROM generate_subscripts(nutrients, 1) AS i
+    WHERE nutrients[i] IS NOT NULL
+  ) t
+  WHERE last_id IS NOT NULL;
+$$ LANGUAGE SQL IMMUTABLE PARALLEL SAFE;
+
+-- Element-wise merge: values present in incoming win, the rest are kept
+CREATE OR REPLACE FUNCTION merge_nutrients(current_values REAL[], incoming REAL[])
+  RETURNS REAL[] AS $$
+  SELECT CASE
+    WHEN current_values IS NULL THEN incoming
+    WHEN incoming IS NULL THEN current_values
+    ELSE ARRAY(
+      SELECT COALESCE(incoming[i], current_values[i])
+      FROM generate_series(1, GREATEST(cardinality(current_values), cardinality(incoming))) AS i
+      ORDER BY i
+    )
+  END;
+$$ LANGUAGE SQL IMMUTABLE PARALLEL SAFE;
+
+-- ==================== DENSITY INDEXES ====================
+-- Partial, so only foods that report the nutrient are indexed; created on the
+-- parent and cascaded to every partition. Other nutrients can be ranked by
+-- foods_by_nutrient_density too, with a scan instead of an index.
+
+CREATE INDEX IF NOT EXISTS idx_foods_fiber_per_kcal
+  ON foods (nutrient_per_kcal(nutrients, 2) DESC NULLS LAST)
+  WHERE is_custom = FALSE AND nutrient_per_kcal(nutrients, 2) IS NOT NULL;
+
+CREATE INDEX IF NOT EXISTS idx_foods_calcium_per_kcal
+  ON foods (nutrient_per_kcal(nutrients, 7) DESC NULLS LAST)
+  WHERE is_custom = FALSE AND nutrient_per_kcal(nutrients, 7) IS NOT NULL;
+
+CREATE INDEX IF NOT EXISTS idx_foods_iron_per_kcal
+  ON foods (nutrient_per_kcal(nutrients, 8) DESC NULLS LAST)
+  WHERE is_custom = FALSE AND nutrient_per_kcal(nutrients, 8) IS NOT NULL;
+
+-- ==================== RANKING RPC ====================
+
+-- Public foods with the most of a nutrient per kcal ('fiber_g', 'iron_mg', ...).
+-- The nutrient id is inlined as a constant so the planner can match the
+-- expressions of the density indexes above.
+CREATE OR REPLACE FUNCTION foods_by_nutrient_density(
+  nutrient_code TEXT,
+  search_category TEXT DEFAULT NULL,
+  result_limit INTEGER DEFAULT 50
+)
+  RETURNS TABLE (
+    id UUID,
+    name VARCHAR,
+    category VARCHAR,
+    source VARCHAR,
+    amount_per_100g REAL,
+    energy_kcal_per_100g REAL,
+    amount_per_kcal REAL
+  ) AS $$
+  DECLARE
+    nid SMALLINT;
+  BEGIN
+    SELECT v.id INTO nid FROM nutrient_vocabulary v WHERE v.code = nutrient_code;
+    IF nid IS NULL THEN
+      RAISE EXCEPTION 'unknown nutrient %', nutrient_code USING ERRCODE = 'invalid_parameter_value';
+    END IF;
+
+    RETURN QUERY EXECUTE format(
+      'SELECT f.id, f.name, f.category, f.source, f.nutrients[%1$s], f.nutrients[1],
+              nutrient_per_kcal(f.nutrients, %1$s)
+       FROM foods f
+       WHERE f.is_custom = FALSE
+         AND nutrient_per_kcal(f.nutrients, %1$s) IS NOT NULL
+         AND ($1::TEXT IS NULL OR f.category = $1)
+       ORDER BY nutrient_per_kcal(f.nutrients, %1$s) DESC NULLS LAST
+       LIMIT $2',
+      nid
+    ) USING search_category, LEAST(GREATEST(COALESCE(result_limit, 50), 1), 200);
+  END;
+$$ LANGUAGE plpgsql STABLE;
+
+-- ==================== IMPORT PATH ====================
+-- The IFCT loaders send packed arrays through upsert_foods_indian, and the
+-- reconciliation copies them into foods. OFF importers write foods.nutrients
+-- directly; reload OFF to fill it for rows loaded before this migration.
+
+CREATE OR REPLACE FUNCTION upsert_foods_indian(foods JSONB)
+  RETURNS TABLE (inserted BIGINT, updated BIGINT) AS $$
+  WITH incoming AS (
+    -- One row per name, the last occurrence in the batch wins
+    SELECT DISTINCT ON (r.name) r.*
+    FROM ROWS FROM (jsonb_to_recordset(foods) AS (
+      name VARCHAR(255),
+      name_hindi VARCHAR(255),
+      name_hindi_translit VARCHAR(255),
+      category VARCHAR(100),
+      description TEXT,
+      serving_size_g DECIMAL(8, 2),
+      calories DECIMAL(10, 2),
+      protein_g DECIMAL(10, 2),
+      carbs_g DECIMAL(10, 2),
+      fat_g DECIMAL(10, 2),
+      fiber_g DECIMAL(10, 2),
+      water_g DECIMAL(10, 2),
+      micronutrients JSONB,
+      nutrients REAL[],
+      source VARCHAR(50),
+      source_id VARCHAR(255)
+    )) WITH ORDINALITY AS r
+    WHERE NULLIF(BTRIM(r.name), '') IS NOT NULL
+    ORDER BY r.name, r.ordinality DESC
+  ),
+  upserted AS (
+    INSERT INTO foods_indian AS fi (
+      name, name_hindi, name_hindi_translit, category, description, serving_size_g,
+      calories, protein_g, carbs_g, fat_g, fiber_g, water_g,
+      micronutrients, nutrients, source, source_id
+    )
+    SELECT
+      name, name_hindi, name_hindi_translit, COALESCE(category, 'Indian'), description,
+      COALESCE(serving_size_g, 100), calories, protein_g, carbs_g, fat_g, fiber_g, water_g,
+      COALESCE(micronutrients, '{}'::jsonb), nutrients, source, source_id
+    FROM incoming
+    ON CONFLICT (name) DO UPDATE SET
+      name_hindi = COALESCE(NULLIF(EXCLUDED.name_hindi, ''), fi.name_hindi),
+      name_hindi_translit = COALESCE(NULLIF(EXCLUDED.name_hindi_translit, ''), fi.name_hindi_translit),
+      category = COALESCE(NULLIF(EXCLUDED.category, ''), fi.category),
+      description = COALESCE(NULLIF(EXCLUDED.description, ''), fi.description),
+      serving_size_g = COALESCE(EXCLUDED.serving_size_g, fi.serving_size_g),
+      calories = COALESCE(EXCLUDED.calories, fi.calories),
+      protein_g = COALESCE(EXCLUDED.protein_g, fi.protein_g),
+      carbs_g = COALESCE(EXCLUDED.carbs_g, fi.carbs_g),
+      fat_g = COALESCE(EXCLUDED.fat_g, fi.fat_g),
+      fiber_g = COALESCE(EXCLUDED.fiber_g, fi.fiber_g),
+      water_g = COALESCE(EXCLUDED.water_g, fi.water_g),
+      micronutrients = COALESCE(fi.micronutrients, '{}'::jsonb) || EXCLUDED.micronutrients,
+      nutrients = merge_nutrients(fi.nutrients, EXCLUDED.nutrients),
+      source = COALESCE(NULLIF(EXCLUDED.source, ''), fi.source),
+      source_id = COALESCE(NULLIF(EXCLUDED.source_id, ''), fi.source_id)
+    RETURNING (xmax = 0) AS was_inserted
+  )
+  SELECT COUNT(*) FILTER (WHERE was_inserted), COUNT(*) FILTER (WHERE NOT was_inserted)
+  FROM upserted;
+$$ LANGUAGE SQL SECURITY DEFINER SET search_path = public;
+
+
+CREATE OR REPLACE FUNCTION reconcile_indian_foods()
+  RETURNS TABLE (mapped BIGINT, inserted BIGINT, refreshed BIGINT) AS $$
+  DECLARE
+    n_mapped BIGINT;
+    n_inserted BIGINT;
+    n_refreshed BIGINT;
+  BEGIN
+    -- One reconciliation at a time; a concurrent call waits and then finds nothing to do
+    PERFORM pg_advisory_xact_lock(hashtext('reconcile_indian_foods'));
+
+    CREATE TEMP TABLE pending_indian_foods ON COMMIT DROP AS
+    SELECT
+      fi.id,
+      fi.name,
+      normalize_food_name(fi.name) AS name_key,
+      m.foods_uuid,
+      FALSE AS is_new
+    FROM foods_indian fi
+    LEFT JOIN foods_indian_migration_map m ON m.foods_indian_id = fi.id
+    WHERE m.foods_indian_id IS NULL
+       OR fi.updated_at > COALESCE(m.synced_at, m.created_at);
+
+    -- Drops the empty key too: a name of only punctuation cannot be matched or searched
+    DELETE FROM pending_indian_foods WHERE name_key = '';
+
+    ANALYZE pending_indian_foods;
+
+    -- Existing IFCT foods with the same key (the oldest one if several)
+    UPDATE pending_indian_foods p
+    SET foods_uuid = f.id
+    FROM (
+      SELECT DISTINCT ON (normalized_name) id, normalized_name
+      FROM foods_ifct
+      WHERE normalized_name IN (SELECT name_key FROM pending_indian_foods WHERE foods_uuid IS NULL)
+      ORDER BY normalized_name, created_at, id
+    ) f
+    WHERE p.foods_uuid IS NULL
+      AND f.normalized_name = p.name_key;
+
+    -- One new food per remaining key, shared by every foods_indian row with that key
+    UPDATE pending_indian_foods p
+    SET foods_uuid = k.new_id, is_new = TRUE
+    FROM (
+      SELECT name_key, uuid_generate_v4() AS new_id
+      FROM pending_indian_foods
+      WHERE foods_uuid IS NULL
+      GROUP BY name_key
+    ) k
+    WHERE p.foods_uuid IS NULL
+      AND k.name_key = p.name_key;
+
+    INSERT INTO foods (
+      id, name, name_hindi, name_hindi_translit, calories_per_serving,
+      protein_g, carbs_g, fats_g, serving_size_g, category, is_custom, source, nutrients
+    )
+    SELECT DISTINCT ON (p.foods_uuid)
+      p.foods_uuid,
+      fi.name,
+      NULLIF(fi.name_hindi, ''),
+      NULLIF(fi.name_hindi_translit, ''),
+      ROUND(COALESCE(fi.calories, 0))::INTEGER,
+      COALESCE(fi.protein_g, 0),
+      COALESCE(fi.carbs_g, 0),
+      COALESCE(fi.fat_g, 0),
+      COALESCE(NULLIF(fi.serving_size_g, 0), 100),
+      'indian',
+      FALSE,
+      'ifct',
+      fi.nutrients
+    FROM pending_indian_foods p
+    JOIN foods_indian fi ON fi.id = p.id
+    WHERE p.is_new
+    ORDER BY p.foods_uuid, p.id;
+    GET DIAGNOSTICS n_inserted = ROW_COUNT;
+
+    -- Matched rows take the latest foods_indian values (new rows were just written)
+    UPDATE foods_ifct f
+    SET name_hindi = COALESCE(NULLIF(fi.name_hindi, ''), f.name_hindi),
+        name_hindi_translit = COALESCE(NULLIF(fi.name_hindi_translit, ''), f.name_hindi_translit),
+        calories_per_serving = COALESCE(ROUND(fi.calories)::INTEGER, f.calories_per_serving),
+        protein_g = COALESCE(fi.protein_g, f.protein_g),
+        carbs_g = COALESCE(fi.carbs_g, f.carbs_g),
+        fats_g = COALESCE(fi.fat_g, f.fats_g),
+        serving_size_g = COALESCE(NULLIF(fi.serving_size_g, 0), f.serving_size_g),
+        nutrients = merge_nutrients(f.nutrients, fi.nutrients)
+    FROM pending_indian_foods p
+    JOIN foods_indian fi ON fi.id = p.id
+    WHERE NOT p.is_new
+      AND f.id = p.foods_uuid;
+    GET DIAGNOSTICS n_refreshed = ROW_COUNT;
+
+    INSERT INTO foods_indian_migration_map (foods_indian_id, foods_uuid, food_name, synced_at)
+    SELECT id, foods_uuid, name, CURRENT_TIMESTAMP
+    FROM pending_indian_foods
+    ON CONFLICT (foods_indian_id) DO UPDATE
+      SET foods_uuid = EXCLUDED.foods_uuid,
+          food_name = EXCLUDED.food_name,
+          synced_at = EXCLUDED.synced_at;
+    GET DIAGNOSTICS n_mapped = ROW_COUNT;
+
+    DROP TABLE pending_indian_foods;
+
+    RETURN QUERY SELECT n_mapped, n_inserted, n_refreshed;
+  END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public;
+
+-- Service role only (loaders must run with SUPABASE_SERVICE_ROLE_KEY)
+REVOKE EXECUTE ON FUNCTION upsert_foods_indian(JSONB) FROM PUBLIC, anon, authenticated;
+REVOKE EXECUTE ON FUNCTION reconcile_indian_foods() FROM PUBLIC, anon, authenticated;
+
+-- ==================== BACKFILL ====================
+
+-- Mapped rows that are in sync now; the backfill fires the updated_at trigger,
+-- so they are marked synced again afterwards instead of looking edited
+CREATE TEMP TABLE backfill_in_sync AS
+SELECT m.foods_indian_id
+FROM foods_indian_migration_map m
+JOIN foods_indian fi ON fi.id = m.foods_indian_id
+WHERE fi.updated_at <= COALESCE(m.synced_at, m.created_at);
+
+-- foods_indian: energy, fiber and water columns plus the micronutrients JSON,
+-- scaled from the serving to 100 g (IFCT vitamin A is in IU, 0.3 ug each),
+-- trimmed like nutrient_vocabulary.pack so backfilled and loaded rows match
+UPDATE foods_indian fi
+SET nutrients = trim_nutrients(ARRAY(
+  SELECT (CASE v.code
+      WHEN 'energy_kcal' THEN fi.calories::REAL
+      WHEN 'fiber_g' THEN fi.fiber_g::REAL
+      WHEN 'water_g' THEN fi.water_g::REAL
+      WHEN 'vitamin_a_ug' THEN (fi.micronutrients->>'vitamin_a_iu')::REAL * 0.3
+      ELSE (fi.micronutrients->>v.code)::REAL
+    END) * 100 / COALESCE(NULLIF(fi.serving_size_g, 0), 100)::REAL
+  FROM nutrient_vocabulary v
+  ORDER BY v.id
+))
+WHERE fi.nutrients IS NULL;
+
+-- IFCT foods already reconciled into foods
+UPDATE foods_ifct f
+SET nutrients = fi.nutrients
+FROM foods_indian_migration_map m
+JOIN foods_indian fi ON fi.id = m.foods_indian_id
+WHERE f.id = m.foods_uuid
+  AND f.nutrients IS NULL;
+
+UPDATE foods_indian_migration_map m
+SET synced_at = fi.updated_at
+FROM backfill_in_sync s
+JOIN foods_indian fi ON fi.id = s.foods_indian_id
+WHERE m.foods_indian_id = s.foods_indian_id;
+
+DROP TABLE backfill_in_sync;
+
+ANALYZE foods_indian;
+ANALYZE foods_ifct;